@@ -1,14 +1,126 @@
 from __future__ import annotations
 
 import asyncio
+import contextvars
+import functools
+import heapq
+import importlib
 import inspect
-from collections.abc import Awaitable, Callable, Coroutine
+import itertools
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Hashable,
+    Sequence,
+)
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from logging import Logger
-from typing import Any, TypeVar
+from typing import Any, Generic, Literal, ParamSpec, TypedDict, TypeVar
 
 from sjpy.excptn import exc_to_str
+from sjpy.statistics import DistributionSummary, StreamingSummary
 
 T = TypeVar("T")
+R = TypeVar("R")
+K = TypeVar("K", bound=Hashable)
+P = ParamSpec("P")
+
+ExecutorKind = Literal["thread", "process"]
+
+# create_task 는 약한 참조만 남기므로, 끝날 때까지 여기서 참조를 유지한다
+_background_tasks: set[asyncio.Task[Any]] = set()
+
+
+def _spawn(coro: Coroutine[Any, Any, Any]) -> asyncio.Task[Any]:
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+def _discard_awaitable(aw: Awaitable[Any]) -> None:
+    # 실행되지 않은 코루틴은 닫아서 "never awaited" 경고를 막는다
+    if inspect.iscoroutine(aw):
+        aw.close()
+    elif isinstance(aw, asyncio.Future):
+        aw.cancel()
+
+
+class _SampleBuffer:
+    """Collects scalar samples in a list and feeds them to a `StreamingSummary`
+    in chunks; a one-element `add` per sample costs tens of microseconds."""
+
+    def __init__(self, chunk: int = 256) -> None:
+        self.chunk: int = chunk
+        self.stream: StreamingSummary = StreamingSummary()
+        self._buffer: list[float] = []
+
+    def add(self, value: float) -> None:
+        self._buffer.append(value)
+        if len(self._buffer) >= self.chunk:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._buffer:
+            self.stream.add(self._buffer)
+            self._buffer = []
+
+    def summary(self) -> DistributionSummary:
+        self.flush()
+        return self.stream.summary()
+
+
+class _KeyedLockEntry:
+    __slots__ = ("lock", "users")
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.users = 0
+
+
+class KeyedLock(Generic[K]):
+    """
+    One `asyncio.Lock` per key, created on first use and dropped once no task
+    holds or waits for it. Tasks with the same key run one at a time in
+    arrival order; different keys do not block each other.
+
+    ``async with locks(key): ...``
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[K, _KeyedLockEntry] = {}
+
+    @asynccontextmanager
+    async def __call__(self, key: K) -> AsyncIterator[None]:
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = _KeyedLockEntry()
+        entry.users += 1
+        try:
+            async with entry.lock:
+                yield
+        finally:
+            entry.users -= 1
+            if entry.users == 0:
+                del self._entries[key]
+
+    def locked(self, key: K) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry.lock.locked()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
 
 
 def task_with_callback(
@@ -54,13 +166,43 @@ def task_with_callback_guarded(
     return _run()
 
 
+def task_with_callback_keyed(
+    task: Awaitable[T],
+    callback: Callable[[T | None, Exception | None], Awaitable[None]],
+    key: K,
+    locks: KeyedLock[K],
+    stop_event: asyncio.Event,
+    logger: Logger | None = None,
+) -> Coroutine[None, None, None]:
+    """`task_with_callback_guarded` that only serializes tasks with the same key."""
+
+    async def _run() -> None:
+        try:
+            async with locks(key):
+                if stop_event.is_set():
+                    _discard_awaitable(task)
+                    await callback(
+                        None, Exception("Operation cancelled due to stop event")
+                    )
+                else:
+                    result = await task
+                    await callback(result, None)
+        # task_with_callback_guarded 처럼 어떤 예외든 callback 으로 넘긴다
+        except Exception as e:  # noqa: BLE001
+            if logger:
+                logger.error(f"Error in callback:\n{exc_to_str(e)}")
+            await callback(None, e)
+
+    return _run()
+
+
 def spawn_task_with_callback(
     task: Awaitable[T],
     callback: Callable[[T | None, Exception | None], Awaitable[None]],
     logger: Logger | None = None,
 ) -> None:
     wrapped_task = task_with_callback(task, callback, logger)
-    asyncio.create_task(wrapped_task)
+    _spawn(wrapped_task)
 
 
 def spawn_task_with_callback_guarded(
@@ -71,7 +213,21 @@ def spawn_task_with_callback_guarded(
     logger: Logger | None = None,
 ) -> None:
     wrapped_task = task_with_callback_guarded(task, callback, lock, stop_event, logger)
-    asyncio.create_task(wrapped_task)
+    _spawn(wrapped_task)
+
+
+def spawn_task_with_callback_keyed(
+    task: Awaitable[T],
+    callback: Callable[[T | None, Exception | None], Awaitable[None]],
+    key: K,
+    locks: KeyedLock[K],
+    stop_event: asyncio.Event,
+    logger: Logger | None = None,
+) -> None:
+    wrapped_task = task_with_callback_keyed(
+        task, callback, key, locks, stop_event, logger
+    )
+    _spawn(wrapped_task)
 
 
 def spawn_task_queue_worker(
@@ -95,7 +251,206 @@ def spawn_task_queue_worker(
                 if logger:
                     logger.error(f"Error in queued task:\n{exc_to_str(e)}")
 
-    asyncio.create_task(_run())
+    _spawn(_run())
+
+
+def spawn_task_queue_worker_keyed(
+    queue: asyncio.Queue[tuple[K, Awaitable[Any]] | None],
+    locks: KeyedLock[K],
+    stop_event: asyncio.Event,
+    logger: Logger | None = None,
+    max_pending: int | None = None,
+) -> None:
+    """
+    `spawn_task_queue_worker` for ``(key, awaitable)`` items: items with the
+    same key run in queue order, one at a time, while different keys run
+    concurrently. After `stop_event` is set, waiting items are closed
+    without running and the worker stops taking new ones.
+
+    Args:
+        max_pending: items taken off the queue but not finished (running or
+            waiting for their key). At the limit the worker stops taking
+            items, so a bounded queue keeps pushing back on producers even
+            when one key is busy (None: `queue.maxsize`, unbounded if 0).
+    """
+    if max_pending is None:
+        max_pending = queue.maxsize or None
+    if max_pending is not None and max_pending <= 0:
+        raise ValueError("max_pending must be a positive integer")
+    slots = asyncio.Semaphore(max_pending) if max_pending is not None else None
+
+    async def _run_item(key: K, task: Awaitable[Any]) -> None:
+        try:
+            async with locks(key):
+                if stop_event.is_set():
+                    _discard_awaitable(task)
+                    return
+                await task
+        # 한 항목의 실패가 워커를 멈추지 않도록 기록만 한다
+        except Exception as e:  # noqa: BLE001
+            if logger:
+                logger.error(f"Error in queued task:\n{exc_to_str(e)}")
+        finally:
+            if slots is not None:
+                slots.release()
+
+    async def _run() -> None:
+        while True:
+            if slots is not None:
+                await slots.acquire()
+            item = await queue.get()
+            if item is None or stop_event.is_set():
+                if item is not None:
+                    _discard_awaitable(item[1])
+                break
+            # 생성 순서대로 lock 을 기다리므로 같은 key 안에서 순서가 유지된다
+            _spawn(_run_item(*item))
+
+    _spawn(_run())
+
+
+class PriorityStats(TypedDict):
+    enqueued: int
+    dequeued: int
+    expired: int
+    delay: DistributionSummary
+
+
+class _QueueEntry:
+    __slots__ = ("deadline", "enqueued", "item", "key", "priority")
+
+    def __init__(
+        self,
+        key: tuple[int, float, int],
+        item: Awaitable[Any] | None,
+        priority: int,
+        deadline: float,
+        enqueued: float,
+    ) -> None:
+        self.key = key
+        self.item = item
+        self.priority = priority
+        self.deadline = deadline
+        self.enqueued = enqueued
+
+    def __lt__(self, other: _QueueEntry) -> bool:
+        return self.key < other.key
+
+
+class DeadlineQueue(asyncio.Queue[Awaitable[Any] | None]):
+    """
+    Drop-in queue for `spawn_task_queue_worker` that hands out awaitables by
+    (priority, deadline, arrival) instead of FIFO; a lower priority value is
+    served first, like `asyncio.PriorityQueue`.
+
+    ``queue.put_nowait(coro, priority=0, timeout=2.0)``
+
+    Entries whose deadline (`time.monotonic()` seconds, or `timeout` from
+    now) has passed are dropped at `get` time: coroutines are closed and
+    futures cancelled without running, and `task_done` is called for them so
+    `join` still works. Plain ``put(item)`` keeps the old FIFO behavior.
+    """
+
+    def __init__(self, maxsize: int = 0, default_priority: int = 0) -> None:
+        super().__init__(maxsize)
+        self.default_priority: int = default_priority
+        self._counter = itertools.count()
+        self._stats: dict[int, PriorityStats] = {}
+        self._delays: dict[int, _SampleBuffer] = {}
+
+    # asyncio.PriorityQueue 와 같이 self._queue 를 heap 으로 쓴다
+    def _init(self, maxsize: int) -> None:
+        self._queue: list[_QueueEntry] = []
+
+    def _put(self, entry: Any) -> None:
+        heapq.heappush(self._queue, entry)
+
+    def _get(self) -> Any:
+        return heapq.heappop(self._queue)
+
+    def _entry(
+        self,
+        item: Awaitable[Any] | None | _QueueEntry,
+        priority: int | None,
+        deadline: float | None,
+        timeout: float | None,
+    ) -> _QueueEntry:
+        # asyncio.Queue.put 은 put_nowait 를 다시 부르므로 감싼 항목은 그대로 둔다
+        if isinstance(item, _QueueEntry):
+            return item
+        now = time.monotonic()
+        if priority is None:
+            priority = self.default_priority
+        if timeout is not None:
+            deadline = (
+                now + timeout if deadline is None else min(deadline, now + timeout)
+            )
+        if deadline is None:
+            deadline = math.inf
+        key = (priority, deadline, next(self._counter))
+        return _QueueEntry(key, item, priority, deadline, now)
+
+    def _class_stats(self, priority: int) -> PriorityStats:
+        stats = self._stats.get(priority)
+        if stats is None:
+            self._delays[priority] = _SampleBuffer()
+            stats = self._stats[priority] = {
+                "enqueued": 0,
+                "dequeued": 0,
+                "expired": 0,
+                "delay": self._delays[priority].summary(),
+            }
+        return stats
+
+    async def put(
+        self,
+        item: Awaitable[Any] | None,
+        priority: int | None = None,
+        deadline: float | None = None,
+        timeout: float | None = None,
+    ) -> None:
+        await super().put(self._entry(item, priority, deadline, timeout))  # type: ignore[arg-type]
+
+    def put_nowait(
+        self,
+        item: Awaitable[Any] | None,
+        priority: int | None = None,
+        deadline: float | None = None,
+        timeout: float | None = None,
+    ) -> None:
+        entry = self._entry(item, priority, deadline, timeout)
+        super().put_nowait(entry)  # type: ignore[arg-type]
+        self._class_stats(entry.priority)["enqueued"] += 1
+
+    def get_nowait(self) -> Awaitable[Any] | None:
+        while True:
+            entry: _QueueEntry = super().get_nowait()  # type: ignore[assignment]
+            now = time.monotonic()
+            stats = self._class_stats(entry.priority)
+            # 종료 신호(None)는 만료시키지 않는다
+            if entry.item is not None and entry.deadline < now:
+                _discard_awaitable(entry.item)
+                stats["expired"] += 1
+                self.task_done()
+                continue
+            stats["dequeued"] += 1
+            self._delays[entry.priority].add(now - entry.enqueued)
+            return entry.item
+
+    async def get(self) -> Awaitable[Any] | None:
+        while True:
+            try:
+                return await super().get()
+            except asyncio.QueueEmpty:
+                # 남은 항목이 모두 만료되어 버려졌다
+                continue
+
+    def stats(self) -> dict[int, PriorityStats]:
+        for priority, stats in self._stats.items():
+            stats["delay"] = self._delays[priority].summary()
+        return {
+            priority: stats.copy() for priority, stats in sorted(self._stats.items())
+        }
 
 
 async def await_if_awaitable(aw: T | Awaitable[T]) -> T:
@@ -113,12 +468,917 @@ def async_lambda(
     return _func
 
 
+class RateLimitExceeded(Exception):
+    pass
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at `rate` tokens per second up to `capacity`.
+
+    Waiters reserve their tokens up front (the balance may go negative) and
+    sleep until the reservation is covered, so they are served in FIFO order
+    without polling. A cancelled waiter gives its tokens back.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate: float = rate
+        self.capacity: float = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens: float = self.capacity
+        self._updated: float = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    @property
+    def tokens(self) -> float:
+        self._refill()
+        return self._tokens
+
+    @property
+    def full(self) -> bool:
+        return self.tokens >= self.capacity
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        self._refill()
+        if self._tokens < tokens:
+            return False
+        self._tokens -= tokens
+        return True
+
+    def reserve(self, tokens: float = 1.0, max_wait: float | None = None) -> float:
+        """Take `tokens` now and return the seconds to wait before using them.
+        Raises `RateLimitExceeded` (taking nothing) if that exceeds `max_wait`."""
+        if tokens > self.capacity:
+            raise ValueError("tokens must not exceed capacity")
+        self._refill()
+        wait = max(tokens - self._tokens, 0.0) / self.rate
+        if max_wait is not None and wait > max_wait:
+            raise RateLimitExceeded(f"Rate limit wait {wait:.3f}s exceeds {max_wait}s")
+        self._tokens -= tokens
+        return wait
+
+    async def acquire(
+        self, tokens: float = 1.0, max_wait: float | None = None
+    ) -> float:
+        wait = self.reserve(tokens, max_wait)
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self._tokens += tokens
+                raise
+        return wait
+
+
+class LimiterStats(TypedDict):
+    rate: float
+    capacity: float
+    buckets: int
+    acquired: int
+    rejected: int
+    delayed: int
+    wait: DistributionSummary
+
+
+class RateLimiter:
+    """
+    Async token-bucket admission control.
+
+    Args:
+        rate: tokens per second (per key when `per_key`)
+        capacity: burst size (None: max(rate, 1))
+        per_key: keep a separate bucket per key instead of one shared bucket.
+            Past `max_keys` buckets, least recently used buckets that have
+            refilled are dropped; while the oldest one is still refilling,
+            the limiter grows past `max_keys` instead.
+        max_wait: reject with `RateLimitExceeded` instead of waiting longer
+            than this many seconds (None: always wait, 0: never wait)
+
+    Usage::
+
+        async with limiter(key):
+            ...
+
+        @limiter.limit(key=lambda session, *_: session)
+        async def call(session, payload): ...
+
+    One instance can be shared by several `AsyncWorkerPool` (``limiter=``)
+    and spawned tasks to give them a common budget.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        per_key: bool = False,
+        max_wait: float | None = None,
+        max_keys: int = 10000,
+    ) -> None:
+        self.rate: float = rate
+        self.capacity: float = capacity if capacity is not None else max(rate, 1.0)
+        self.per_key: bool = per_key
+        self.max_wait: float | None = max_wait
+        self.max_keys: int = max_keys
+        self._bucket: TokenBucket = TokenBucket(rate, self.capacity)
+        # 최근에 쓴 key 가 뒤로 가도록 유지한다
+        self._buckets: OrderedDict[Hashable, TokenBucket] = OrderedDict()
+
+        self.acquired: int = 0
+        self.rejected: int = 0
+        self.delayed: int = 0
+        self._wait: _SampleBuffer = _SampleBuffer()
+
+    def bucket(self, key: Hashable = None) -> TokenBucket:
+        if not self.per_key:
+            return self._bucket
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            # 다시 가득 찬 bucket 은 새로 만든 것과 같으므로 버려도 된다. 대기
+            # 중인 요청은 token 을 미리 가져가므로 그런 bucket 은 가득 차 있지 않다
+            while len(self._buckets) >= self.max_keys:
+                oldest = next(iter(self._buckets.values()))
+                if not oldest.full:
+                    break
+                self._buckets.popitem(last=False)
+            bucket = self._buckets[key] = TokenBucket(self.rate, self.capacity)
+        else:
+            self._buckets.move_to_end(key)
+        return bucket
+
+    def try_acquire(self, key: Hashable = None, tokens: float = 1.0) -> bool:
+        if self.bucket(key).try_acquire(tokens):
+            self.acquired += 1
+            self._wait.add(0.0)
+            return True
+        self.rejected += 1
+        return False
+
+    async def acquire(
+        self,
+        key: Hashable = None,
+        tokens: float = 1.0,
+        max_wait: float | None = None,
+    ) -> float:
+        """Wait for `tokens`; returns the time waited."""
+        try:
+            wait = await self.bucket(key).acquire(
+                tokens, self.max_wait if max_wait is None else max_wait
+            )
+        except RateLimitExceeded:
+            self.rejected += 1
+            raise
+        self.acquired += 1
+        self.delayed += wait > 0
+        self._wait.add(wait)
+        return wait
+
+    @asynccontextmanager
+    async def __call__(
+        self, key: Hashable = None, tokens: float = 1.0
+    ) -> AsyncIterator[None]:
+        await self.acquire(key, tokens)
+        yield
+
+    def limit(
+        self,
+        key: Callable[..., Hashable] | None = None,
+        tokens: float = 1.0,
+    ) -> Callable[
+        [Callable[P, Coroutine[Any, Any, T]]], Callable[P, Coroutine[Any, Any, T]]
+    ]:
+        """Decorator for coroutine functions; `key` maps the call arguments to
+        a bucket key when `per_key`."""
+
+        def decorator(
+            fn: Callable[P, Coroutine[Any, Any, T]],
+        ) -> Callable[P, Coroutine[Any, Any, T]]:
+            @functools.wraps(fn)
+            async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+                await self.acquire(key(*args, **kwargs) if key else None, tokens)
+                return await fn(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def stats(self) -> LimiterStats:
+        return {
+            "rate": self.rate,
+            "capacity": self.capacity,
+            "buckets": len(self._buckets) if self.per_key else 1,
+            "acquired": self.acquired,
+            "rejected": self.rejected,
+            "delayed": self.delayed,
+            "wait": self._wait.summary(),
+        }
+
+
+class PoolStats(TypedDict):
+    workers: int
+    max_concurrency: int
+    queue_depth: int
+    in_flight: int
+    submitted: int
+    completed: int
+    failed: int
+    cancelled: int
+    wait: DistributionSummary
+    latency: DistributionSummary
+
+
+_PoolItem = tuple[Awaitable[Any], "asyncio.Future[Any]", float]
+
+
+class AsyncWorkerPool(Generic[T]):
+    """
+    N queue consumers that run independent awaitables concurrently, unlike
+    `spawn_task_queue_worker` which serializes everything behind one lock.
+
+    Args:
+        workers: number of consumer tasks
+        max_concurrency: awaitables running at once, at most `workers`
+            since each worker runs one at a time (None: `workers`)
+        maxsize: queue bound; `submit` waits while the queue is full
+            (0: 2 * workers, None: unbounded)
+        stop_event: when set, dequeued awaitables are closed instead of run
+            and their futures fail, like `task_with_callback_guarded`
+        logger: logs exceptions raised by the awaitables
+        limiter: `RateLimiter` every awaitable must pass before it runs;
+            share one instance between pools for a common budget. A
+            rejection fails that awaitable's future with `RateLimitExceeded`.
+        limiter_key: bucket key for a per-key `limiter`
+
+    `submit` returns a future with the awaitable's result. Use the pool as an
+    ``async with`` block, or call `start` / `shutdown` explicitly.
+    """
+
+    def __init__(
+        self,
+        workers: int = 4,
+        max_concurrency: int | None = None,
+        maxsize: int | None = 0,
+        stop_event: asyncio.Event | None = None,
+        logger: Logger | None = None,
+        limiter: RateLimiter | None = None,
+        limiter_key: Hashable = None,
+    ) -> None:
+        if workers <= 0:
+            raise ValueError("workers must be a positive integer")
+        if max_concurrency is not None and max_concurrency <= 0:
+            raise ValueError("max_concurrency must be a positive integer")
+        if max_concurrency is not None and max_concurrency > workers:
+            raise ValueError("max_concurrency cannot exceed workers")
+        self.workers: int = workers
+        self.max_concurrency: int = max_concurrency or workers
+        self.maxsize: int = 0 if maxsize is None else (maxsize or 2 * workers)
+        self.stop_event: asyncio.Event | None = stop_event
+        self.logger: Logger | None = logger
+        self.limiter: RateLimiter | None = limiter
+        self.limiter_key: Hashable = limiter_key
+
+        self._queue: asyncio.Queue[_PoolItem] | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._closed: bool = False
+
+        self.in_flight: int = 0
+        self.submitted: int = 0
+        self.completed: int = 0
+        self.failed: int = 0
+        self.cancelled: int = 0
+        self._wait: _SampleBuffer = _SampleBuffer()
+        self._latency: _SampleBuffer = _SampleBuffer()
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    def start(self) -> None:
+        if self._closed:
+            raise RuntimeError("AsyncWorkerPool is shut down")
+        if self._tasks:
+            return
+        # 큐/세마포어는 실행 중인 이벤트 루프 안에서 만든다
+        self._queue = asyncio.Queue(self.maxsize)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        for _ in range(self.workers):
+            task = asyncio.create_task(self._worker())
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def _item(self, aw: Awaitable[T]) -> tuple[_PoolItem, asyncio.Future[T]]:
+        if self._closed:
+            _discard_awaitable(aw)
+            raise RuntimeError("AsyncWorkerPool is shut down")
+        self.start()
+        future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        return (aw, future, time.perf_counter()), future
+
+    async def submit(self, aw: Awaitable[T]) -> asyncio.Future[T]:
+        item, future = self._item(aw)
+        assert self._queue is not None
+        try:
+            await self._queue.put(item)
+        except asyncio.CancelledError:
+            _discard_awaitable(aw)
+            raise
+        self.submitted += 1
+        return future
+
+    def submit_nowait(self, aw: Awaitable[T]) -> asyncio.Future[T]:
+        """Raises `asyncio.QueueFull` instead of waiting for space."""
+        item, future = self._item(aw)
+        assert self._queue is not None
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            _discard_awaitable(aw)
+            raise
+        self.submitted += 1
+        return future
+
+    async def run(self, aw: Awaitable[T]) -> T:
+        return await (await self.submit(aw))
+
+    async def _worker(self) -> None:
+        assert self._queue is not None and self._semaphore is not None
+        while True:
+            item = await self._queue.get()
+            try:
+                await self._execute(*item)
+            finally:
+                self._queue.task_done()
+
+    async def _execute(
+        self, aw: Awaitable[Any], future: asyncio.Future[Any], enqueued: float
+    ) -> None:
+        assert self._semaphore is not None
+        if future.cancelled() or (
+            self.stop_event is not None and self.stop_event.is_set()
+        ):
+            _discard_awaitable(aw)
+            self.cancelled += 1
+            if not future.done():
+                future.set_exception(Exception("Operation cancelled due to stop event"))
+            return
+
+        # 토큰은 세마포어 밖에서 기다린다 (기다리는 동안 실행 슬롯을 차지하지 않도록)
+        if self.limiter is not None:
+            try:
+                await self.limiter.acquire(self.limiter_key)
+            except RateLimitExceeded as e:
+                _discard_awaitable(aw)
+                self.failed += 1
+                if not future.done():
+                    future.set_exception(e)
+                return
+            except asyncio.CancelledError:
+                _discard_awaitable(aw)
+                self.cancelled += 1
+                future.cancel()
+                raise
+        try:
+            await self._semaphore.acquire()
+        except asyncio.CancelledError:
+            # shutdown 이 세마포어를 기다리던 워커를 취소한 경우
+            _discard_awaitable(aw)
+            self.cancelled += 1
+            future.cancel()
+            raise
+        try:
+            start = time.perf_counter()
+            self._wait.add(start - enqueued)
+            self.in_flight += 1
+            try:
+                result = await aw
+            except asyncio.CancelledError:
+                self.cancelled += 1
+                future.cancel()
+                raise
+            # 어떤 예외든 submit 한 쪽의 future 로 넘기고 워커는 계속 돈다
+            except Exception as e:  # noqa: BLE001
+                self.failed += 1
+                if self.logger:
+                    self.logger.error(f"Error in pooled task:\n{exc_to_str(e)}")
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                self.completed += 1
+                if not future.done():
+                    future.set_result(result)
+            finally:
+                self.in_flight -= 1
+                self._latency.add(time.perf_counter() - start)
+        finally:
+            self._semaphore.release()
+
+    async def shutdown(self, drain: bool = True, timeout: float | None = None) -> None:
+        """
+        Stop accepting work and stop the workers.
+
+        Args:
+            drain: run everything already queued first; otherwise cancel the
+                running awaitables and fail the queued ones
+            timeout: seconds to wait for the drain before cancelling
+        """
+        self._closed = True
+        if not self._tasks or self._queue is None:
+            return
+
+        if drain:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+        # drain 후에는 워커가 모두 queue.get() 에서 대기 중이다
+        for task in self._tasks:
+            task.cancel()
+        while not self._queue.empty():
+            aw, future, _ = self._queue.get_nowait()
+            self._queue.task_done()
+            _discard_awaitable(aw)
+            future.cancel()
+            self.cancelled += 1
+
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def stats(self) -> PoolStats:
+        return {
+            "workers": self.workers,
+            "max_concurrency": self.max_concurrency,
+            "queue_depth": self.queue_depth,
+            "in_flight": self.in_flight,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "wait": self._wait.summary(),
+            "latency": self._latency.summary(),
+        }
+
+    async def __aenter__(self) -> AsyncWorkerPool[T]:
+        self.start()
+        return self
+
+    async def __aexit__(
+        self, exc_type: type[BaseException] | None, *exc: object
+    ) -> None:
+        await self.shutdown(drain=exc_type is None)
+
+
+class BatcherStats(TypedDict):
+    batches: int
+    items: int
+    failed_batches: int
+    pending: int
+    in_flight: int
+    batch_size: DistributionSummary
+    wait: DistributionSummary
+    latency: DistributionSummary
+
+
+class AsyncBatcher(Generic[T, R]):
+    """
+    Collect single submissions into batches for one batched coroutine call.
+
+    A batch is dispatched when it reaches `max_batch` items or `max_wait_ms`
+    after its first item, whichever comes first. `fn` receives the items in
+    submission order and must return one result per item; a result that is
+    an exception instance is raised to that caller only, and an exception
+    raised by `fn` fails every caller of the batch.
+
+    Args:
+        fn: batched coroutine function
+        max_batch: maximum items per call
+        max_wait_ms: maximum time the first item of a batch waits
+        max_concurrency: batches allowed to run at once (None: unlimited)
+        logger: logs exceptions raised by `fn`
+    """
+
+    def __init__(
+        self,
+        fn: Callable[[list[T]], Awaitable[Sequence[R | BaseException]]],
+        max_batch: int = 32,
+        max_wait_ms: float = 5.0,
+        max_concurrency: int | None = None,
+        logger: Logger | None = None,
+    ) -> None:
+        if max_batch <= 0:
+            raise ValueError("max_batch must be a positive integer")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms must be non-negative")
+        self.fn = fn
+        self.max_batch: int = max_batch
+        self.max_wait: float = max_wait_ms / 1000
+        self.max_concurrency: int | None = max_concurrency
+        self.logger: Logger | None = logger
+
+        self._pending: list[tuple[T, asyncio.Future[R], float]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._closed: bool = False
+
+        self.batches: int = 0
+        self.items: int = 0
+        self.failed_batches: int = 0
+        self._batch_size: _SampleBuffer = _SampleBuffer()
+        self._wait: StreamingSummary = StreamingSummary()
+        self._latency: _SampleBuffer = _SampleBuffer()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._tasks)
+
+    def submit_nowait(self, item: T) -> asyncio.Future[R]:
+        if self._closed:
+            raise RuntimeError("AsyncBatcher is closed")
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[R] = loop.create_future()
+        self._pending.append((item, future, time.perf_counter()))
+        if len(self._pending) >= self.max_batch:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self.flush)
+        return future
+
+    async def submit(self, item: T) -> R:
+        return await self.submit_nowait(item)
+
+    def flush(self) -> None:
+        """Dispatch the pending items now, without waiting for `max_wait_ms`."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        # 대기 중에 취소된 호출은 배치에서 뺀다
+        batch = [entry for entry in self._pending if not entry[1].cancelled()]
+        self._pending = []
+        for start in range(0, len(batch), self.max_batch):
+            task = asyncio.create_task(
+                self._run_batch(batch[start : start + self.max_batch])
+            )
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: list[tuple[T, asyncio.Future[R], float]]) -> None:
+        try:
+            if self.max_concurrency is not None:
+                if self._semaphore is None:
+                    self._semaphore = asyncio.Semaphore(self.max_concurrency)
+                async with self._semaphore:
+                    await self._call(batch)
+            else:
+                await self._call(batch)
+        finally:
+            # fn 이 CancelledError 를 던졌거나 배치 task 가 취소된 경우
+            for _, future, _ in batch:
+                if not future.done():
+                    future.cancel()
+
+    async def _call(self, batch: list[tuple[T, asyncio.Future[R], float]]) -> None:
+        start = time.perf_counter()
+        self.batches += 1
+        self.items += len(batch)
+        self._batch_size.add(len(batch))
+        self._wait.add([start - enqueued for _, _, enqueued in batch])
+        try:
+            results = await self.fn([item for item, _, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(
+                    f"Batch function returned {len(results)} results "
+                    f"for {len(batch)} items"
+                )
+        # 어떤 예외든 그 batch 의 모든 호출자에게 넘긴다
+        except Exception as e:  # noqa: BLE001
+            self.failed_batches += 1
+            if self.logger:
+                self.logger.error(f"Error in batch:\n{exc_to_str(e)}")
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            self._latency.add(time.perf_counter() - start)
+
+        for (_, future, _), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def close(self) -> None:
+        """Dispatch what is pending and wait for every running batch."""
+        self._closed = True
+        self.flush()
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def stats(self) -> BatcherStats:
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "failed_batches": self.failed_batches,
+            "pending": self.pending,
+            "in_flight": self.in_flight,
+            "batch_size": self._batch_size.summary(),
+            "wait": self._wait.summary(),
+            "latency": self._latency.summary(),
+        }
+
+    async def __aenter__(self) -> AsyncBatcher[T, R]:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.close()
+
+
+class ExecutorStats(TypedDict):
+    kind: ExecutorKind
+    max_workers: int
+    in_flight: int
+    queued: int
+    saturation: float
+    submitted: int
+    completed: int
+    failed: int
+    cancelled: int
+    timed_out: int
+    wait: DistributionSummary
+    latency: DistributionSummary
+
+
+def _timed_call(
+    fn: Callable[..., T], args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> tuple[T, float]:
+    # 워커 안에서 실행 시간만 재고, 대기 시간은 호출 측에서 (전체 - 실행) 으로 구한다
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+class ManagedExecutor:
+    """
+    Lazily created thread or process pool with saturation statistics.
+
+    Thread calls run inside a copy of the caller's `contextvars` context.
+    Process calls need picklable functions and arguments and do not see the
+    caller's context variables.
+    """
+
+    def __init__(
+        self, kind: ExecutorKind = "thread", max_workers: int | None = None
+    ) -> None:
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown executor kind: {kind}")
+        if max_workers is None:
+            cpus = os.cpu_count() or 1
+            # ThreadPoolExecutor / ProcessPoolExecutor 기본값과 동일
+            max_workers = min(32, cpus + 4) if kind == "thread" else cpus
+        self.kind: ExecutorKind = kind
+        self.max_workers: int = max_workers
+        self._executor: Executor | None = None
+        self._lock = threading.Lock()
+
+        self.in_flight: int = 0
+        self.submitted: int = 0
+        self.completed: int = 0
+        self.failed: int = 0
+        self.cancelled: int = 0
+        self.timed_out: int = 0
+        self._wait: _SampleBuffer = _SampleBuffer()
+        self._latency: _SampleBuffer = _SampleBuffer()
+
+    @property
+    def executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.kind == "thread":
+                    self._executor = ThreadPoolExecutor(self.max_workers)
+                else:
+                    self._executor = ProcessPoolExecutor(self.max_workers)
+            return self._executor
+
+    async def run(
+        self,
+        fn: Callable[..., T],
+        *args: Any,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> T:
+        """
+        Run `fn(*args, **kwargs)` in the pool without blocking the loop.
+
+        On timeout or cancellation a call that has not started yet is removed
+        from the pool queue; one that is already running cannot be interrupted
+        and finishes in the background.
+        """
+        loop = asyncio.get_running_loop()
+        call: Callable[[], tuple[T, float]]
+        if self.kind == "thread":
+            ctx = contextvars.copy_context()
+            call = functools.partial(ctx.run, _timed_call, fn, args, kwargs)
+        else:
+            call = functools.partial(_timed_call, fn, args, kwargs)
+
+        future = loop.run_in_executor(self.executor, call)
+        self.submitted += 1
+        self.in_flight += 1
+        start = time.perf_counter()
+        try:
+            result, elapsed = await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            raise
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.in_flight -= 1
+        self.completed += 1
+        self._latency.add(elapsed)
+        self._wait.add(max(time.perf_counter() - start - elapsed, 0.0))
+        return result
+
+    def stats(self) -> ExecutorStats:
+        return {
+            "kind": self.kind,
+            "max_workers": self.max_workers,
+            "in_flight": self.in_flight,
+            "queued": max(self.in_flight - self.max_workers, 0),
+            "saturation": min(self.in_flight, self.max_workers) / self.max_workers,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "timed_out": self.timed_out,
+            "wait": self._wait.summary(),
+            "latency": self._latency.summary(),
+        }
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+                self._executor = None
+
+
+# 호출 종류(category)별 executor. "io" / "cpu" 는 처음 쓸 때 만든다
+_executors: dict[str, ManagedExecutor] = {}
+_executors_lock = threading.Lock()
+_DEFAULT_EXECUTORS: dict[str, ExecutorKind] = {"io": "thread", "cpu": "process"}
+
+
+def register_executor(
+    category: str, kind: ExecutorKind = "thread", max_workers: int | None = None
+) -> ManagedExecutor:
+    """Create (or replace) the executor used for `category`."""
+    executor = ManagedExecutor(kind, max_workers)
+    with _executors_lock:
+        old = _executors.get(category)
+        _executors[category] = executor
+    if old is not None:
+        old.shutdown(wait=False)
+    return executor
+
+
+def get_executor(category: str = "io") -> ManagedExecutor:
+    with _executors_lock:
+        executor = _executors.get(category)
+        if executor is None:
+            if category not in _DEFAULT_EXECUTORS:
+                raise KeyError(f"No executor registered for category: {category}")
+            executor = _executors[category] = ManagedExecutor(
+                _DEFAULT_EXECUTORS[category]
+            )
+        return executor
+
+
+async def run_in_executor(
+    fn: Callable[..., T],
+    *args: Any,
+    category: str = "io",
+    timeout: float | None = None,
+    **kwargs: Any,
+) -> T:
+    """
+    Run a blocking callable in the executor registered for `category`
+    ("io": thread pool, "cpu": process pool, or `register_executor`).
+
+    ``await run_in_executor(summarize_distribution, times, category="cpu")``
+    """
+    return await get_executor(category).run(fn, *args, timeout=timeout, **kwargs)
+
+
+class _OffloadTarget:
+    """Picklable stand-in for an `offload`-decorated function. Pickling the
+    function itself fails because its module-level name now refers to the
+    coroutine wrapper, so the worker looks the name up and unwraps it."""
+
+    def __init__(self, module: str, qualname: str) -> None:
+        self.module: str = module
+        self.qualname: str = qualname
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        obj: Any = importlib.import_module(self.module)
+        for name in self.qualname.split("."):
+            obj = getattr(obj, name)
+        return getattr(obj, "__offloaded__", obj)(*args, **kwargs)
+
+
+def offload(
+    category: str = "io", timeout: float | None = None
+) -> Callable[[Callable[P, T]], Callable[P, Coroutine[None, None, T]]]:
+    """Decorator turning a blocking function into a coroutine function that
+    runs it through `run_in_executor`. Module-level functions also work with
+    process executors ("cpu"): the worker imports the function by name."""
+
+    def decorator(fn: Callable[P, T]) -> Callable[P, Coroutine[None, None, T]]:
+        # <locals> 안의 함수는 이름으로 찾을 수 없으므로 그대로 보낸다
+        target: Callable[..., T] = (
+            fn
+            if "<locals>" in fn.__qualname__
+            else _OffloadTarget(fn.__module__, fn.__qualname__)
+        )
+
+        @functools.wraps(fn)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            executor = get_executor(category)
+            return await executor.run(
+                fn if executor.kind == "thread" else target,
+                *args,
+                timeout=timeout,
+                **kwargs,
+            )
+
+        wrapper.__offloaded__ = fn  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+def executor_stats() -> dict[str, ExecutorStats]:
+    with _executors_lock:
+        executors = dict(_executors)
+    return {category: executor.stats() for category, executor in executors.items()}
+
+
+def shutdown_executors(wait: bool = True, cancel_futures: bool = False) -> None:
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
 __all__ = [
     "task_with_callback",
     "task_with_callback_guarded",
     "spawn_task_with_callback",
     "spawn_task_with_callback_guarded",
     "spawn_task_queue_worker",
+    "KeyedLock",
+    "task_with_callback_keyed",
+    "spawn_task_with_callback_keyed",
+    "spawn_task_queue_worker_keyed",
+    "DeadlineQueue",
+    "PriorityStats",
     "await_if_awaitable",
     "async_lambda",
+    "AsyncWorkerPool",
+    "PoolStats",
+    "AsyncBatcher",
+    "BatcherStats",
+    "RateLimitExceeded",
+    "TokenBucket",
+    "RateLimiter",
+    "LimiterStats",
+    "ManagedExecutor",
+    "ExecutorStats",
+    "register_executor",
+    "get_executor",
+    "run_in_executor",
+    "offload",
+    "executor_stats",
+    "shutdown_executors",
 ]
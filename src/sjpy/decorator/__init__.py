@@ -1,13 +1,31 @@
 # sjpy/decorator/__init__.py
 
-from sjpy.decorator.check_version import check_version, requires_versions
+from sjpy.decorator.cache import Cache, async_memoize, memoize, size_cache, ttl_cache
+from sjpy.decorator.check_version import (
+    check_version,
+    clear_version_cache,
+    requires_versions,
+)
+from sjpy.decorator.disk_cache import disk_cache
 from sjpy.decorator.etc import generate_simple_decorator, lru_dict_cache
-from sjpy.decorator.singleton import singleton
+from sjpy.decorator.shm_cache import SharedMemoryCache, shm_cache
+from sjpy.decorator.singleton import clear_singletons, singleton, singletons
 
 __all__ = [
     "singleton",
+    "singletons",
+    "clear_singletons",
     "lru_dict_cache",
+    "Cache",
+    "memoize",
+    "async_memoize",
+    "disk_cache",
+    "SharedMemoryCache",
+    "shm_cache",
+    "ttl_cache",
+    "size_cache",
     "generate_simple_decorator",
     "check_version",
     "requires_versions",
+    "clear_version_cache",
 ]
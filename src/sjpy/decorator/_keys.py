@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+
+def _update_hash(h: Any, obj: Any) -> None:
+    # 타입 태그 + 내용. dict / set 은 원소의 digest 로 정렬해 순서와 무관하게 만든다
+    if obj is None or isinstance(obj, (bool, int, float, complex)):
+        h.update(f"{type(obj).__name__}:{obj!r};".encode())
+    elif isinstance(obj, str):
+        data = obj.encode("utf-8")
+        h.update(b"str:%d:" % len(data) + data)
+    elif isinstance(obj, (bytes, bytearray, memoryview)):
+        data = bytes(obj)
+        h.update(b"bytes:%d:" % len(data) + data)
+    elif isinstance(obj, np.ndarray) and not obj.dtype.hasobject:
+        array = np.ascontiguousarray(obj)
+        h.update(f"ndarray:{array.dtype.str}:{array.shape};".encode())
+        h.update(array.data)
+    elif isinstance(obj, np.generic):
+        _update_hash(h, obj.item())
+    elif isinstance(obj, (list, tuple)):
+        h.update(f"{type(obj).__name__}:{len(obj)}[".encode())
+        for item in obj:
+            _update_hash(h, item)
+        h.update(b"]")
+    elif isinstance(obj, dict):
+        items = sorted((content_hash(k), content_hash(v)) for k, v in obj.items())
+        h.update(b"dict:%d{" % len(items))
+        for k, v in items:
+            h.update(k + v)
+        h.update(b"}")
+    elif isinstance(obj, (set, frozenset)):
+        digests = sorted(content_hash(item) for item in obj)
+        h.update(b"set:%d{" % len(digests) + b"".join(digests) + b"}")
+    elif isinstance(obj, Path):
+        h.update(b"path:" + os.fsencode(obj))
+    else:
+        h.update(f"pickle:{type(obj).__module__}.{type(obj).__qualname__}:".encode())
+        h.update(pickle.dumps(obj, protocol=4))
+
+
+def content_hash(obj: Any) -> bytes:
+    """SHA-256 of the normalized content of `obj`: equal dicts / sets give the
+    same digest regardless of order, and arrays are hashed by dtype, shape and
+    data."""
+    h = hashlib.sha256()
+    _update_hash(h, obj)
+    return h.digest()
+
+
+def make_cache_key(
+    func: Callable[..., Any], version: str | None = None
+) -> Callable[..., str]:
+    """Return ``cache_key(*args, **kwargs)``: the hex SHA-256 over `func`'s
+    module and qualified name, `version` and the normalized arguments (see
+    `content_hash`). Shared by `disk_cache` and `shm_cache`."""
+    func_id = f"{func.__module__}.{func.__qualname__}:{version or ''}"
+
+    def cache_key(*args: Any, **kwargs: Any) -> str:
+        h = hashlib.sha256(func_id.encode("utf-8"))
+        _update_hash(h, args)
+        _update_hash(h, kwargs)
+        return h.hexdigest()
+
+    return cache_key
+
+
+__all__ = ["content_hash", "make_cache_key"]
@@ -0,0 +1,416 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import itertools
+import math
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Coroutine, Hashable
+from functools import wraps
+from threading import Lock
+from typing import Any, Generic, TypedDict, TypeVar
+
+import numpy as np
+
+from sjpy.decorator.etc import freeze
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# 위치 인자와 키워드 인자를 구분하는 표식
+_KWARGS = object()
+_MISSING = object()
+
+
+class CacheStats(TypedDict):
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    currsize: int
+    bytes: int
+    maxsize: int | None
+    max_bytes: int | None
+    ttl: float | None
+
+
+class AsyncCacheStats(CacheStats):
+    in_flight: int
+    coalesced: int
+    negative_hits: int
+
+
+def default_sizer(value: Any) -> int:
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    return sys.getsizeof(value)
+
+
+def make_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> Hashable:
+    """Cache key of a call, with dict / list / set arguments frozen."""
+    key = tuple([freeze(arg) for arg in args])
+    if kwargs:
+        key += (_KWARGS, *sorted((k, freeze(v)) for k, v in kwargs.items()))
+    return key
+
+
+class _Shard:
+    __slots__ = (
+        "bytes",
+        "entries",
+        "evictions",
+        "expirations",
+        "hits",
+        "lock",
+        "misses",
+    )
+
+    def __init__(self) -> None:
+        self.lock = Lock()
+        # key -> (value, expires_at, size, 마지막 사용 tick), 오래 안 쓴 순서
+        self.entries: OrderedDict[Any, tuple[Any, float, int, int]] = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+
+class Cache(Generic[K, V]):
+    """
+    Thread-safe LRU cache with optional time-to-live and byte budget.
+
+    Keys are spread over `shards` independently locked LRU shards, so
+    threads touching different keys rarely contend. `maxsize` and
+    `max_bytes` bound the whole cache: when either is exceeded, the least
+    recently used entry across all shards is evicted.
+
+    Args:
+        maxsize: maximum number of entries (None: unbounded)
+        ttl: seconds an entry stays valid after it is set (None: forever)
+        max_bytes: budget for the sum of `sizer(value)` (None: unbounded).
+            A value larger than the whole budget is not stored.
+        sizer: size of a value in bytes (default: `default_sizer`)
+        shards: number of lock shards
+    """
+
+    def __init__(
+        self,
+        maxsize: int | None = 128,
+        ttl: float | None = None,
+        max_bytes: int | None = None,
+        sizer: Callable[[V], int] | None = None,
+        shards: int = 8,
+    ) -> None:
+        if shards <= 0:
+            raise ValueError("shards must be a positive integer")
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("maxsize must be non-negative")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.maxsize: int | None = maxsize
+        self.ttl: float | None = ttl
+        self.max_bytes: int | None = max_bytes
+        self.sizer: Callable[[V], int] = sizer or default_sizer
+        self._shards: list[_Shard] = [_Shard() for _ in range(shards)]
+        self._maxsize: float = math.inf if maxsize is None else maxsize
+        self._max_bytes: float = math.inf if max_bytes is None else max_bytes
+        # 조회할 때마다 올라가는 시계. shard 들의 LRU 항목 중 tick 이 가장 작은
+        # 것이 전체에서 가장 오래 안 쓴 항목이다
+        self._clock = itertools.count()
+        self._evict_lock = Lock()
+
+    def _shard(self, key: K) -> _Shard:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def get(self, key: K, default: Any = None) -> V | Any:
+        value = self.lookup(key)
+        return default if value is _MISSING else value
+
+    def lookup(self, key: K) -> V | Any:
+        # 값이 None 일 수 있으므로 없을 때는 _MISSING 을 돌려준다
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.entries.get(key)
+            if entry is None:
+                shard.misses += 1
+                return _MISSING
+            value, expires, size, _ = entry
+            if expires <= time.monotonic():
+                del shard.entries[key]
+                shard.bytes -= size
+                shard.expirations += 1
+                shard.misses += 1
+                return _MISSING
+            shard.entries[key] = (value, expires, size, next(self._clock))
+            shard.entries.move_to_end(key)
+            shard.hits += 1
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        size = self.sizer(value) if self.max_bytes is not None else 0
+        if size > self._max_bytes or self._maxsize == 0:
+            # 저장하지 않는 값이어도 예전 값은 남기지 않는다
+            self.invalidate(key)
+            return
+        expires = time.monotonic() + self.ttl if self.ttl is not None else math.inf
+        shard = self._shard(key)
+        with shard.lock:
+            old = shard.entries.pop(key, None)
+            if old is not None:
+                shard.bytes -= old[2]
+            shard.entries[key] = (value, expires, size, next(self._clock))
+            shard.bytes += size
+        # 다른 스레드가 정리 중이면 기다리지 않는다. 그 스레드가 lock 을 놓은 뒤
+        # 다시 확인하므로 넘친 상태로 남지 않는다
+        while self._over_budget() and self._evict_lock.acquire(blocking=False):
+            try:
+                self._evict()
+            finally:
+                self._evict_lock.release()
+
+    def _over_budget(self) -> bool:
+        if len(self) > self._maxsize:
+            return True
+        return (
+            self.max_bytes is not None
+            and sum(shard.bytes for shard in self._shards) > self._max_bytes
+        )
+
+    def _evict(self) -> None:
+        # _evict_lock 을 잡고 부른다. shard lock 은 한 번에 하나만 잡는다
+        # (set 과 lock 순서가 엇갈리지 않도록)
+        now = time.monotonic()
+        while self._over_budget():
+            victim: _Shard | None = None
+            oldest = math.inf
+            for shard in self._shards:
+                with shard.lock:
+                    if shard.entries:
+                        tick = next(iter(shard.entries.values()))[3]
+                        if tick < oldest:
+                            victim, oldest = shard, tick
+            if victim is None:
+                return
+            with victim.lock:
+                if not victim.entries:
+                    continue
+                _, (_, expires, size, _) = victim.entries.popitem(last=False)
+                victim.bytes -= size
+                if expires <= now:
+                    victim.expirations += 1
+                else:
+                    victim.evictions += 1
+
+    def invalidate(self, key: K) -> bool:
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.entries.pop(key, None)
+            if entry is None:
+                return False
+            shard.bytes -= entry[2]
+            return True
+
+    def clear(self) -> None:
+        for shard in self._shards:
+            with shard.lock:
+                shard.entries.clear()
+                shard.bytes = 0
+
+    def __len__(self) -> int:
+        return sum(len(shard.entries) for shard in self._shards)
+
+    def __contains__(self, key: K) -> bool:
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.entries.get(key)
+            return entry is not None and entry[1] > time.monotonic()
+
+    def stats(self) -> CacheStats:
+        return {
+            "hits": sum(shard.hits for shard in self._shards),
+            "misses": sum(shard.misses for shard in self._shards),
+            "evictions": sum(shard.evictions for shard in self._shards),
+            "expirations": sum(shard.expirations for shard in self._shards),
+            "currsize": len(self),
+            "bytes": sum(shard.bytes for shard in self._shards),
+            "maxsize": self.maxsize,
+            "max_bytes": self.max_bytes,
+            "ttl": self.ttl,
+        }
+
+
+def memoize(
+    maxsize: int | None = 128,
+    ttl: float | None = None,
+    max_bytes: int | None = None,
+    sizer: Callable[[Any], int] | None = None,
+    shards: int = 8,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Memoize a function in a `Cache`. Arguments may contain dicts, lists and
+    sets (see `freeze`).
+
+    The wrapper exposes ``cache``, ``cache_info()``, ``cache_clear()`` and
+    ``invalidate(*args, **kwargs)``. Concurrent misses on the same key may
+    each call the function; the last result is kept.
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if inspect.iscoroutinefunction(func):
+            raise TypeError("use async_memoize for coroutine functions")
+        cache: Cache[Hashable, Any] = Cache(maxsize, ttl, max_bytes, sizer, shards)
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = make_key(args, kwargs)
+            value = cache.lookup(key)
+            if value is _MISSING:
+                value = func(*args, **kwargs)
+                cache.set(key, value)
+            return value
+
+        def invalidate(*args: Any, **kwargs: Any) -> bool:
+            return cache.invalidate(make_key(args, kwargs))
+
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        wrapper.cache_info = cache.stats  # type: ignore[attr-defined]
+        wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+        wrapper.invalidate = invalidate  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+def async_memoize(
+    maxsize: int | None = 128,
+    ttl: float | None = None,
+    negative_ttl: float | None = None,
+    exceptions: tuple[type[Exception], ...] = (Exception,),
+    shards: int = 8,
+) -> Callable[
+    [Callable[..., Coroutine[Any, Any, Any]]], Callable[..., Coroutine[Any, Any, Any]]
+]:
+    """
+    Memoize a coroutine function by its awaited result.
+
+    Concurrent callers that miss on the same key share one in-flight call
+    (single-flight). A caller that is cancelled does not cancel the shared
+    call for the others.
+
+    Args:
+        maxsize, ttl, shards: see `Cache`
+        negative_ttl: also cache exceptions listed in `exceptions` for this
+            many seconds and re-raise them without calling (None: never)
+        exceptions: exception types eligible for negative caching
+
+    The wrapper exposes ``cache``, ``cache_info()``, ``cache_clear()`` and
+    ``invalidate(*args, **kwargs)``; invalidating a key that is being
+    computed makes the next caller start a fresh call.
+    """
+
+    def decorator(
+        func: Callable[..., Coroutine[Any, Any, Any]],
+    ) -> Callable[..., Coroutine[Any, Any, Any]]:
+        cache: Cache[Hashable, Any] = Cache(maxsize, ttl, shards=shards)
+        errors: Cache[Hashable, Exception] | None = (
+            Cache(maxsize, negative_ttl, shards=shards) if negative_ttl else None
+        )
+        in_flight: dict[Hashable, asyncio.Task[Any]] = {}
+        counters = {"coalesced": 0, "negative_hits": 0}
+
+        async def load(key: Hashable, args: Any, kwargs: Any) -> Any:
+            task = asyncio.current_task()
+            # 계산 중에 invalidate 된 key 는 결과를 저장하지 않는다
+            try:
+                value = await func(*args, **kwargs)
+            except exceptions as e:
+                if errors is not None and in_flight.get(key) is task:
+                    errors.set(key, e)
+                raise
+            else:
+                if in_flight.get(key) is task:
+                    cache.set(key, value)
+                return value
+            finally:
+                if in_flight.get(key) is task:
+                    del in_flight[key]
+
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = make_key(args, kwargs)
+            value = cache.lookup(key)
+            if value is not _MISSING:
+                return value
+            if errors is not None:
+                error = errors.lookup(key)
+                if error is not _MISSING:
+                    counters["negative_hits"] += 1
+                    raise error
+
+            task = in_flight.get(key)
+            if task is None:
+                task = in_flight[key] = asyncio.create_task(load(key, args, kwargs))
+            else:
+                counters["coalesced"] += 1
+            return await asyncio.shield(task)
+
+        def invalidate(*args: Any, **kwargs: Any) -> bool:
+            key = make_key(args, kwargs)
+            found = in_flight.pop(key, None) is not None
+            if errors is not None:
+                found = errors.invalidate(key) or found
+            return cache.invalidate(key) or found
+
+        def cache_clear() -> None:
+            in_flight.clear()
+            cache.clear()
+            if errors is not None:
+                errors.clear()
+
+        def cache_info() -> AsyncCacheStats:
+            return {
+                **cache.stats(),
+                "in_flight": len(in_flight),
+                "coalesced": counters["coalesced"],
+                "negative_hits": counters["negative_hits"],
+            }
+
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        wrapper.cache_info = cache_info  # type: ignore[attr-defined]
+        wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
+        wrapper.invalidate = invalidate  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+def ttl_cache(
+    ttl: float, maxsize: int | None = 128
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    return memoize(maxsize=maxsize, ttl=ttl)
+
+
+def size_cache(
+    max_bytes: int,
+    sizer: Callable[[Any], int] | None = None,
+    ttl: float | None = None,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    return memoize(maxsize=None, ttl=ttl, max_bytes=max_bytes, sizer=sizer)
+
+
+__all__ = [
+    "Cache",
+    "CacheStats",
+    "default_sizer",
+    "make_key",
+    "memoize",
+    "async_memoize",
+    "AsyncCacheStats",
+    "ttl_cache",
+    "size_cache",
+]
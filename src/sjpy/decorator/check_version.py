@@ -1,15 +1,17 @@
 from __future__ import annotations
 
+import importlib
 import warnings
 
 from typing import Literal, TypeVar, Any, cast, ParamSpec, TypedDict
 from collections.abc import Callable, Sequence
-from functools import wraps
+from functools import cache, wraps
 from importlib.metadata import version, PackageNotFoundError
 from packaging.specifiers import SpecifierSet
 from packaging.version import Version
 
 Action = Literal["error", "warn"]
+When = Literal["decoration", "first_call", "call"]
 P = ParamSpec("P")
 R = TypeVar("R")
 T = TypeVar("T")
@@ -23,36 +25,78 @@ class VersionRule(TypedDict, total=False):
     action: Action
 
 
-def _get_version(package_name: str) -> Version:
+# clear_version_cache 가 올리면 first_call 로 검사를 마친 함수들이 다시 검사한다
+_generation = 0
+
+
+@cache
+def _installed_version(package_name: str) -> Version | None:
+    # 없는 패키지도 캐시한다 (매번 site-packages 를 다시 훑지 않도록)
     try:
         return Version(version(package_name))
-    except PackageNotFoundError as e:
-        raise RuntimeError(f"Required package is not installed: {package_name}") from e
+    except PackageNotFoundError:
+        return None
 
 
-def check_version(
-    package_name: str,
-    *,
-    allowed: str | None = None,
-    blocked: str | None = None,
-    action: Action = "error",
-) -> None:
+def _get_version(package_name: str) -> Version:
+    installed = _installed_version(package_name)
+    if installed is None:
+        raise RuntimeError(f"Required package is not installed: {package_name}")
+    return installed
+
+
+@cache
+def _specifier_set(spec: str) -> SpecifierSet:
+    return SpecifierSet(spec)
+
+
+@cache
+def _version_messages(
+    package_name: str, allowed: str | None, blocked: str | None
+) -> tuple[str, ...]:
     installed = _get_version(package_name)
 
     messages: list[str] = []
 
-    if allowed is not None and installed not in SpecifierSet(allowed):
+    if allowed is not None and installed not in _specifier_set(allowed):
         messages.append(
             f"{package_name}=={installed} is not supported. "
             f"Required: {package_name}{allowed}"
         )
 
-    if blocked is not None and installed in SpecifierSet(blocked):
+    if blocked is not None and installed in _specifier_set(blocked):
         messages.append(
             f"{package_name}=={installed} is blocked. "
             f"Blocked: {package_name}{blocked}"
         )
 
+    return tuple(messages)
+
+
+def clear_version_cache() -> None:
+    """
+    Forget resolved versions and rule results, e.g. after installing or
+    upgrading packages at runtime. Functions and classes decorated with
+    ``when="first_call"`` check again on their next call.
+    """
+    global _generation
+    _installed_version.cache_clear()
+    _specifier_set.cache_clear()
+    _version_messages.cache_clear()
+    importlib.invalidate_caches()
+    _generation += 1
+
+
+def check_version(
+    package_name: str,
+    *,
+    allowed: str | None = None,
+    blocked: str | None = None,
+    action: Action = "error",
+) -> None:
+    """Results are cached per process; see `clear_version_cache`."""
+    messages = _version_messages(package_name, allowed, blocked)
+
     if not messages:
         return
 
@@ -66,11 +110,20 @@ def check_version(
         raise ValueError(f"Unknown action: {action}")
 
 
-def requires_versions(*rules: VersionRule) -> Callable[[T], T]:
+def requires_versions(
+    *rules: VersionRule, when: When = "first_call"
+) -> Callable[[T], T]:
     """
     Decorator for checking package versions before running a function
     or before initializing a class.
 
+    Args:
+        when: "decoration" checks once while decorating and leaves the target
+            unwrapped, "first_call" checks on the first call (again after
+            `clear_version_cache`) and then calls straight through, "call"
+            checks on every call. Rule results are cached per process in
+            every mode.
+
     Examples:
         @requires_versions({"package_name": "torch", "allowed": ">=2.1,<2.5"})
         def run(...):
@@ -80,26 +133,38 @@ def requires_versions(*rules: VersionRule) -> Callable[[T], T]:
         class MyModel:
             ...
     """
+    if when not in ("decoration", "first_call", "call"):
+        raise ValueError(f"Unknown when: {when}")
 
     def decorator(target: T) -> T:
-        if isinstance(target, type):
-            return cast(T, _decorate_class(target, rules))
+        if not callable(target):
+            raise TypeError("Target must be a class or a callable")
+
+        if when == "decoration":
+            for rule in rules:
+                check_version(**rule)
+            return target
 
-        if callable(target):
-            return cast(T, _decorate_function(target, rules))
+        if isinstance(target, type):
+            return cast(T, _decorate_class(target, rules, when))
 
-        raise TypeError("Target must be a class or a callable")
+        return cast(T, _decorate_function(target, rules, when))
 
     return decorator
 
 
-def _decorate_class(cls: C, rules: Sequence[VersionRule]) -> C:
+def _decorate_class(cls: C, rules: Sequence[VersionRule], when: When) -> C:
     original_init = cls.__init__
+    checked = -1
 
     @wraps(original_init)
     def wrapped_init(self: Any, *args: Any, **kwargs: Any) -> None:
-        for rule in rules:
-            check_version(**rule)
+        nonlocal checked
+        if checked != _generation:
+            for rule in rules:
+                check_version(**rule)
+            if when == "first_call":
+                checked = _generation
         original_init(self, *args, **kwargs)
 
     cls.__init__ = wrapped_init
@@ -107,15 +172,21 @@ def _decorate_class(cls: C, rules: Sequence[VersionRule]) -> C:
 
 
 def _decorate_function(
-    func: Callable[P, R], rules: Sequence[VersionRule]
+    func: Callable[P, R], rules: Sequence[VersionRule], when: When
 ) -> Callable[P, R]:
+    checked = -1
+
     @wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-        for rule in rules:
-            check_version(**rule)
+        nonlocal checked
+        if checked != _generation:
+            for rule in rules:
+                check_version(**rule)
+            if when == "first_call":
+                checked = _generation
         return func(*args, **kwargs)
 
     return wrapper
 
 
-__all__ = ["check_version", "requires_versions"]
+__all__ = ["check_version", "clear_version_cache", "requires_versions"]
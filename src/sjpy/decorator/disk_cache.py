@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+import inspect
+import os
+import pickle
+import struct
+import tempfile
+import time
+from collections.abc import Callable
+from functools import wraps
+from pathlib import Path
+from typing import Any, TypedDict
+
+import numpy as np
+
+from sjpy.decorator._keys import content_hash, make_cache_key
+from sjpy.file.lock import FileLock
+
+_NPY = ".npy"
+_PICKLE = ".pkl"
+_SIZE_FILE = ".size"
+_LOCK_FILE = ".lock"
+_TMP_PREFIX = ".tmp-"
+# 이보다 오래된 임시 파일은 죽은 writer 가 남긴 것으로 보고 지운다
+_STALE_TMP_SECONDS = 3600.0
+
+
+class DiskCacheStats(TypedDict):
+    hits: int
+    misses: int
+    entries: int
+    bytes: int
+    max_bytes: int | None
+
+
+def _atomic_write(path: Path, write: Callable[[Any], None]) -> int:
+    # 같은 디렉토리의 임시 파일에 쓴 뒤 os.replace (읽는 쪽은 완성된 파일만 본다)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=_TMP_PREFIX, suffix=path.suffix)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+            size = f.tell()
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+    return size
+
+
+class DiskCache:
+    """
+    Directory of memoized results shared by any number of processes.
+
+    Arrays without object fields are stored as ``.npy`` and loaded
+    memory-mapped (read-only) when `mmap` is set; other values are pickled.
+    Files are written atomically, a hit refreshes the file's mtime, and when
+    the total size passes `max_bytes` the least recently used files (and
+    temporary files left by killed writers) are removed under an
+    inter-process `FileLock`.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        max_bytes: int | None = None,
+        mmap: bool = True,
+    ) -> None:
+        self.directory: Path = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes: int | None = max_bytes
+        self.mmap: bool = mmap
+        self._lock = FileLock(self.directory / _LOCK_FILE)
+        self.hits: int = 0
+        self.misses: int = 0
+        if max_bytes is None:
+            # 한도 없이 쓰는 동안에는 크기를 세지 않으므로, 남은 값은 버리고
+            # 다음에 한도를 두고 열 때 다시 센다
+            (self.directory / _SIZE_FILE).unlink(missing_ok=True)
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        base = self.directory / key[:2] / key
+        return base.with_suffix(_NPY), base.with_suffix(_PICKLE)
+
+    def _entries(self) -> list[os.DirEntry[str]]:
+        entries: list[os.DirEntry[str]] = []
+        for sub in os.scandir(self.directory):
+            if sub.is_dir() and len(sub.name) == 2:
+                entries.extend(
+                    e
+                    for e in os.scandir(sub.path)
+                    if e.name.endswith((_NPY, _PICKLE)) and not e.name.startswith(".")
+                )
+        return entries
+
+    def load(self, key: str) -> tuple[bool, Any]:
+        npy, pkl = self._paths(key)
+        for path in (npy, pkl):
+            try:
+                if path is npy:
+                    value = np.load(path, mmap_mode="r" if self.mmap else None)
+                else:
+                    with path.open("rb") as f:
+                        value = pickle.load(f)
+            except FileNotFoundError:
+                continue
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+            self.hits += 1
+            return True, value
+        self.misses += 1
+        return False, None
+
+    def store(self, key: str, value: Any) -> Any:
+        """Write `value` and return it as a later `load` would: arrays come
+        back memory-mapped (read-only) when `mmap` is set."""
+        npy, pkl = self._paths(key)
+        npy.parent.mkdir(exist_ok=True)
+        is_array = isinstance(value, np.ndarray) and not value.dtype.hasobject
+        # 덮어쓰는 파일과, 자료형이 바뀌어 남은 다른 형식의 파일 크기를 뺀다
+        old = max(self._remove(pkl if is_array else npy), 0)
+        try:
+            old += (npy if is_array else pkl).stat().st_size
+        except FileNotFoundError:
+            pass
+        if is_array:
+            size = _atomic_write(
+                npy, lambda f: np.save(f, np.asarray(value), allow_pickle=False)
+            )
+        else:
+            size = _atomic_write(
+                pkl, lambda f: pickle.dump(value, f, pickle.HIGHEST_PROTOCOL)
+            )
+        if self.max_bytes is not None:
+            self._account(size - old)
+        if is_array and self.mmap:
+            try:
+                return np.load(npy, mmap_mode="r")
+            except FileNotFoundError:
+                # 다른 프로세스가 곧바로 지운 경우
+                view = np.asarray(value).view()
+                view.flags.writeable = False
+                return view
+        return value
+
+    def _remove(self, path: Path) -> int:
+        # 지운 파일의 크기 (없었으면 -1)
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except FileNotFoundError:
+            return -1
+        return size
+
+    def _account(self, delta: int) -> None:
+        # 전체 크기는 .size 파일에 누적하고, 한도를 넘을 때만 디렉토리를 훑어 정리한다
+        assert self.max_bytes is not None
+        size_path = self.directory / _SIZE_FILE
+        with self._lock:
+            try:
+                total = struct.unpack("<q", size_path.read_bytes())[0] + delta
+            except (FileNotFoundError, struct.error):
+                total = self.max_bytes + 1
+            if total > self.max_bytes or total < 0:
+                total = self._evict()
+            size_path.write_bytes(struct.pack("<q", total))
+
+    def _sweep_tmp(self) -> None:
+        cutoff = time.time() - _STALE_TMP_SECONDS
+        for sub in os.scandir(self.directory):
+            if not (sub.is_dir() and len(sub.name) == 2):
+                continue
+            for entry in os.scandir(sub.path):
+                if not entry.name.startswith(_TMP_PREFIX):
+                    continue
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                except FileNotFoundError:
+                    pass
+
+    def _evict(self) -> int:
+        assert self.max_bytes is not None
+        self._sweep_tmp()
+        files: list[tuple[float, int, str]] = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in files)
+        files.sort()
+        for _, size, path in files:
+            if total <= self.max_bytes:
+                break
+            try:
+                # 다른 프로세스가 mmap 으로 열고 있어도 POSIX 에서는 안전하다
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+        return total
+
+    def invalidate(self, key: str) -> bool:
+        removed = [self._remove(path) for path in self._paths(key)]
+        found = [size for size in removed if size >= 0]
+        if found and self.max_bytes is not None:
+            self._account(-sum(found))
+        return bool(found)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sweep_tmp()
+            for entry in self._entries():
+                try:
+                    os.unlink(entry.path)
+                except OSError:
+                    pass
+            (self.directory / _SIZE_FILE).unlink(missing_ok=True)
+
+    def stats(self) -> DiskCacheStats:
+        sizes = []
+        for entry in self._entries():
+            try:
+                sizes.append(entry.stat().st_size)
+            except FileNotFoundError:
+                pass
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(sizes),
+            "bytes": sum(sizes),
+            "max_bytes": self.max_bytes,
+        }
+
+
+def disk_cache(
+    directory: str | Path,
+    max_bytes: int | None = None,
+    mmap: bool = True,
+    version: str | None = None,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Persistent counterpart of `lru_dict_cache` for slow pure functions.
+
+    The key is a SHA-256 over the function's module and qualified name,
+    `version` (bump it when the function's output changes) and the
+    normalized arguments (`content_hash`). Concurrent misses in different
+    processes may compute the same value; the last atomic write wins.
+    A miss returns what a later hit would (arrays memory-mapped read-only
+    when `mmap` is set), not the object `func` returned.
+
+    The wrapper exposes ``cache`` (`DiskCache`), ``cache_key(*args,
+    **kwargs)``, ``cache_info()``, ``cache_clear()`` and
+    ``invalidate(*args, **kwargs)``. ``cache_clear`` empties the whole
+    directory, not only this function's entries.
+    """
+    cache = DiskCache(directory, max_bytes, mmap)
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if inspect.iscoroutinefunction(func):
+            raise TypeError("disk_cache does not support coroutine functions")
+        cache_key = make_cache_key(func, version)
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = cache_key(*args, **kwargs)
+            found, value = cache.load(key)
+            if found:
+                return value
+            return cache.store(key, func(*args, **kwargs))
+
+        def invalidate(*args: Any, **kwargs: Any) -> bool:
+            return cache.invalidate(cache_key(*args, **kwargs))
+
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        wrapper.cache_key = cache_key  # type: ignore[attr-defined]
+        wrapper.cache_info = cache.stats  # type: ignore[attr-defined]
+        wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+        wrapper.invalidate = invalidate  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+__all__ = [
+    "DiskCache",
+    "DiskCacheStats",
+    "content_hash",
+    "disk_cache",
+]
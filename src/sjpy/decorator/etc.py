@@ -1,158 +1,135 @@
 from __future__ import annotations
 
-import json
-
-from threading import Lock
-from typing import TypeVar, Any, cast, overload
+import inspect
+from typing import Any
 from collections.abc import Callable
 from functools import wraps, lru_cache
 
-C = TypeVar("C", bound=type[Any])
-
-
-class BaseSingletonMeta(type):
-    _instances: dict[type, object] = {}
-    _locks: dict[type, Lock] = {}
-    _meta_lock: Lock = Lock()
-
-    def _get_instance_lock(cls) -> Lock:
-        with cls._meta_lock:
-            if cls not in cls._locks:  # type: ignore
-                cls._locks[cls] = Lock()
-            return cls._locks[cls]
-
-
-class SingletonMeta(BaseSingletonMeta):
-    def __call__(cls, *args: Any, **kwargs: Any) -> object:
-        lock = cls._get_instance_lock()
-        with lock:
-            if cls not in cls._instances:  # type: ignore
-                cls._instances[cls] = type.__call__(cls, *args, **kwargs)
-            return cls._instances[cls]
-
-
-class StrictSingletonMeta(BaseSingletonMeta):
-    _init_args: dict[type, tuple[tuple[Any, ...], dict[str, Any]]] = {}
-
-    def __call__(cls, *args: Any, **kwargs: Any) -> object:
-        lock = cls._get_instance_lock()
-        with lock:
-            if cls not in cls._instances:  # type: ignore
-                obj = type.__call__(cls, *args, **kwargs)
-                cls._instances[cls] = obj
-                cls._init_args[cls] = (args, dict(kwargs))
-                return obj
-
-            old_args, old_kwargs = cls._init_args[cls]  # type: ignore
-            if old_args != args or old_kwargs != kwargs:
-                raise ValueError(
-                    f"Singleton class {cls.__name__} already instantiated with "
-                    f"different arguments: {old_args}, {old_kwargs} vs {args}, {kwargs}"
-                )
-
-            return cls._instances[cls]
-
-
-@overload
-def singleton(cls: C) -> C: ...
-@overload
-def singleton(*, strict_mode: bool = True) -> Callable[[C], C]: ...
-
-
-def singleton(
-    cls: C | None = None,
-    *,
-    strict_mode: bool = True,
-) -> C | Callable[[C], C]:
-    def wrap(target_cls: C) -> C:
-        cls_base: Any = target_cls
-        meta_base: Any = type(target_cls)
-
-        if strict_mode:
-
-            class CombinedMeta(StrictSingletonMeta, meta_base):  # type: ignore[misc]
-                pass
-
-        else:
-
-            class CombinedMeta(SingletonMeta, meta_base):  # type: ignore[misc]
-                pass
-
-        class SingletonWrapper(cls_base, metaclass=CombinedMeta):  # type: ignore[misc]
-            __singleton_strict_args__ = strict_mode
-
-        SingletonWrapper.__name__ = target_cls.__name__
-        SingletonWrapper.__qualname__ = target_cls.__qualname__
-        SingletonWrapper.__module__ = target_cls.__module__
-        SingletonWrapper.__doc__ = target_cls.__doc__
-
-        return cast(C, SingletonWrapper)
-
-    if cls is None:
-        return wrap
-
-    return wrap(cls)
+# 예전 위치에서 import 하던 코드를 위해 남겨 둔다
+from sjpy.decorator.singleton import (  # noqa: F401
+    BaseSingletonMeta,
+    SingletonMeta,
+    StrictSingletonMeta,
+    singleton,
+)
+
+# 자료형이 다르면 내용이 같아도 다른 key 가 되도록 붙이는 표식
+_DICT = object()
+_LIST = object()
+_SET = object()
+_ATOMIC: frozenset[type] = frozenset({str, int, float, bool, bytes, type(None)})
+
+
+def freeze(obj: Any) -> Any:
+    """Hashable stand-in for dicts, lists and sets, recursively. Dict and set
+    results do not depend on insertion order.
+
+    Equal inputs give equal results, and a dict never equals a list or tuple
+    with the same content. Other unhashable values still raise `TypeError`
+    when the key is hashed.
+    """
+    # 흔한 자료형은 type 비교로 먼저 처리하고, 원소가 스칼라면 재귀 호출을 건너뛴다
+    t = type(obj)
+    if t in _ATOMIC:
+        return obj
+    if t is dict:
+        return (
+            _DICT,
+            frozenset(
+                [(k, v if type(v) in _ATOMIC else freeze(v)) for k, v in obj.items()]
+            ),
+        )
+    if t is list:
+        return (_LIST, tuple([v if type(v) in _ATOMIC else freeze(v) for v in obj]))
+    if t is tuple:
+        return tuple([v if type(v) in _ATOMIC else freeze(v) for v in obj])
+    if isinstance(obj, dict):
+        return (_DICT, frozenset([(k, freeze(v)) for k, v in obj.items()]))
+    if isinstance(obj, list):
+        return (_LIST, tuple([freeze(v) for v in obj]))
+    if isinstance(obj, tuple):
+        return tuple([freeze(v) for v in obj])
+    if isinstance(obj, (set, frozenset)):
+        return (_SET, frozenset([freeze(v) for v in obj]))
+    return obj
+
+
+class _HashedArgs:
+    """lru_cache key: compared by the frozen arguments, but carries the
+    original ones so the wrapped function gets them unchanged on a miss. They
+    are dropped once the call returns, so cached entries do not keep them
+    alive."""
+
+    __slots__ = ("args", "hashvalue", "key", "kwargs")
+
+    def __init__(self, key: Any, args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+        self.key = key
+        self.hashvalue = hash(key)
+        self.args = args
+        self.kwargs = kwargs
+
+    def __hash__(self) -> int:
+        return self.hashvalue
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _HashedArgs) and self.key == other.key
 
 
 def lru_dict_cache(
-    maxsize: int = 128,
+    maxsize: int | None = 128,
+    identity: bool = False,
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    `functools.lru_cache` that also accepts dict / list / set arguments.
+
+    Args:
+        maxsize: see `functools.lru_cache`
+        identity: reuse the frozen key of an argument seen before by object
+            identity. Faster for the same large dict passed repeatedly, but
+            only safe if such arguments are not mutated between calls.
+    """
+
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        # 코루틴 객체가 캐시되어 두 번째 await 에서 실패하므로 막는다
+        if inspect.iscoroutinefunction(func):
+            raise TypeError("use sjpy.decorator.async_memoize for coroutine functions")
+
         @lru_cache(maxsize=maxsize)
-        def cached(
-            *args: Any,
-            __cache__arg_idx__: tuple[int, ...],
-            __cache__kwarg_keys__: tuple[str, ...],
-            **kwargs: Any,
-        ) -> Any:
-            _args: list[Any] = list(args)
-            for idx in __cache__arg_idx__:
-                _args[idx] = json.loads(_args[idx])
-
-            for key in __cache__kwarg_keys__:
-                v = kwargs[key]
-                assert isinstance(v, str)
-                kwargs[key] = json.loads(v)
-
-            # print(f"cache hit for {args} and {kwargs}")
-            value: Any = func(*args, **kwargs)
+        def cached(hashed: _HashedArgs) -> Any:
+            value: Any = func(*hashed.args, **hashed.kwargs)
             return value
 
+        # id(obj) -> (obj, frozen). obj 를 함께 보관해 id 가 재사용되지 않게 한다
+        frozen_by_id: dict[int, tuple[Any, Any]] = {}
+        id_limit = max(maxsize or 0, 128)
+
+        def _freeze(obj: Any) -> Any:
+            if not identity or not isinstance(obj, (dict, list, set)):
+                return freeze(obj)
+            hit = frozen_by_id.get(id(obj))
+            if hit is not None and hit[0] is obj:
+                return hit[1]
+            frozen = freeze(obj)
+            if len(frozen_by_id) >= id_limit:
+                frozen_by_id.clear()
+            frozen_by_id[id(obj)] = (obj, frozen)
+            return frozen
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            new_args: list[Any] = []
-            arg_idx: list[Any] = []
-            for i, arg in enumerate(args):
-                if isinstance(arg, dict):
-                    arg = json.dumps(arg, sort_keys=True)
-                    arg_idx.append(i)
-                new_args.append(arg)
-            _args: tuple[Any, ...] = tuple(new_args)
-            _arg_idx: tuple[int, ...] = tuple(arg_idx)
-
-            new_kwargs: dict[str, Any] = {}
-            kwarg_keys: list[str] = []
-            for k, v in kwargs.items():
-                if isinstance(v, dict):
-                    _v = json.dumps(v, sort_keys=True)
-                    kwarg_keys.append(k)
-                else:
-                    _v = v
-                new_kwargs[k] = _v
-            _kwargs: dict[str, Any] = new_kwargs
-            _kwarg_keys: tuple[str, ...] = tuple(kwarg_keys)
-
-            # print(
-            # f"cache miss for {args} with {arg_idx} and {kwargs} with keys {kwarg_keys}"
-            # )
-            value: Any = cached(
-                *_args,
-                __cache__arg_idx__=_arg_idx,
-                __cache__kwarg_keys__=_kwarg_keys,
-                **_kwargs,
-            )
+            key = tuple(_freeze(arg) for arg in args)
+            if kwargs:
+                key += (_DICT, *sorted((k, _freeze(v)) for k, v in kwargs.items()))
+            hashed = _HashedArgs(key, args, kwargs)
+            try:
+                value: Any = cached(hashed)
+            finally:
+                # lru_cache 가 key 로 보관하므로 원래 인자는 놓아 준다
+                hashed.args, hashed.kwargs = (), {}
             return value
 
+        wrapper.cache_info = cached.cache_info  # type: ignore[attr-defined]
+        wrapper.cache_clear = cached.cache_clear  # type: ignore[attr-defined]
         return wrapper
 
     return decorator
@@ -173,4 +150,4 @@ def generate_simple_decorator(
     return decorator
 
 
-__all__ = ["lru_dict_cache", "generate_simple_decorator"]
+__all__ = ["freeze", "lru_dict_cache", "generate_simple_decorator"]
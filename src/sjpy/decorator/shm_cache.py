@@ -0,0 +1,452 @@
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import tempfile
+import time
+import uuid
+from collections.abc import Callable
+from functools import wraps
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Any, Literal, TypedDict
+
+import numpy as np
+from typing_extensions import Self
+
+from sjpy.decorator._keys import make_cache_key
+from sjpy.file.lock import FileLock
+from sjpy.memory import attach_shared_memory
+
+_INDEX_FILE = "index.jsonl"
+_LOCK_FILE = ".lock"
+_SHM_DIR = Path("/dev/shm")
+# 기록 수가 살아 있는 항목의 2 배 (와 이 값) 를 넘으면 index 를 새로 쓴다
+_COMPACT_MIN_RECORDS = 1024
+
+
+class ShmEntry(TypedDict):
+    name: str
+    kind: Literal["ndarray", "pickle"]
+    # np.lib.format 의 dtype descr (구조체 dtype 은 field 목록)
+    dtype: Any
+    shape: list[int]
+    size: int
+    created: float
+
+
+class ShmCacheStats(TypedDict):
+    hits: int
+    misses: int
+    entries: int
+    bytes: int
+    max_bytes: int | None
+
+
+class SharedMemoryCache:
+    """
+    Cache whose values live in `multiprocessing.shared_memory` segments, so
+    worker processes read each other's results without copies.
+
+    The index (key -> segment name, dtype, shape) in `directory` is an
+    append-only JSON-lines log: writers holding a `FileLock` append put /
+    delete records and occasionally compact it (atomic replace), readers
+    never lock and only read the records added since their last look.
+    Arrays come back as read-only views of the segment, other values are
+    unpickled from it.
+
+    Create it in the parent before starting workers and pass it to them
+    (fork inheritance or pickling). The parent starts the resource tracker,
+    which the workers share: segments of a crashed worker stay usable, and
+    anything not unlinked is removed when the whole process tree exits.
+    Call `destroy` in the parent to remove everything earlier, and `sweep`
+    to unlink segments that never made it into the index.
+
+    Args:
+        directory: index location (None: a new temporary directory)
+        max_bytes: total segment size budget; oldest entries are unlinked
+            first (None: unbounded)
+    """
+
+    def __init__(
+        self, directory: str | Path | None = None, max_bytes: int | None = None
+    ) -> None:
+        if directory is None:
+            directory = tempfile.mkdtemp(prefix="sjpy-shm-")
+        self.directory: Path = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes: int | None = max_bytes
+        # 이 cache 가 만든 segment 를 /dev/shm 에서 구분하기 위한 prefix
+        self.prefix: str = (
+            "sjpy_"
+            + hashlib.sha1(str(self.directory.resolve()).encode()).hexdigest()[:8]
+        )
+        if os.name == "posix":
+            resource_tracker.ensure_running()
+        self._init_local()
+
+    def _init_local(self) -> None:
+        self._lock = FileLock(self.directory / _LOCK_FILE)
+        # index 는 log 순서 (= 추가된 순서) 를 유지한다
+        self._index: dict[str, ShmEntry] = {}
+        self._index_inode: int | None = None
+        self._index_offset: int = 0
+        self._index_records: int = 0
+        self._index_bytes: int = 0
+        # 반환한 view 가 살아 있는 동안 segment 를 닫을 수 없으므로 프로세스 안에서 유지
+        self._attached: dict[str, SharedMemory] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {
+            "directory": self.directory,
+            "max_bytes": self.max_bytes,
+            "prefix": self.prefix,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.directory = state["directory"]
+        self.max_bytes = state["max_bytes"]
+        self.prefix = state["prefix"]
+        self._init_local()
+
+    @property
+    def _index_path(self) -> Path:
+        return self.directory / _INDEX_FILE
+
+    def _reset_index(self, inode: int | None) -> None:
+        self._index = {}
+        self._index_inode = inode
+        self._index_offset = self._index_records = self._index_bytes = 0
+
+    def _apply(self, key: str, entry: ShmEntry | None) -> None:
+        old = self._index.pop(key, None)
+        if old is not None:
+            self._index_bytes -= old["size"]
+        if entry is not None:
+            self._index[key] = entry
+            self._index_bytes += entry["size"]
+        self._index_records += 1
+
+    def _read_index(self) -> dict[str, ShmEntry]:
+        # 마지막으로 읽은 뒤에 덧붙은 기록만 읽는다 (compaction 은 inode 를 바꾼다)
+        try:
+            stat = self._index_path.stat()
+        except FileNotFoundError:
+            self._reset_index(None)
+            return self._index
+        if stat.st_ino == self._index_inode and stat.st_size == self._index_offset:
+            return self._index
+        try:
+            f = self._index_path.open("rb")
+        except FileNotFoundError:
+            self._reset_index(None)
+            return self._index
+        with f:
+            inode = os.fstat(f.fileno()).st_ino
+            if inode != self._index_inode:
+                self._reset_index(inode)
+            f.seek(self._index_offset)
+            data = f.read()
+        # 쓰는 중인 마지막 줄은 다음에 읽는다
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            record = json.loads(line)
+            self._apply(record["key"], record["entry"])
+        self._index_offset += end
+        return self._index
+
+    def _append(self, records: list[tuple[str, ShmEntry | None]]) -> None:
+        # lock 을 잡고 _read_index 로 따라잡은 다음에 부른다
+        data = b"".join(
+            json.dumps({"key": key, "entry": entry}).encode() + b"\n"
+            for key, entry in records
+        )
+        fd = os.open(self._index_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            stat = os.fstat(fd)
+            if stat.st_ino != self._index_inode:
+                self._reset_index(stat.st_ino)
+            if stat.st_size > self._index_offset:
+                # 죽은 writer 가 남긴 불완전한 줄
+                os.ftruncate(fd, self._index_offset)
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+        for key, entry in records:
+            self._apply(key, entry)
+        self._index_offset += len(data)
+        if self._index_records > max(_COMPACT_MIN_RECORDS, 2 * len(self._index)):
+            self._write_index()
+
+    def _write_index(self) -> None:
+        # 살아 있는 항목만 새 파일에 쓰고 교체한다
+        data = b"".join(
+            json.dumps({"key": key, "entry": entry}).encode() + b"\n"
+            for key, entry in self._index.items()
+        )
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".index-")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            inode = os.fstat(f.fileno()).st_ino
+        os.replace(tmp, self._index_path)
+        self._index_inode = inode
+        self._index_offset = len(data)
+        self._index_records = len(self._index)
+
+    def _attach(self, name: str) -> SharedMemory:
+        shm = self._attached.get(name)
+        if shm is None:
+            shm = self._attached[name] = attach_shared_memory(name)
+        return shm
+
+    def _exists(self, name: str) -> bool:
+        # 이미 attach 한 segment 도 이름이 unlink 됐을 수 있으므로 /dev/shm 을 본다
+        if _SHM_DIR.is_dir():
+            return (_SHM_DIR / name).exists()
+        try:
+            self._attach(name)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def _value(self, entry: ShmEntry) -> Any:
+        buf = self._attach(entry["name"]).buf
+        assert buf is not None
+        if entry["kind"] == "ndarray":
+            array: np.ndarray[Any, Any] = np.ndarray(
+                tuple(entry["shape"]),
+                dtype=np.lib.format.descr_to_dtype(  # type: ignore[no-untyped-call]
+                    entry["dtype"]
+                ),
+                buffer=buf,
+            )
+            array.flags.writeable = False
+            return array
+        return pickle.loads(buf[: entry["size"]])
+
+    def load(self, key: str) -> tuple[bool, Any]:
+        entry = self._read_index().get(key)
+        if entry is not None:
+            try:
+                value = self._value(entry)
+            except FileNotFoundError:
+                # 다른 프로세스가 이미 unlink 한 segment
+                pass
+            else:
+                self.hits += 1
+                return True, value
+        self.misses += 1
+        return False, None
+
+    def store(self, key: str, value: Any) -> Any:
+        """Copy `value` into a new segment and index it. Returns the cached
+        value (the read-only shared view for arrays); if another process
+        stored the key first, its value is returned instead."""
+        if isinstance(value, np.ndarray) and not value.dtype.hasobject:
+            array = np.ascontiguousarray(value)
+            payload: Any = array
+            entry: ShmEntry = {
+                "name": "",
+                "kind": "ndarray",
+                "dtype": np.lib.format.dtype_to_descr(  # type: ignore[no-untyped-call]
+                    array.dtype
+                ),
+                "shape": list(array.shape),
+                "size": int(array.nbytes),
+                "created": 0.0,
+            }
+        else:
+            payload = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+            entry = {
+                "name": "",
+                "kind": "pickle",
+                "dtype": "",
+                "shape": [],
+                "size": len(payload),
+                "created": 0.0,
+            }
+        if self.max_bytes is not None and entry["size"] > self.max_bytes:
+            return value
+
+        name = f"{self.prefix}_{uuid.uuid4().hex[:16]}"
+        shm = SharedMemory(name=name, create=True, size=max(entry["size"], 1))
+        buf = shm.buf
+        assert buf is not None
+        if entry["kind"] == "ndarray":
+            np.ndarray(payload.shape, dtype=payload.dtype, buffer=buf)[...] = payload
+        else:
+            buf[: entry["size"]] = payload
+        self._attached[name] = shm
+        entry["name"] = name
+        entry["created"] = time.time()
+
+        evicted: list[str] = []
+        with self._lock:
+            index = self._read_index()
+            existing = index.get(key)
+            if existing is not None and not self._exists(existing["name"]):
+                # index 에는 남았지만 segment 가 사라졌다 (예: resource tracker)
+                evicted.append(existing["name"])
+                self._append([(key, None)])
+                existing = None
+            if existing is None:
+                keys = self._evict(entry["size"])
+                evicted += [index[k]["name"] for k in keys]
+                self._append([(k, None) for k in keys] + [(key, entry)])
+        if existing is not None:
+            # 다른 워커가 먼저 저장했다
+            evicted = [name]
+            entry = existing
+        for old in evicted:
+            self._unlink(old)
+        try:
+            return self._value(entry)
+        except FileNotFoundError:
+            return value
+
+    def _evict(self, size: int) -> list[str]:
+        # `size` 바이트를 더 넣으려면 지워야 하는 key, 오래된 것부터
+        if self.max_bytes is None:
+            return []
+        total = self._index_bytes + size
+        keys: list[str] = []
+        for key, entry in self._index.items():
+            if total <= self.max_bytes:
+                break
+            total -= entry["size"]
+            keys.append(key)
+        return keys
+
+    def _unlink(self, name: str) -> None:
+        shm = self._attached.pop(name, None)
+        try:
+            if shm is None:
+                shm = attach_shared_memory(name)
+            # 반환한 view 가 남아 있으면 close 는 실패하지만 unlink 는 가능하다
+            try:
+                shm.close()
+            except BufferError:
+                self._attached[name] = shm
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+    def invalidate(self, key: str) -> bool:
+        with self._lock:
+            entry = self._read_index().get(key)
+            if entry is None:
+                return False
+            self._append([(key, None)])
+        self._unlink(entry["name"])
+        return True
+
+    def sweep(self, grace: float = 60.0) -> list[str]:
+        """Unlink this cache's segments that are not in the index and are
+        older than `grace` seconds, e.g. left by a worker that crashed
+        between creating and indexing one. Needs ``/dev/shm`` (Linux)."""
+        if not _SHM_DIR.is_dir():
+            return []
+        removed: list[str] = []
+        now = time.time()
+        with self._lock:
+            indexed = {e["name"] for e in self._read_index().values()}
+            for path in _SHM_DIR.glob(f"{self.prefix}_*"):
+                try:
+                    old = now - path.stat().st_mtime > grace
+                except FileNotFoundError:
+                    continue
+                if path.name not in indexed and old:
+                    self._unlink(path.name)
+                    removed.append(path.name)
+        return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            names = [e["name"] for e in self._read_index().values()]
+            self._reset_index(None)
+            self._write_index()
+        for name in names:
+            self._unlink(name)
+
+    def destroy(self) -> None:
+        """Unlink every segment and remove the index directory."""
+        self.clear()
+        self.sweep(grace=0.0)
+        for shm in self._attached.values():
+            try:
+                shm.close()
+            except BufferError:
+                pass
+        self._attached.clear()
+        for path in (self._index_path, self.directory / _LOCK_FILE):
+            path.unlink(missing_ok=True)
+        try:
+            self.directory.rmdir()
+        except OSError:
+            pass
+
+    def stats(self) -> ShmCacheStats:
+        index = self._read_index()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(index),
+            "bytes": self._index_bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.destroy()
+
+
+def shm_cache(
+    cache: SharedMemoryCache, version: str | None = None
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Memoize a function in a `SharedMemoryCache`, keyed like `disk_cache`.
+    Array results are returned as read-only shared views, also on a miss.
+
+    The wrapper exposes ``cache``, ``cache_info()``, ``cache_clear()`` and
+    ``invalidate(*args, **kwargs)``.
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if inspect.iscoroutinefunction(func):
+            raise TypeError("shm_cache does not support coroutine functions")
+        cache_key = make_cache_key(func, version)
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = cache_key(*args, **kwargs)
+            found, value = cache.load(key)
+            if found:
+                return value
+            return cache.store(key, func(*args, **kwargs))
+
+        def invalidate(*args: Any, **kwargs: Any) -> bool:
+            return cache.invalidate(cache_key(*args, **kwargs))
+
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        wrapper.cache_key = cache_key  # type: ignore[attr-defined]
+        wrapper.cache_info = cache.stats  # type: ignore[attr-defined]
+        wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+        wrapper.invalidate = invalidate  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+__all__ = [
+    "SharedMemoryCache",
+    "ShmCacheStats",
+    "shm_cache",
+]
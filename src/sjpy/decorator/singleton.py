@@ -1,31 +1,76 @@
 from __future__ import annotations
 
 
+import os
+import time
 from threading import Lock
-from typing import TypeVar, Any, overload, cast
+from typing import TypeVar, Any, overload, cast, TypedDict
 from collections.abc import Callable
 
 C = TypeVar("C", bound=type[Any])
 
+_MISSING: Any = object()
+
+
+class SingletonInfo(TypedDict):
+    cls: type
+    name: str
+    strict: bool
+    reset_on_fork: bool
+    instantiated: bool
+    pid: int | None  # 인스턴스를 만든 프로세스 (fork 로 물려받았으면 부모)
+    created_at: float | None
+    init_seconds: float | None
+
 
 class BaseSingletonMeta(type):
     _instances: dict[type, object] = {}
     _locks: dict[type, Lock] = {}
     _meta_lock: Lock = Lock()
+    # 생성된 singleton 클래스 (순서 유지) 와 생성 기록 (pid, time.time(), 초)
+    _classes: dict[type, None] = {}
+    _created: dict[type, tuple[int, float, float]] = {}
+
+    def __init__(cls, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        with BaseSingletonMeta._meta_lock:
+            BaseSingletonMeta._classes[cls] = None
 
     def _get_instance_lock(cls) -> Lock:
+        lock = cls._locks.get(cls)
+        if lock is not None:
+            return lock
         with cls._meta_lock:
             if cls not in cls._locks:  # pyright: ignore[reportUnnecessaryContains]
                 cls._locks[cls] = Lock()
             return cls._locks[cls]
 
+    def _create(cls, *args: Any, **kwargs: Any) -> object:
+        start = time.perf_counter()
+        obj = type.__call__(cls, *args, **kwargs)
+        cls._created[cls] = (os.getpid(), time.time(), time.perf_counter() - start)
+        return obj
+
+    def _clear_instance(cls) -> bool:
+        with cls._get_instance_lock():
+            # strict 의 _init_args 는 다음 생성 때 덮어쓴다
+            found = cls._instances.pop(cls, _MISSING) is not _MISSING
+            cls._created.pop(cls, None)
+            return found
+
 
 class SingletonMeta(BaseSingletonMeta):
     def __call__(cls, *args: Any, **kwargs: Any) -> object:
+        # 생성된 뒤에는 잠금 없이 반환한다 (dict 조회는 원자적이고, 인스턴스는
+        # 생성이 끝난 다음에만 _instances 에 들어간다)
+        instance = cls._instances.get(cls, _MISSING)
+        if instance is not _MISSING:
+            return instance
+
         lock = cls._get_instance_lock()
         with lock:
             if cls not in cls._instances:  # pyright: ignore[reportUnnecessaryContains]
-                cls._instances[cls] = type.__call__(cls, *args, **kwargs)
+                cls._instances[cls] = cls._create(*args, **kwargs)
             return cls._instances[cls]
 
 
@@ -33,33 +78,123 @@ class StrictSingletonMeta(BaseSingletonMeta):
     _init_args: dict[type, tuple[tuple[Any, ...], dict[str, Any]]] = {}
 
     def __call__(cls, *args: Any, **kwargs: Any) -> object:
+        instance = cls._instances.get(cls, _MISSING)
+        init_args = cls._init_args.get(cls)
+        if instance is not _MISSING and init_args is not None:
+            # 같은 객체를 다시 넘기는 경우가 대부분이라 == 는 원소의 identity
+            # 비교로 끝난다 (hash 를 계산하는 것보다 싸다)
+            old_args, old_kwargs = init_args
+            if old_args == args and old_kwargs == kwargs:
+                return instance
+            raise ValueError(
+                f"Singleton class {cls.__name__} already instantiated with "
+                f"different arguments: {old_args}, {old_kwargs} vs {args}, {kwargs}"
+            )
+
         lock = cls._get_instance_lock()
         with lock:
             if cls not in cls._instances:  # pyright: ignore[reportUnnecessaryContains]
-                obj = type.__call__(cls, *args, **kwargs)
-                cls._instances[cls] = obj
+                obj = cls._create(*args, **kwargs)
+                # _init_args 를 먼저 채워야 fast path 가 항상 찾을 수 있다
                 cls._init_args[cls] = (args, dict(kwargs))
+                cls._instances[cls] = obj
                 return obj
 
-            old_args, old_kwargs = cls._init_args[cls]  # type: ignore[unused-ignore]
-            if old_args != args or old_kwargs != kwargs:
-                raise ValueError(
-                    f"Singleton class {cls.__name__} already instantiated with "
-                    f"different arguments: {old_args}, {old_kwargs} vs {args}, {kwargs}"
-                )
-
-            return cls._instances[cls]
+        return cls(*args, **kwargs)
+
+
+def singletons() -> list[SingletonInfo]:
+    """Every singleton class defined so far, with its creation record."""
+    with BaseSingletonMeta._meta_lock:
+        classes = list(BaseSingletonMeta._classes)
+    infos: list[SingletonInfo] = []
+    for cls in classes:
+        created = BaseSingletonMeta._created.get(cls)
+        infos.append(
+            {
+                "cls": cls,
+                "name": f"{cls.__module__}.{cls.__qualname__}",
+                "strict": isinstance(cls, StrictSingletonMeta),
+                "reset_on_fork": getattr(cls, "__singleton_reset_on_fork__", False),
+                "instantiated": cls in BaseSingletonMeta._instances,
+                "pid": created[0] if created else None,
+                "created_at": created[1] if created else None,
+                "init_seconds": created[2] if created else None,
+            }
+        )
+    return infos
+
+
+def clear_singletons(*classes: type) -> int:
+    """
+    Drop the instances of `classes` (all singletons if none are given) so
+    the next call creates them again, e.g. between tests or on a warm
+    restart. Returns the number of instances dropped.
+
+    Code still holding an old instance keeps using it.
+    """
+    if not classes:
+        with BaseSingletonMeta._meta_lock:
+            classes = tuple(BaseSingletonMeta._classes)
+    dropped = 0
+    for cls in classes:
+        if not isinstance(cls, BaseSingletonMeta):
+            raise TypeError(f"{cls!r} is not a singleton class")
+        dropped += cls._clear_instance()
+    return dropped
+
+
+def _before_fork() -> None:
+    BaseSingletonMeta._meta_lock.acquire()
+
+
+def _after_fork_in_parent() -> None:
+    BaseSingletonMeta._meta_lock.release()
+
+
+def _after_fork_in_child() -> None:
+    # 다른 스레드가 잡고 있던 lock 이 잠긴 채로 복사되므로 모두 새로 만든다
+    BaseSingletonMeta._meta_lock = Lock()
+    BaseSingletonMeta._locks.clear()
+    for cls in list(BaseSingletonMeta._instances):
+        if getattr(cls, "__singleton_reset_on_fork__", False):
+            del BaseSingletonMeta._instances[cls]
+            BaseSingletonMeta._created.pop(cls, None)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        before=_before_fork,
+        after_in_parent=_after_fork_in_parent,
+        after_in_child=_after_fork_in_child,
+    )
 
 
 @overload
 def singleton(cls: C) -> C: ...
 @overload
-def singleton(*, strict_mode: bool = True) -> Callable[[C], C]: ...
+def singleton(
+    *, strict_mode: bool = True, reset_on_fork: bool = False
+) -> Callable[[C], C]: ...
 def singleton(
     cls: C | None = None,
     *,
     strict_mode: bool = True,
+    reset_on_fork: bool = False,
 ) -> C | Callable[[C], C]:
+    """
+    Make a class a singleton. The instance is created lazily, once, by the
+    first call (thread-safe), and its construction time is recorded (see
+    `singletons`).
+
+    Args:
+        strict_mode: raise ValueError when later calls pass different
+            arguments than the first one
+        reset_on_fork: forget the instance in a child process after
+            ``os.fork`` so the child creates its own (e.g. model handles,
+            connections). Locks are always reset in the child.
+    """
+
     def wrap(target_cls: C) -> C:
         cls_base: Any = target_cls
         meta_base: Any = type(target_cls)
@@ -78,6 +213,7 @@ def singleton(
 
         class SingletonWrapper(cls_base, metaclass=CombinedMeta):  # type: ignore[misc]
             __singleton_strict_args__ = strict_mode
+            __singleton_reset_on_fork__ = reset_on_fork
 
         SingletonWrapper.__name__ = target_cls.__name__
         SingletonWrapper.__qualname__ = target_cls.__qualname__
@@ -92,4 +228,4 @@ def singleton(
     return wrap(cls)
 
 
-__all__ = ["singleton"]
+__all__ = ["SingletonInfo", "singleton", "singletons", "clear_singletons"]
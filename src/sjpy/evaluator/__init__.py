@@ -1,19 +1,73 @@
 # sjpy/evaluator/__init__.py
 
+from sjpy.evaluator.corpus import (
+    LatencyRecord,
+    evaluate_corpus,
+    read_latency_records,
+    score_records,
+    summarize_results,
+)
 from sjpy.evaluator.latency_scorer import (
     AL_score,
+    AL_score_batch,
     AP_score,
+    AP_score_batch,
     DAL_score,
+    DAL_score_batch,
     LAAL_score,
+    LAAL_score_batch,
+    LatencyScores,
+    StreamingLatencyScorer,
     average_latency,
+    average_latency_batch,
+    pack_delays,
+)
+from sjpy.evaluator.time_checker import (
+    SharedTimeCollector,
+    TimeChecker,
+    TimeSnapshot,
+    default_time_bin_edges,
+)
+from sjpy.evaluator.wer import (
+    ErrorCounts,
+    ErrorRate,
+    align,
+    character_error_rate,
+    corpus_error_rate,
+    corpus_error_rates,
+    edit_distance,
+    word_error_rate,
 )
-from sjpy.evaluator.time_checker import TimeChecker
 
 __all__ = [
     "TimeChecker",
+    "TimeSnapshot",
+    "SharedTimeCollector",
+    "default_time_bin_edges",
     "AL_score",
     "LAAL_score",
     "DAL_score",
     "AP_score",
     "average_latency",
+    "LatencyScores",
+    "StreamingLatencyScorer",
+    "pack_delays",
+    "AL_score_batch",
+    "LAAL_score_batch",
+    "DAL_score_batch",
+    "AP_score_batch",
+    "average_latency_batch",
+    "LatencyRecord",
+    "read_latency_records",
+    "score_records",
+    "summarize_results",
+    "evaluate_corpus",
+    "ErrorCounts",
+    "ErrorRate",
+    "align",
+    "edit_distance",
+    "word_error_rate",
+    "character_error_rate",
+    "corpus_error_rates",
+    "corpus_error_rate",
 ]
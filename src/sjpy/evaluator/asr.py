@@ -60,13 +60,106 @@ def compute_average_proportion(coverage: npt.NDArray[Any], L: float) -> float |
     return ap
 
 
+def _validate_L(L: float) -> None:
+    if not np.isfinite(L):
+        raise ValueError("L must be a finite value")
+    if L <= 0:
+        raise ValueError("L must be a positive value")
+
+
+class _CoverageBuffer:
+    """Growable coverage array with prefix sums.
+
+    Capacity doubles when full, so appends are amortized O(len(tail)), and only
+    the appended tail is validated against what is already stored. `L` is
+    passed to each metric call, so changing it later is reflected.
+    """
+
+    def __init__(self, capacity: int = 64) -> None:
+        self._data: npt.NDArray[np.float32] = np.empty(capacity, dtype=np.float32)
+        self._cumsum: npt.NDArray[np.float64] = np.empty(capacity, dtype=np.float64)
+        self._size: int = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def view(self) -> npt.NDArray[np.float32]:
+        # 쓰기를 허용하면 prefix sum 과 어긋난다
+        view = self._data[: self._size]
+        view.flags.writeable = False
+        return view
+
+    def _reserve(self, size: int) -> None:
+        if size <= self._data.size:
+            return
+        capacity = max(size, self._data.size * 2)
+        data = np.empty(capacity, dtype=np.float32)
+        data[: self._size] = self._data[: self._size]
+        cumsum = np.empty(capacity, dtype=np.float64)
+        cumsum[: self._size] = self._cumsum[: self._size]
+        self._data, self._cumsum = data, cumsum
+
+    def append(self, coverage: npt.NDArray[Any]) -> None:
+        tail = np.asarray(coverage, dtype=np.float32)
+        if tail.ndim != 1:
+            raise ValueError("coverage must be a 1-dimensional array")
+        if tail.size == 0:
+            return
+        if not np.isfinite(tail).all():
+            raise ValueError("coverage must contain only finite values")
+        # 단조 비감소: tail 내부와, 이미 저장된 마지막 값과의 경계만 확인
+        if not np.all(tail[1:] >= tail[:-1]) or (
+            self._size > 0 and tail[0] < self._data[self._size - 1]
+        ):
+            raise ValueError("coverage must be a non-decreasing sequence")
+
+        start, end = self._size, self._size + tail.size
+        self._reserve(end)
+        self._data[start:end] = tail
+        np.cumsum(tail, dtype=np.float64, out=self._cumsum[start:end])
+        if start > 0:
+            self._cumsum[start:end] += self._cumsum[start - 1]
+        self._size = end
+
+    def prefix_sum(self, count: int) -> float:
+        return float(self._cumsum[count - 1]) if count > 0 else 0.0
+
+    def _check_L(self, L: float) -> None:
+        _validate_L(L)
+        # 단조 비감소이므로 마지막 값이 최댓값이다
+        if self._size > 0 and self._data[self._size - 1] > L:
+            raise ValueError("all elements in coverage must be less than or equal to L")
+
+    def average_lagging(self, L: float) -> float | None:
+        self._check_L(L)
+        if self._size == 0:
+            return None
+
+        J = self._size
+        idx = int(np.searchsorted(self.view(), L, side="left"))
+        tau = int(idx + 1) if idx < J else J
+        # sum_{j=1..tau} (c_j - (j - 1) * L / J)
+        offset = (L / J) * tau * (tau - 1) / 2
+        return (self.prefix_sum(tau) - offset) / tau
+
+    def average_proportion(self, L: float) -> float | None:
+        self._check_L(L)
+        if self._size == 0:
+            return None
+        return self.prefix_sum(self._size) / (L * self._size)
+
+
 @deprecated("Use sjpy.evaluator.latency_scorer instead.")
 class TimeEvaluator:
     def __init__(self, L: float) -> None:
         self.times: list[float] = []
-        self.coverages: npt.NDArray[np.float32] = np.asarray([], dtype=np.float32)
+        self._coverage: _CoverageBuffer = _CoverageBuffer()
         self.L: float = L
 
+    @property
+    def coverages(self) -> npt.NDArray[np.float32]:
+        return self._coverage.view()
+
     @contextmanager
     def timeit(self) -> Generator[None, None, None]:
         start = time.time()
@@ -76,8 +169,7 @@ class TimeEvaluator:
             self.times.append(time.time() - start)
 
     def add_coverage(self, coverage: npt.NDArray[Any]) -> None:
-        coverage = np.asarray(coverage, dtype=np.float32)
-        self.coverages = np.concatenate([self.coverages, coverage], axis=0)
+        self._coverage.append(coverage)
 
     def metric(self) -> dict[str, Any]:
         return {
@@ -87,14 +179,10 @@ class TimeEvaluator:
         }
 
     def get_avg_lagging(self) -> float | None:
-        return compute_average_lagging(  # pyright: ignore[reportDeprecated]
-            self.coverages, self.L
-        )
+        return self._coverage.average_lagging(self.L)
 
     def get_avg_proportion(self) -> float | None:
-        return compute_average_proportion(  # pyright: ignore[reportDeprecated]
-            self.coverages, self.L
-        )
+        return self._coverage.average_proportion(self.L)
 
 
 @deprecated("Use sjpy.evaluator.latency_scorer instead.")
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import itertools
+import json
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, BinaryIO, TypedDict
+
+import numpy as np
+from tqdm import tqdm
+
+from sjpy.evaluator.latency_scorer import (
+    AL_score_batch,
+    AP_score_batch,
+    DAL_score_batch,
+    LAAL_score_batch,
+    average_latency_batch,
+    pack_delays,
+)
+from sjpy.statistics import DistributionSummary, summarize_distribution
+
+METRICS: tuple[str, ...] = ("AL", "LAAL", "DAL", "AP", "average_latency")
+
+RecordTuple = tuple[Sequence[float], int, "int | None"]
+
+
+class LatencyRecord(TypedDict, total=False):
+    id: Any
+    delays: Sequence[float]
+    source_length: int
+    target_length: int | None
+
+
+class Checkpoint(TypedDict):
+    done: int
+    offset: int
+
+
+def read_latency_records(path: str | Path) -> Iterator[LatencyRecord]:
+    with Path(path).open("r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record: LatencyRecord = json.loads(line)
+                yield record
+
+
+def _as_record(record: LatencyRecord | RecordTuple) -> LatencyRecord:
+    if isinstance(record, dict):
+        return record
+    delays, source_length, target_length = record
+    return {
+        "delays": delays,
+        "source_length": source_length,
+        "target_length": target_length,
+    }
+
+
+def score_records(
+    records: Sequence[LatencyRecord | RecordTuple],
+) -> list[dict[str, Any]]:
+    _records = [_as_record(r) for r in records]
+    results: list[dict[str, Any]] = [
+        {"id": r.get("id"), **dict.fromkeys(METRICS)} for r in _records
+    ]
+    # delays 가 비어 있는 레코드는 점수 없이 그대로 둔다
+    valid = [i for i, r in enumerate(_records) if len(r["delays"]) > 0]
+    if not valid:
+        return results
+
+    flat, offsets = pack_delays([_records[i]["delays"] for i in valid])
+    source = np.array([_records[i]["source_length"] for i in valid], dtype=np.float64)
+    lengths = np.diff(offsets)
+    target = np.array(
+        [
+            t if (t := _records[i].get("target_length")) is not None else lengths[k]
+            for k, i in enumerate(valid)
+        ],
+        dtype=np.float64,
+    )
+
+    scores = {
+        "AL": AL_score_batch(flat, offsets, source, target),
+        "LAAL": LAAL_score_batch(flat, offsets, source, target),
+        "DAL": DAL_score_batch(flat, offsets, source),
+        "AP": AP_score_batch(flat, offsets, source, target),
+        "average_latency": average_latency_batch(flat, offsets),
+    }
+    for k, i in enumerate(valid):
+        for name in METRICS:
+            results[i][name] = float(scores[name][k])
+    return results
+
+
+def _checkpoint_path(output_path: Path) -> Path:
+    return output_path.with_name(output_path.name + ".ckpt")
+
+
+def _load_checkpoint(output_path: Path) -> Checkpoint:
+    path = _checkpoint_path(output_path)
+    if not path.exists():
+        return {"done": 0, "offset": 0}
+    checkpoint: Checkpoint = json.loads(path.read_text(encoding="utf-8"))
+    return checkpoint
+
+
+def _save_checkpoint(output_path: Path, checkpoint: Checkpoint) -> None:
+    path = _checkpoint_path(output_path)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(checkpoint), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def summarize_results(output_path: str | Path) -> dict[str, DistributionSummary]:
+    values: dict[str, list[float]] = {name: [] for name in METRICS}
+    with Path(output_path).open("r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            result = json.loads(line)
+            for name in METRICS:
+                if result[name] is not None:
+                    values[name].append(result[name])
+    return {name: summarize_distribution(v) for name, v in values.items()}
+
+
+def evaluate_corpus(
+    records: Iterable[LatencyRecord | RecordTuple] | str | Path,
+    output_path: str | Path,
+    *,
+    workers: int | None = None,
+    chunk_size: int = 1024,
+    resume: bool = True,
+    verbose: bool = True,
+) -> dict[str, DistributionSummary]:
+    """
+    Score a corpus of latency records and stream per-record results to a
+    JSONL file, then summarize every metric over the whole file.
+
+    Args:
+        records: JSONL path or iterable of `LatencyRecord` dicts /
+            `(delays, source_length, target_length)` tuples
+        output_path: JSONL file receiving one result per record, in input order
+        workers: process pool size (None: os.cpu_count(), 0: score in-process)
+        chunk_size: records per task sent to a worker
+        resume: continue after the last checkpointed chunk instead of
+            starting over. Input order must be the same as in the first run.
+        verbose: show tqdm progress bar
+
+    Returns:
+        `DistributionSummary` per metric (AL, LAAL, DAL, AP, average_latency).
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if isinstance(records, (str, Path)):
+        records = read_latency_records(records)
+
+    checkpoint: Checkpoint = {"done": 0, "offset": 0}
+    if resume:
+        checkpoint = _load_checkpoint(output_path)
+    else:
+        _checkpoint_path(output_path).unlink(missing_ok=True)
+
+    # 체크포인트 이후에 쓰였지만 확정되지 않은 결과는 버린다
+    with output_path.open("ab") as f:
+        f.truncate(checkpoint["offset"])
+
+    it = itertools.islice(iter(records), checkpoint["done"], None)
+    chunks = iter(lambda: list(itertools.islice(it, chunk_size)), [])
+
+    pbar = tqdm(
+        initial=checkpoint["done"],
+        unit="record",
+        desc=f"Evaluating {output_path.name}",
+        dynamic_ncols=True,
+        disable=not verbose,
+    )
+
+    def _write(f: BinaryIO, results: list[dict[str, Any]]) -> None:
+        f.writelines(
+            (json.dumps(result, ensure_ascii=False) + "\n").encode("utf-8")
+            for result in results
+        )
+        f.flush()
+        os.fsync(f.fileno())
+        checkpoint["done"] += len(results)
+        checkpoint["offset"] = f.tell()
+        _save_checkpoint(output_path, checkpoint)
+        pbar.update(len(results))
+
+    try:
+        with output_path.open("ab") as f:
+            if workers == 0:
+                for chunk in chunks:
+                    _write(f, score_records(chunk))
+            else:
+                max_workers = workers or os.cpu_count() or 1
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    # 진행 중인 chunk 수를 제한해 메모리를 묶고, 결과는 순서대로 기록
+                    pending: deque[Future[list[dict[str, Any]]]] = deque()
+                    for chunk in chunks:
+                        pending.append(executor.submit(score_records, chunk))
+                        if len(pending) >= max_workers * 2:
+                            _write(f, pending.popleft().result())
+                    for future in pending:
+                        _write(f, future.result())
+    finally:
+        pbar.close()
+
+    return summarize_results(output_path)
+
+
+__all__ = [
+    "LatencyRecord",
+    "read_latency_records",
+    "score_records",
+    "summarize_results",
+    "evaluate_corpus",
+]
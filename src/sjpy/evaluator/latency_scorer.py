@@ -16,7 +16,11 @@
 # See LICENSES/CC-BY-SA-4.0.txt for the full license text.
 # Source revision: 536de8253b82d805c9845440169a5010ff507357
 
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
+from typing import TypedDict
+
+import numpy as np
+import numpy.typing as npt
 
 
 def AL_score(
@@ -102,4 +106,283 @@ def average_latency(delays: Sequence[float]) -> float:
     return sum(delays) / len(delays)
 
 
-__all__ = ["AL_score", "LAAL_score", "DAL_score", "AP_score", "average_latency"]
+class LatencyScores(TypedDict):
+    AL: float | None
+    LAAL: float | None
+    DAL: float | None
+    AP: float | None
+
+
+class StreamingLatencyScorer:
+    """Incremental AL/LAAL/DAL/AP for delays that arrive one token at a time.
+
+    Each `update` is O(1) and every score equals the matching `*_score`
+    function applied to the delays seen so far. AL/LAAL stop accumulating once
+    a delay reaches `source_length`, as the offline scorers do.
+
+    DAL's recurrence depends on gamma = len(delays) / source_length, so it is
+    O(1) only when the final length is known up front (`target_length`); until
+    that many delays arrived it reports the prefix under the final gamma.
+    Without `target_length` the delays are kept and DAL is recomputed on demand.
+    """
+
+    def __init__(self, source_length: int, target_length: int | None = None) -> None:
+        self.source_length: int = source_length
+        self.target_length: int | None = target_length
+
+        self._count: int = 0
+        self._first: float | None = None
+        self._sum: float = 0.0
+
+        # AL / LAAL: source_length 도달 전까지의 합과 토큰 수
+        self._lag_sum: float = 0.0
+        self._tau: int = 0
+        self._frozen: bool = False
+
+        # DAL: h_i = max(g_i - (i - 1) / gamma, h_{i-1}) 의 합
+        self._dal_sum: float = 0.0
+        self._dal_last: float = 0.0
+        self._delays: list[float] | None = [] if target_length is None else None
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def frozen(self) -> bool:
+        return self._frozen
+
+    def update(self, delay: float) -> None:
+        if self._first is None:
+            self._first = delay
+        self._sum += delay
+
+        if not self._frozen:
+            self._lag_sum += delay
+            self._tau += 1
+            if delay >= self.source_length:
+                self._frozen = True
+
+        if self._delays is not None:
+            self._delays.append(delay)
+        else:
+            assert self.target_length is not None
+            h = delay - self._count * self.source_length / self.target_length
+            if self._count > 0:
+                h = max(h, self._dal_last)
+            self._dal_sum += h
+            self._dal_last = h
+
+        self._count += 1
+
+    def extend(self, delays: Iterable[float]) -> None:
+        for d in delays:
+            self.update(d)
+
+    def _lagging(self, target_length: float) -> float | None:
+        if self._first is None:
+            return None
+        if self._first > self.source_length:
+            return self._first
+        # sum_{t < tau} (d_t - t / gamma), gamma = target_length / source_length
+        offset = self._tau * (self._tau - 1) / 2 * self.source_length / target_length
+        return (self._lag_sum - offset) / self._tau
+
+    def AL(self) -> float | None:
+        target = self._count if self.target_length is None else self.target_length
+        return self._lagging(target)
+
+    def LAAL(self) -> float | None:
+        target = self._count if self.target_length is None else self.target_length
+        return self._lagging(max(self._count, target))
+
+    def DAL(self) -> float | None:
+        if self._count == 0:
+            return None
+        if self._delays is not None:
+            return DAL_score(self._delays, self.source_length)
+        return self._dal_sum / self._count
+
+    def AP(self) -> float | None:
+        if self._count == 0:
+            return None
+        target = self._count if self.target_length is None else self.target_length
+        return self._sum / (self.source_length * target)
+
+    def scores(self) -> LatencyScores:
+        return {
+            "AL": self.AL(),
+            "LAAL": self.LAAL(),
+            "DAL": self.DAL(),
+            "AP": self.AP(),
+        }
+
+
+# ---------------------------------------------------------------------------
+# Batch variants
+# 여러 문장의 delays 를 CSR 형태(flat delays + offsets)로 받아 한 번에 계산한다.
+# delays[offsets[i]:offsets[i + 1]] 이 i 번째 문장의 delays 이다.
+# ---------------------------------------------------------------------------
+
+
+def pack_delays(
+    delays_list: Sequence[Sequence[float]],
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.int64]]:
+    lengths = np.fromiter((len(d) for d in delays_list), dtype=np.int64)
+    offsets = np.zeros(lengths.size + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    flat = np.fromiter(
+        (x for d in delays_list for x in d), dtype=np.float64, count=int(offsets[-1])
+    )
+    return flat, offsets
+
+
+def _ragged(
+    delays: npt.ArrayLike,
+    offsets: npt.ArrayLike,
+    source_lengths: npt.ArrayLike,
+) -> tuple[
+    npt.NDArray[np.float64],
+    npt.NDArray[np.int64],
+    npt.NDArray[np.int64],
+    npt.NDArray[np.int64],
+    npt.NDArray[np.float64],
+]:
+    flat = np.asarray(delays, dtype=np.float64)
+    offs = np.asarray(offsets, dtype=np.int64)
+    if flat.ndim != 1 or offs.ndim != 1 or offs.size < 1:
+        raise ValueError("delays and offsets must be 1-dimensional arrays")
+    if offs[0] != 0 or offs[-1] != flat.size:
+        raise ValueError("offsets must start at 0 and end at len(delays)")
+    lengths = np.diff(offs)
+    if np.any(lengths <= 0):
+        raise ValueError("every sentence must have at least one delay")
+
+    n = lengths.size
+    source = np.broadcast_to(np.asarray(source_lengths, dtype=np.float64), (n,))
+    seg = np.repeat(np.arange(n, dtype=np.int64), lengths)
+    # 문장 내 위치 (0-based), 즉 스칼라 버전의 t_minus_1
+    pos = np.arange(flat.size, dtype=np.int64) - offs[seg]
+    return flat, lengths, seg, pos, source
+
+
+def _target_lengths(
+    target_lengths: npt.ArrayLike | None, lengths: npt.NDArray[np.int64]
+) -> npt.NDArray[np.float64]:
+    if target_lengths is None:
+        return lengths.astype(np.float64)
+    return np.broadcast_to(
+        np.asarray(target_lengths, dtype=np.float64), lengths.shape
+    ).astype(np.float64)
+
+
+def _lagging_batch(
+    flat: npt.NDArray[np.float64],
+    lengths: npt.NDArray[np.int64],
+    seg: npt.NDArray[np.int64],
+    pos: npt.NDArray[np.int64],
+    source: npt.NDArray[np.float64],
+    gamma: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    n = lengths.size
+    # tau: source_length 에 처음 도달한 토큰까지 (포함) 의 개수
+    reached = flat >= source[seg]
+    last = lengths - 1
+    np.minimum.at(last, seg[reached], pos[reached])
+    tau = last + 1
+
+    included = pos < tau[seg]
+    lag = np.where(included, flat - pos / gamma[seg], 0.0)
+    scores = np.bincount(seg, weights=lag, minlength=n) / tau
+
+    starts = flat[np.cumsum(lengths) - lengths]
+    return np.where(starts > source, starts, scores)
+
+
+def AL_score_batch(
+    delays: npt.ArrayLike,
+    offsets: npt.ArrayLike,
+    source_lengths: npt.ArrayLike,
+    target_lengths: npt.ArrayLike | None = None,
+) -> npt.NDArray[np.float64]:
+    flat, lengths, seg, pos, source = _ragged(delays, offsets, source_lengths)
+    gamma = _target_lengths(target_lengths, lengths) / source
+    return _lagging_batch(flat, lengths, seg, pos, source, gamma)
+
+
+def LAAL_score_batch(
+    delays: npt.ArrayLike,
+    offsets: npt.ArrayLike,
+    source_lengths: npt.ArrayLike,
+    target_lengths: npt.ArrayLike | None = None,
+) -> npt.NDArray[np.float64]:
+    flat, lengths, seg, pos, source = _ragged(delays, offsets, source_lengths)
+    target = np.maximum(_target_lengths(target_lengths, lengths), lengths)
+    gamma = target / source
+    return _lagging_batch(flat, lengths, seg, pos, source, gamma)
+
+
+def DAL_score_batch(
+    delays: npt.ArrayLike,
+    offsets: npt.ArrayLike,
+    source_lengths: npt.ArrayLike,
+) -> npt.NDArray[np.float64]:
+    flat, lengths, seg, pos, source = _ragged(delays, offsets, source_lengths)
+    n = lengths.size
+    gamma = lengths / source
+
+    # g'_i - (i - 1) / gamma = max(g_i - (i - 1) / gamma, g'_{i-1} - (i - 2) / gamma)
+    # 즉 보정된 지연은 (g_i - (i - 1) / gamma) 의 문장 내 누적 최대값이다.
+    lag = flat - pos / gamma[seg]
+    starts = np.cumsum(lengths) - lengths
+    order = np.argsort(-lengths, kind="stable")
+    sorted_lengths = lengths[order]
+    for j in range(1, int(sorted_lengths[0]) if n else 0):
+        active = order[: np.searchsorted(-sorted_lengths, -j, side="left")]
+        idx = starts[active] + j
+        lag[idx] = np.maximum(lag[idx], lag[idx - 1])
+    result: npt.NDArray[np.float64] = (
+        np.bincount(seg, weights=lag, minlength=n) / lengths
+    )
+    return result
+
+
+def AP_score_batch(
+    delays: npt.ArrayLike,
+    offsets: npt.ArrayLike,
+    source_lengths: npt.ArrayLike,
+    target_lengths: npt.ArrayLike | None = None,
+) -> npt.NDArray[np.float64]:
+    flat, lengths, seg, _, source = _ragged(delays, offsets, source_lengths)
+    target = _target_lengths(target_lengths, lengths)
+    result: npt.NDArray[np.float64] = np.bincount(
+        seg, weights=flat, minlength=lengths.size
+    ) / (source * target)
+    return result
+
+
+def average_latency_batch(
+    delays: npt.ArrayLike, offsets: npt.ArrayLike
+) -> npt.NDArray[np.float64]:
+    flat, lengths, seg, _, _ = _ragged(delays, offsets, 1.0)
+    result: npt.NDArray[np.float64] = (
+        np.bincount(seg, weights=flat, minlength=lengths.size) / lengths
+    )
+    return result
+
+
+__all__ = [
+    "AL_score",
+    "AL_score_batch",
+    "AP_score",
+    "AP_score_batch",
+    "DAL_score",
+    "DAL_score_batch",
+    "LAAL_score",
+    "LAAL_score_batch",
+    "LatencyScores",
+    "StreamingLatencyScorer",
+    "average_latency",
+    "average_latency_batch",
+    "pack_delays",
+]
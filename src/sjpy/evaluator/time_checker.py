@@ -1,10 +1,54 @@
 from __future__ import annotations
 
+import multiprocessing as mp
 import time
-from collections.abc import Generator
+from collections.abc import Generator, Iterable, Sequence
 from contextlib import contextmanager
+from multiprocessing import synchronize
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Literal, TypedDict
 
-from sjpy.statistics import DistributionSummary, summarize_distribution
+import numpy as np
+import numpy.typing as npt
+from typing_extensions import Self
+
+from sjpy.memory import attach_shared_memory
+from sjpy.statistics import (
+    DistributionSummary,
+    Moments,
+    compute_moments,
+    empty_moments,
+    merge_moments,
+    summarize_distribution,
+    summarize_histogram,
+)
+
+SnapshotKind = Literal["raw", "histogram"]
+
+
+class TimeSnapshot(TypedDict):
+    kind: SnapshotKind
+    times: list[float]
+    moments: Moments
+    min: float | None
+    max: float | None
+    bin_edges: list[float]
+    counts: list[int]
+
+
+def default_time_bin_edges() -> list[float]:
+    # 1us ~ 1000s, decade 당 10개 log bin
+    edges: list[float] = np.geomspace(1e-6, 1e3, 91).tolist()
+    return edges
+
+
+def _bin_counts(times: npt.NDArray[np.float64], edges: Sequence[float]) -> list[int]:
+    # 범위 밖 값은 양 끝 bin 에 포함
+    _edges = np.asarray(edges, dtype=np.float64)
+    idx = np.searchsorted(_edges, times, side="right") - 1
+    idx = np.clip(idx, 0, _edges.size - 2)
+    counts: list[int] = np.bincount(idx, minlength=_edges.size - 1).tolist()
+    return counts
 
 
 class TimeChecker:
@@ -26,5 +70,171 @@ class TimeChecker:
     def metric(self) -> DistributionSummary:
         return summarize_distribution(self.__times)
 
+    def snapshot(
+        self,
+        kind: SnapshotKind = "raw",
+        bin_edges: Sequence[float] | None = None,
+    ) -> TimeSnapshot:
+        """Serializable (pickle/json) state for merging in another process.
+
+        `raw` keeps every sample; `histogram` keeps only exact moments, min/max
+        and counts over fixed `bin_edges`, so its size does not grow with the
+        number of samples. Histogram snapshots merge only with identical edges.
+        """
+        times = np.asarray(self.__times, dtype=np.float64)
+        snap: TimeSnapshot = {
+            "kind": kind,
+            "times": [],
+            "moments": compute_moments(times),
+            "min": float(times.min()) if times.size else None,
+            "max": float(times.max()) if times.size else None,
+            "bin_edges": [],
+            "counts": [],
+        }
+        if kind == "raw":
+            snap["times"] = self.__times.copy()
+        elif kind == "histogram":
+            edges = (
+                list(bin_edges) if bin_edges is not None else default_time_bin_edges()
+            )
+            snap["bin_edges"] = edges
+            snap["counts"] = _bin_counts(times, edges)
+        else:
+            raise ValueError(f"Unknown snapshot kind: {kind}")
+        return snap
+
+    @staticmethod
+    def merge_snapshots(snapshots: Iterable[TimeSnapshot]) -> DistributionSummary:
+        snapshots = list(snapshots)
+        if all(s["kind"] == "raw" for s in snapshots):
+            times: list[float] = []
+            for s in snapshots:
+                times.extend(s["times"])
+            return summarize_distribution(times)
+
+        edges: list[float] | None = None
+        for s in snapshots:
+            if s["kind"] != "histogram":
+                continue
+            if edges is None:
+                edges = s["bin_edges"]
+            elif s["bin_edges"] != edges:
+                raise ValueError("histogram snapshots must share the same bin_edges")
+        assert edges is not None
+
+        moments = empty_moments()
+        counts = np.zeros(len(edges) - 1, dtype=np.int64)
+        _min: float | None = None
+        _max: float | None = None
+        for s in snapshots:
+            if s["moments"]["n"] == 0:
+                continue
+            moments = merge_moments(moments, s["moments"])
+            if s["kind"] == "raw":
+                counts += _bin_counts(np.asarray(s["times"], dtype=np.float64), edges)
+            else:
+                counts += np.asarray(s["counts"], dtype=np.int64)
+            assert s["min"] is not None and s["max"] is not None
+            _min = s["min"] if _min is None else min(_min, s["min"])
+            _max = s["max"] if _max is None else max(_max, s["max"])
+
+        if _min is None or _max is None:
+            return summarize_distribution([])
+        return summarize_histogram(moments, _min, _max, edges, counts)
+
+
+class SharedTimeCollector:
+    """Fixed-capacity float64 buffer in shared memory that worker processes
+    append timings to, so the parent can summarize them without shipping
+    lists through queues.
+
+    Share it with workers through inheritance (``Process`` args or a ``Pool``
+    initializer); the lock cannot be sent through ``Pool.map`` arguments.
+    For a non-default start method pass ``lock=ctx.Lock()`` from that context.
+    Samples beyond ``capacity`` are dropped and counted in ``dropped``.
+    """
+
+    _HEADER = 2  # [count, dropped]
+
+    def __init__(self, capacity: int, lock: synchronize.Lock | None = None) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be a positive integer")
+        self.capacity: int = capacity
+        self._lock: synchronize.Lock = lock if lock is not None else mp.Lock()
+        self._shm: SharedMemory = SharedMemory(
+            create=True, size=(self._HEADER + capacity) * 8
+        )
+        self._owner: bool = True
+        self._header()[:] = 0
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"name": self._shm.name, "capacity": self.capacity, "lock": self._lock}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.capacity = state["capacity"]
+        self._lock = state["lock"]
+        self._shm = attach_shared_memory(state["name"])
+        self._owner = False
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def _header(self) -> npt.NDArray[np.int64]:
+        return np.ndarray((self._HEADER,), dtype=np.int64, buffer=self._shm.buf)
+
+    def _data(self) -> npt.NDArray[np.float64]:
+        return np.ndarray(
+            (self.capacity,),
+            dtype=np.float64,
+            buffer=self._shm.buf,
+            offset=self._HEADER * 8,
+        )
+
+    def publish(self, times: Sequence[float] | npt.NDArray[Any]) -> int:
+        values = np.asarray(times, dtype=np.float64).ravel()
+        with self._lock:
+            header = self._header()
+            start = int(header[0])
+            written = min(values.size, self.capacity - start)
+            self._data()[start : start + written] = values[:written]
+            header[0] = start + written
+            header[1] += values.size - written
+        return written
+
+    def publish_checker(self, checker: TimeChecker) -> int:
+        return self.publish(checker.get_times())
+
+    @property
+    def count(self) -> int:
+        return int(self._header()[0])
+
+    @property
+    def dropped(self) -> int:
+        return int(self._header()[1])
+
+    def values(self) -> npt.NDArray[np.float64]:
+        with self._lock:
+            return self._data()[: self.count].copy()
+
+    def metric(self) -> DistributionSummary:
+        return summarize_distribution(self.values().tolist())
+
+    def close(self) -> None:
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
 
-__all__ = ["TimeChecker"]
+__all__ = [
+    "TimeChecker",
+    "TimeSnapshot",
+    "SharedTimeCollector",
+    "default_time_bin_edges",
+]
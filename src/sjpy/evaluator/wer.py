@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import itertools
+import os
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Literal, TypedDict
+
+import numpy as np
+import numpy.typing as npt
+
+from sjpy.string import normalize_text_only_en, remove_spaces_and_symbols
+
+Unit = Literal["word", "char"]
+
+
+class ErrorCounts(TypedDict):
+    hits: int
+    substitutions: int
+    deletions: int
+    insertions: int
+    ref_length: int
+    hyp_length: int
+
+
+class ErrorRate(ErrorCounts):
+    error_rate: float | None
+
+
+def normalize_words(text: str) -> list[str]:
+    return normalize_text_only_en(text).lower().split()
+
+
+def normalize_chars(text: str) -> list[str]:
+    return list(remove_spaces_and_symbols(text).lower())
+
+
+def tokens_to_ids(
+    *sequences: Sequence[Any],
+) -> tuple[npt.NDArray[np.int64], ...]:
+    # 같은 토큰은 모든 시퀀스에서 같은 ID 를 갖는다
+    vocab: dict[Any, int] = {}
+    return tuple(
+        np.fromiter(
+            (vocab.setdefault(tok, len(vocab)) for tok in seq),
+            dtype=np.int64,
+            count=len(seq),
+        )
+        for seq in sequences
+    )
+
+
+def edit_distance(ref: Sequence[Any], hyp: Sequence[Any]) -> int:
+    """Levenshtein distance with the bit-parallel algorithm of Myers/Hyyro.
+
+    The reference is packed into one Python int per distinct token, so each
+    hypothesis token costs a handful of big-int operations instead of a
+    Python loop over the reference.
+    """
+    m = len(ref)
+    if m == 0:
+        return len(hyp)
+
+    peq: dict[Any, int] = {}
+    for i, tok in enumerate(ref):
+        peq[tok] = peq.get(tok, 0) | (1 << i)
+
+    full = (1 << m) - 1
+    last = 1 << (m - 1)
+    pv = full
+    mv = 0
+    score = m
+    for tok in hyp:
+        eq = peq.get(tok, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & full)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        # 첫 행(D[0][j] = j)이 매 열마다 1씩 증가하므로 1 을 밀어 넣는다
+        ph = ((ph << 1) | 1) & full
+        mh = (mh << 1) & full
+        pv = mh | (~(xv | ph) & full)
+        mv = ph & xv
+    return score
+
+
+def _align_rows(
+    ref: npt.NDArray[np.int64], hyp: npt.NDArray[np.int64]
+) -> tuple[int, int]:
+    # 행 단위로 벡터화한 DP. 비용과 일치 수를 하나의 키(cost * big - hits)로
+    # 합쳐 최소화하므로, 최소 비용 정렬 중 일치가 가장 많은 정렬을 고른다.
+    n, m = ref.size, hyp.size
+    big = n + m + 1
+    steps = np.arange(m + 1, dtype=np.int64) * big
+    row = steps.copy()
+    tmp = np.empty(m + 1, dtype=np.int64)
+    for tok in ref:
+        diag = row[:-1] + np.where(hyp == tok, -1, big)
+        tmp[0] = row[0] + big
+        np.minimum(row[1:] + big, diag, out=tmp[1:])
+        # 삽입: new[j] = min_k (tmp[k] + (j - k) * big)
+        np.subtract(tmp, steps, out=row)
+        np.minimum.accumulate(row, out=row)
+        row += steps
+    key = int(row[-1])
+    cost = -(-key // big)
+    return cost, cost * big - key
+
+
+def align(ref: Sequence[Any], hyp: Sequence[Any]) -> ErrorCounts:
+    ref_ids, hyp_ids = tokens_to_ids(ref, hyp)
+    n, m = ref_ids.size, hyp_ids.size
+
+    # 비용과 일치 수는 방향과 무관하므로, 짧은 쪽을 파이썬 루프로 돈다
+    if n <= m:
+        cost, hits = _align_rows(ref_ids, hyp_ids)
+    else:
+        cost, hits = _align_rows(hyp_ids, ref_ids)
+    # n = H + S + D, m = H + S + I, cost = S + D + I
+    deletions = cost - m + hits
+    insertions = cost - n + hits
+
+    return {
+        "hits": hits,
+        "substitutions": n - hits - deletions,
+        "deletions": deletions,
+        "insertions": insertions,
+        "ref_length": n,
+        "hyp_length": m,
+    }
+
+
+def _error_rate(counts: ErrorCounts) -> ErrorRate:
+    errors = counts["substitutions"] + counts["deletions"] + counts["insertions"]
+    return {
+        **counts,
+        "error_rate": errors / counts["ref_length"] if counts["ref_length"] else None,
+    }
+
+
+def _normalizer(unit: Unit) -> Callable[[str], list[str]]:
+    if unit == "word":
+        return normalize_words
+    if unit == "char":
+        return normalize_chars
+    raise ValueError(f"Unknown unit: {unit}")
+
+
+def error_rate(ref: str, hyp: str, unit: Unit = "word") -> ErrorRate:
+    normalize = _normalizer(unit)
+    return _error_rate(align(normalize(ref), normalize(hyp)))
+
+
+def word_error_rate(ref: str, hyp: str) -> ErrorRate:
+    return error_rate(ref, hyp, "word")
+
+
+def character_error_rate(ref: str, hyp: str) -> ErrorRate:
+    return error_rate(ref, hyp, "char")
+
+
+def _align_chunk(pairs: list[tuple[str, str]], unit: Unit) -> list[ErrorCounts]:
+    normalize = _normalizer(unit)
+    return [align(normalize(r), normalize(h)) for r, h in pairs]
+
+
+def corpus_error_rates(
+    refs: Iterable[str],
+    hyps: Iterable[str],
+    unit: Unit = "word",
+    *,
+    workers: int | None = None,
+    chunk_size: int = 256,
+) -> list[ErrorCounts]:
+    """
+    Align every (ref, hyp) pair, in parallel across processes.
+
+    Args:
+        workers: process pool size (None: os.cpu_count(), 0: align in-process)
+        chunk_size: pairs per task sent to a worker
+    """
+    _normalizer(unit)
+    pairs = iter(zip(refs, hyps, strict=True))
+    chunks = iter(lambda: list(itertools.islice(pairs, chunk_size)), [])
+
+    results: list[ErrorCounts] = []
+    if workers == 0:
+        for chunk in chunks:
+            results.extend(_align_chunk(chunk, unit))
+        return results
+
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        for counts in executor.map(_align_chunk, chunks, itertools.repeat(unit)):
+            results.extend(counts)
+    return results
+
+
+def corpus_error_rate(
+    refs: Iterable[str],
+    hyps: Iterable[str],
+    unit: Unit = "word",
+    *,
+    workers: int | None = None,
+    chunk_size: int = 256,
+) -> ErrorRate:
+    total: ErrorCounts = {
+        "hits": 0,
+        "substitutions": 0,
+        "deletions": 0,
+        "insertions": 0,
+        "ref_length": 0,
+        "hyp_length": 0,
+    }
+    for counts in corpus_error_rates(
+        refs, hyps, unit, workers=workers, chunk_size=chunk_size
+    ):
+        for key in total:
+            total[key] += counts[key]  # type: ignore[literal-required]
+    return _error_rate(total)
+
+
+__all__ = [
+    "ErrorCounts",
+    "ErrorRate",
+    "normalize_words",
+    "normalize_chars",
+    "tokens_to_ids",
+    "edit_distance",
+    "align",
+    "error_rate",
+    "word_error_rate",
+    "character_error_rate",
+    "corpus_error_rates",
+    "corpus_error_rate",
+]
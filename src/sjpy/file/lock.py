@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import sys
+import threading
+from pathlib import Path
+from typing import IO
+
+from typing_extensions import Self
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+
+class FileLock:
+    """
+    Exclusive inter-process lock on a lock file (``fcntl.flock`` on POSIX,
+    ``msvcrt.locking`` on Windows). The lock is released by the OS if the
+    holding process dies.
+
+    Also exclusive between threads of one process: each instance guards its
+    file handle with a `threading.Lock`, so share one instance per path.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path: Path = Path(path)
+        self._thread_lock = threading.Lock()
+        self._file: IO[bytes] | None = None
+
+    def acquire(self) -> None:
+        self._thread_lock.acquire()
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            f = self.path.open("a+b")
+            try:
+                if sys.platform == "win32":
+                    f.seek(0)
+                    # LK_LOCK 은 10번 재시도 후 실패하므로 잡힐 때까지 반복
+                    while True:
+                        try:
+                            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                            break
+                        except OSError:
+                            continue
+                else:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            except BaseException:
+                f.close()
+                raise
+            self._file = f
+        except BaseException:
+            self._thread_lock.release()
+            raise
+
+    def release(self) -> None:
+        f = self._file
+        if f is None:
+            raise RuntimeError("FileLock is not acquired")
+        self._file = None
+        try:
+            if sys.platform == "win32":
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        finally:
+            f.close()
+            self._thread_lock.release()
+
+    def __enter__(self) -> Self:
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.release()
+
+
+__all__ = ["FileLock"]
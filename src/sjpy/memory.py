@@ -3,17 +3,21 @@ from __future__ import annotations
 import gc
 import multiprocessing as mp
 import os
+import sys
 import threading
 import time
+from collections.abc import Sequence
 from contextlib import ContextDecorator
 from logging import Logger
-from multiprocessing import synchronize
+from multiprocessing import resource_tracker, synchronize
+from multiprocessing.shared_memory import SharedMemory
 from queue import Queue
-from typing import TypedDict
+from typing import Literal, TypedDict
 
 import psutil
 
 from sjpy.logger import configure_logger
+from sjpy.statistics import DistributionSummary, summarize_distribution
 
 
 class RssUss(TypedDict):
@@ -248,4 +252,63 @@ class MemScope(ContextDecorator):
         return False
 
 
-__all__ = ["MemScope"]
+MemStatsNumericKey = Literal[
+    "rss_start",
+    "rss_end",
+    "rss_delta",
+    "rss_peak_in_block",
+    "rss_peak_over_start_delta",
+    "uss_start",
+    "uss_end",
+    "uss_delta",
+    "uss_peak_in_block",
+    "uss_peak_over_start_delta",
+    "duration_s",
+    "samples",
+]
+
+MEM_STATS_NUMERIC_KEYS: tuple[MemStatsNumericKey, ...] = (
+    "rss_start",
+    "rss_end",
+    "rss_delta",
+    "rss_peak_in_block",
+    "rss_peak_over_start_delta",
+    "uss_start",
+    "uss_end",
+    "uss_delta",
+    "uss_peak_in_block",
+    "uss_peak_over_start_delta",
+    "duration_s",
+    "samples",
+)
+
+
+def merge_mem_stats(stats: Sequence[MemStats]) -> dict[str, DistributionSummary]:
+    # MemScope.stats 는 그대로 pickle/json 가능하므로 워커에서 받아 부모에서 합친다.
+    # 측정되지 않은(-1) 블록은 제외
+    valid = [s for s in stats if s["samples"] >= 0]
+    return {
+        key: summarize_distribution([float(s[key]) for s in valid])
+        for key in MEM_STATS_NUMERIC_KEYS
+    }
+
+
+def attach_shared_memory(name: str) -> SharedMemory:
+    """Attach to an existing segment without letting this process's resource
+    tracker unlink it when the process exits."""
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, create=False, track=False)
+
+    # 부모가 띄운 tracker 를 공유하는 경우(fork/spawn 자식)에는 등록이 부모와 합쳐지므로
+    # 그대로 두고, 독립 프로세스가 새 tracker 를 띄우는 경우에만 등록을 해제한다.
+    inherited = getattr(resource_tracker._resource_tracker, "_fd", None) is not None
+    shm = SharedMemory(name=name, create=False)
+    if os.name == "posix" and not inherited:
+        resource_tracker.unregister(
+            shm._name,  # type: ignore[attr-defined]
+            "shared_memory",
+        )
+    return shm
+
+
+__all__ = ["MemScope", "MemStats", "merge_mem_stats", "attach_shared_memory"]
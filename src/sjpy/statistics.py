@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+import itertools
 import math
+import os
 from collections.abc import Sequence
-from typing import TypedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Literal, TypedDict
 
 import numpy as np
-from scipy.stats import kurtosis, skew
+import numpy.typing as npt
+
+QUARTILES: tuple[float, float, float] = (0.25, 0.5, 0.75)
+SCAN_BLOCK_SIZE: int = 1 << 16
+
+ParallelBackend = Literal["thread", "process"]
 
 
 class HistogramSummary(TypedDict):
@@ -28,6 +37,14 @@ class DistributionSummary(TypedDict):
     histogram: HistogramSummary
 
 
+class Moments(TypedDict):
+    n: int
+    mean: float
+    m2: float
+    m3: float
+    m4: float
+
+
 def update_mean_std(
     old_mean: float,
     old_std: float,
@@ -55,11 +72,200 @@ def update_mean_std(
     return updated_mean, updated_std
 
 
+def empty_moments() -> Moments:
+    return {"n": 0, "mean": 0.0, "m2": 0.0, "m3": 0.0, "m4": 0.0}
+
+
+def compute_moments(data: npt.ArrayLike) -> Moments:
+    array = np.asarray(data, dtype=np.float64).ravel()
+    n = int(array.size)
+    if n == 0:
+        return empty_moments()
+
+    mean = float(array.mean())
+    d = array - mean
+    d2 = d * d
+    return {
+        "n": n,
+        "mean": mean,
+        "m2": float(d2.sum()),
+        "m3": float((d2 * d).sum()),
+        "m4": float((d2 * d2).sum()),
+    }
+
+
+def merge_moments(a: Moments, b: Moments) -> Moments:
+    # update_mean_std 와 같은 병합을 3, 4차 중심 모멘트까지 확장 (Chan / Pebay)
+    if a["n"] == 0:
+        return b.copy()
+    if b["n"] == 0:
+        return a.copy()
+
+    na, nb = a["n"], b["n"]
+    n = na + nb
+    delta = b["mean"] - a["mean"]
+    delta_n = delta / n
+
+    mean = a["mean"] + delta_n * nb
+    m2 = a["m2"] + b["m2"] + delta * delta_n * na * nb
+    m3 = (
+        a["m3"]
+        + b["m3"]
+        + delta * delta_n**2 * na * nb * (na - nb)
+        + 3.0 * delta_n * (na * b["m2"] - nb * a["m2"])
+    )
+    m4 = (
+        a["m4"]
+        + b["m4"]
+        + delta * delta_n**3 * na * nb * (na * na - na * nb + nb * nb)
+        + 6.0 * delta_n**2 * (na * na * b["m2"] + nb * nb * a["m2"])
+        + 4.0 * delta_n * (na * b["m3"] - nb * a["m3"])
+    )
+    return {"n": n, "mean": mean, "m2": m2, "m3": m3, "m4": m4}
+
+
+def moments_to_stats(moments: Moments) -> tuple[float, float, float, float]:
+    """Return (mean, std, skew, kurtosis) with the same conventions as
+    `summarize_distribution` (population std, biased Fisher skew/kurtosis)."""
+    n = moments["n"]
+    if n == 0:
+        raise ValueError("moments must describe at least one sample")
+
+    var = moments["m2"] / n
+    std = math.sqrt(max(var, 0.0))
+    # scipy 와 동일하게 분산이 0 에 가까우면 nan
+    if var <= (np.finfo(np.float64).eps * moments["mean"]) ** 2:
+        return moments["mean"], std, math.nan, math.nan
+    _skew = (moments["m3"] / n) / var**1.5
+    _kurtosis = (moments["m4"] / n) / var**2 - 3.0
+    return moments["mean"], std, _skew, _kurtosis
+
+
+def histogram_quantiles(
+    bin_edges: npt.ArrayLike,
+    counts: npt.ArrayLike,
+    qs: Sequence[float],
+) -> list[float]:
+    edges = np.asarray(bin_edges, dtype=np.float64)
+    cnt = np.asarray(counts, dtype=np.float64)
+    if edges.ndim != 1 or edges.size != cnt.size + 1:
+        raise ValueError("bin_edges must have exactly one more element than counts")
+    total = float(cnt.sum())
+    if total <= 0:
+        raise ValueError("histogram must contain at least one sample")
+
+    cum = np.cumsum(cnt)
+    targets = np.asarray(qs, dtype=np.float64) * total
+    idx = np.searchsorted(cum, targets, side="left")
+    idx = np.clip(idx, 0, cnt.size - 1)
+    # 빈 구간 안에서는 균등 분포를 가정하고 선형 보간
+    before = cum[idx] - cnt[idx]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        frac = np.where(cnt[idx] > 0, (targets - before) / cnt[idx], 0.0)
+    frac = np.clip(frac, 0.0, 1.0)
+    values = edges[idx] + frac * (edges[idx + 1] - edges[idx])
+    return [float(v) for v in values]
+
+
+def summarize_histogram(
+    moments: Moments,
+    _min: float,
+    _max: float,
+    bin_edges: npt.ArrayLike,
+    counts: npt.ArrayLike,
+) -> DistributionSummary:
+    """Build a `DistributionSummary` from exact moments and a fixed-edge
+    histogram. Quantiles are interpolated inside the bins and clipped to
+    [min, max]."""
+    if moments["n"] == 0:
+        return summarize_distribution([])
+
+    edges = np.asarray(bin_edges, dtype=np.float64)
+    cnt = np.asarray(counts, dtype=np.float64)
+    quartiles = [
+        min(max(q, _min), _max) for q in histogram_quantiles(edges, cnt, QUARTILES)
+    ]
+    return _build_summary(moments, _min, _max, quartiles, cnt, edges)
+
+
+def _build_summary(
+    moments: Moments,
+    _min: float,
+    _max: float,
+    quartiles: Sequence[float],
+    hist: npt.NDArray[Any],
+    bin_edges: npt.NDArray[Any],
+) -> DistributionSummary:
+    mean, std, _skew, _kurtosis = moments_to_stats(moments)
+    q1, q2, q3 = (float(q) for q in quartiles)
+    return {
+        "n": moments["n"],
+        "mean": mean,
+        "std": std,
+        "min": _min,
+        "q1": q1,
+        "q2": q2,
+        "q3": q3,
+        "max": _max,
+        "iqr": q3 - q1,
+        "skew": _skew,
+        "kurtosis": _kurtosis,
+        "histogram": _histogram_summary(hist, bin_edges),
+    }
+
+
+def _histogram_summary(
+    hist: npt.NDArray[Any], bin_edges: npt.NDArray[Any]
+) -> HistogramSummary:
+    # 고정 구간 밖의 값만 들어온 경우 합이 0 이므로 확률도 0 으로 둔다
+    total = hist.sum()
+    probs = hist / total if total else np.zeros(len(bin_edges) - 1)
+    return {"bin_edges": bin_edges.tolist(), "bin_probs": probs.tolist()}
+
+
+def _hist_range(_min: float, _max: float) -> tuple[float, float] | None:
+    # min == max 이면 np.histogram 기본 동작(±0.5)을 따른다
+    return (_min, _max) if _min < _max else None
+
+
+def scan_moments(
+    array: npt.NDArray[Any], block_size: int = SCAN_BLOCK_SIZE
+) -> tuple[Moments, float, float]:
+    """Moments, min and max of a 1-D array in one pass over memory.
+
+    Works block by block, so temporaries stay cache-sized and memory-mapped
+    arrays are read only once.
+    """
+    moments = empty_moments()
+    _min = math.inf
+    _max = -math.inf
+    for start in range(0, array.size, block_size):
+        block = np.asarray(array[start : start + block_size], dtype=np.float64)
+        moments = merge_moments(moments, compute_moments(block))
+        _min = min(_min, float(block.min()))
+        _max = max(_max, float(block.max()))
+    return moments, _min, _max
+
+
 def summarize_distribution(
-    data: Sequence[int | float],
+    data: Sequence[int | float] | npt.NDArray[Any] | memoryview,
     hist_bins: int = 10,
+    chunk_size: int | None = None,
 ) -> DistributionSummary:
-    if len(data) == 0:
+    """
+    Args:
+        data: samples; float64 ndarrays and memoryviews are used without a copy
+        hist_bins: number of histogram bins between min and max
+        chunk_size: process the data `chunk_size` samples at a time, e.g. for
+            memory-mapped arrays larger than RAM. Quartiles then come from a
+            `QuantileSketch` and are approximate; everything else is exact.
+    """
+    array = np.asarray(data)
+    if array.dtype != np.float64 and chunk_size is None:
+        array = array.astype(np.float64)
+    array = array.reshape(-1)
+
+    if array.size == 0:
         return {
             "n": 0,
             "mean": None,
@@ -78,44 +284,610 @@ def summarize_distribution(
             },
         }
 
-    array = np.array(data, dtype=np.float64)
-    n = len(array)
-    mean = float(np.mean(array))
-    std = float(np.std(array))
-    _min = float(np.min(array))
-    q1 = float(np.percentile(array, 25))
-    q2 = float(np.percentile(array, 50))
-    q3 = float(np.percentile(array, 75))
-    _max = float(np.max(array))
-    iqr = q3 - q1
-    _skew = float(skew(array))
-    _kurtosis = float(kurtosis(array))
-
-    hist, bin_edges = np.histogram(array, bins=hist_bins, density=True)
-    bin_probs = hist / hist.sum()
+    if chunk_size is not None:
+        return _summarize_chunked(array, hist_bins, chunk_size)
 
-    return {
-        "n": n,
-        "mean": mean,
-        "std": std,
-        "min": _min,
-        "q1": q1,
-        "q2": q2,
-        "q3": q3,
-        "max": _max,
-        "iqr": iqr,
-        "skew": _skew,
-        "kurtosis": _kurtosis,
-        "histogram": {
-            "bin_edges": bin_edges.tolist(),
-            "bin_probs": bin_probs.tolist(),
-        },
-    }
+    moments, _min, _max = scan_moments(array)
+    # 세 사분위수를 한 번의 partition 으로 계산
+    quartiles = np.quantile(array, QUARTILES)
+    hist, bin_edges = np.histogram(array, bins=hist_bins, range=_hist_range(_min, _max))
+    return _build_summary(moments, _min, _max, quartiles, hist, bin_edges)
+
+
+def _summarize_chunked(
+    array: npt.NDArray[Any], hist_bins: int, chunk_size: int
+) -> DistributionSummary:
+    # 같은 입력에 같은 사분위수를 돌려주도록 seed 를 고정한다
+    sketch = QuantileSketch(seed=0)
+    moments = empty_moments()
+    _min = math.inf
+    _max = -math.inf
+    for start in range(0, array.size, chunk_size):
+        chunk = np.asarray(array[start : start + chunk_size], dtype=np.float64)
+        chunk_moments, chunk_min, chunk_max = scan_moments(chunk)
+        moments = merge_moments(moments, chunk_moments)
+        _min = min(_min, chunk_min)
+        _max = max(_max, chunk_max)
+        sketch.add(chunk)
+
+    hist_range = _hist_range(_min, _max) or (_min - 0.5, _max + 0.5)
+    hist = np.zeros(hist_bins, dtype=np.int64)
+    bin_edges = np.linspace(hist_range[0], hist_range[1], hist_bins + 1)
+    for start in range(0, array.size, chunk_size):
+        chunk = np.asarray(array[start : start + chunk_size], dtype=np.float64)
+        hist += np.histogram(chunk, bins=hist_bins, range=hist_range)[0]
+
+    return _build_summary(
+        moments, _min, _max, sketch.quantiles(QUARTILES), hist, bin_edges
+    )
+
+
+def summarize_npy(
+    path: str | Path, hist_bins: int = 10, chunk_size: int = 1 << 22
+) -> DistributionSummary:
+    """Summarize a `.npy` file through a read-only memory map, chunk by chunk."""
+    array = np.load(path, mmap_mode="r")
+    return summarize_distribution(array, hist_bins=hist_bins, chunk_size=chunk_size)
+
+
+def weighted_quantiles(
+    sorted_values: npt.NDArray[np.float64],
+    sorted_weights: npt.NDArray[np.float64],
+    qs: Sequence[float],
+) -> npt.NDArray[np.float64]:
+    """Quantiles of sorted weighted samples. With unit weights this is the
+    same as `np.quantile(..., method="linear")`."""
+    total = float(sorted_weights.sum())
+    last = float(sorted_weights[-1])
+    # 샘플 i 의 위치: 앞선 가중치 합 / (전체 - 마지막 가중치), 단위 가중치면 i / (n - 1)
+    before = np.cumsum(sorted_weights) - sorted_weights
+    span = total - last
+    if span <= 0:
+        return np.full(len(qs), sorted_values[-1], dtype=np.float64)
+    result: npt.NDArray[np.float64] = np.interp(
+        np.asarray(qs, dtype=np.float64) * span, before, sorted_values
+    )
+    return result
+
+
+def summarize_distribution_grouped(
+    values: npt.ArrayLike,
+    groups: npt.ArrayLike,
+    weights: npt.ArrayLike | None = None,
+    hist_bins: int = 10,
+) -> dict[int, DistributionSummary]:
+    """
+    `summarize_distribution` for every group at once, with one sort and
+    segment reductions instead of a Python loop over groups.
+
+    Args:
+        values: samples
+        groups: integer group key per sample
+        weights: optional non-negative frequency weight per sample. Moments,
+            quartiles (`weighted_quantiles`) and histogram probabilities are
+            weighted; `n` stays the number of samples.
+        hist_bins: number of histogram bins between each group's min and max
+
+    Returns:
+        `DistributionSummary` per group key, in ascending key order.
+    """
+    _values = np.asarray(values, dtype=np.float64).ravel()
+    _groups = np.asarray(groups).ravel()
+    if _groups.size != _values.size:
+        raise ValueError("values and groups must have the same length")
+    if _groups.size and not np.issubdtype(_groups.dtype, np.integer):
+        raise ValueError("groups must be integer keys")
+    if _values.size == 0:
+        return {}
+
+    # 그룹 -> 값 순서로 정렬하면 그룹마다 min/max/분위수를 바로 읽을 수 있다
+    order = np.lexsort((_values, _groups))
+    v = _values[order]
+    keys, starts, counts = np.unique(
+        _groups[order], return_index=True, return_counts=True
+    )
+    ends = starts + counts
+    seg = np.repeat(np.arange(keys.size), counts)
+
+    if weights is None:
+        w = np.ones_like(v)
+    else:
+        _weights = np.asarray(weights, dtype=np.float64).ravel()
+        if _weights.size != _values.size:
+            raise ValueError("values and weights must have the same length")
+        if np.any(_weights < 0):
+            raise ValueError("weights must be non-negative")
+        w = _weights[order]
+    total = np.add.reduceat(w, starts)
+    if np.any(total <= 0):
+        raise ValueError("every group needs a positive total weight")
+
+    # 모멘트: 평균을 먼저 구한 뒤 편차로 2~4차 중심 모멘트 (two-pass)
+    mean = np.add.reduceat(w * v, starts) / total
+    d = v - mean[seg]
+    wd2 = w * d * d
+    var = np.add.reduceat(wd2, starts) / total
+    m3 = np.add.reduceat(wd2 * d, starts) / total
+    m4 = np.add.reduceat(wd2 * d * d, starts) / total
+    std = np.sqrt(var)
+    degenerate = var <= (np.finfo(np.float64).eps * mean) ** 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        _skew = np.where(degenerate, np.nan, m3 / var**1.5)
+        _kurtosis = np.where(degenerate, np.nan, m4 / var**2 - 3.0)
+
+    _min = v[starts]
+    _max = v[ends - 1]
+
+    # 사분위수: weighted_quantiles 와 같은 위치 정의를 전체 누적합 위에서 계산
+    before = np.cumsum(w) - w
+    span = total - w[ends - 1]
+    qs = np.asarray(QUARTILES, dtype=np.float64)
+    targets = before[starts, None] + qs * span[:, None]
+    lo = np.searchsorted(before, targets, side="right") - 1
+    lo = np.clip(lo, starts[:, None], ends[:, None] - 1)
+    hi = np.minimum(lo + 1, ends[:, None] - 1)
+    gap = before[hi] - before[lo]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        frac = np.where(gap > 0, (targets - before[lo]) / gap, 0.0)
+    quartiles = v[lo] + np.clip(frac, 0.0, 1.0) * (v[hi] - v[lo])
+    quartiles[span <= 0] = _max[span <= 0, None]
+
+    # 히스토그램: np.histogram(range=(min, max)) 과 같은 bin 을 그룹별로
+    flat = _min == _max
+    low = np.where(flat, _min - 0.5, _min)
+    high = np.where(flat, _max + 0.5, _max)
+    edges = np.linspace(low, high, hist_bins + 1, axis=1)
+    idx = ((v - low[seg]) * (hist_bins / (high - low))[seg]).astype(np.int64)
+    idx = np.minimum(idx, hist_bins - 1)
+    idx -= v < edges[seg, idx]
+    idx += (v >= edges[seg, idx + 1]) & (idx != hist_bins - 1)
+    hist = np.bincount(
+        seg * hist_bins + idx, weights=w, minlength=keys.size * hist_bins
+    ).reshape(keys.size, hist_bins)
+    probs = hist / total[:, None]
+
+    summaries: dict[int, DistributionSummary] = {}
+    for i, key in enumerate(keys.tolist()):
+        q1, q2, q3 = (float(q) for q in quartiles[i])
+        summaries[key] = {
+            "n": int(counts[i]),
+            "mean": float(mean[i]),
+            "std": float(std[i]),
+            "min": float(_min[i]),
+            "q1": q1,
+            "q2": q2,
+            "q3": q3,
+            "max": float(_max[i]),
+            "iqr": q3 - q1,
+            "skew": float(_skew[i]),
+            "kurtosis": float(_kurtosis[i]),
+            "histogram": {
+                "bin_edges": edges[i].tolist(),
+                "bin_probs": probs[i].tolist(),
+            },
+        }
+    return summaries
+
+
+class QuantileSketch:
+    """Mergeable KLL quantile sketch with bounded memory.
+
+    Level ``h`` holds items of weight ``2**h``; a full level is sorted and
+    every other item (random offset) is promoted. While fewer than `k` items
+    were added nothing is compacted and quantiles are exact.
+    """
+
+    def __init__(self, k: int = 200, seed: int | None = None) -> None:
+        if k < 8:
+            raise ValueError("k must be at least 8")
+        self.k: int = k
+        self.n: int = 0
+        self._levels: list[list[npt.NDArray[np.float64]]] = [[]]
+        self._sizes: list[int] = [0]
+        self._rng: np.random.Generator = np.random.default_rng(seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self._levels) - level - 1
+        return max(8, math.ceil(self.k * (2 / 3) ** depth))
+
+    def _level(self, level: int) -> npt.NDArray[np.float64]:
+        parts = self._levels[level]
+        if len(parts) != 1:
+            merged = np.concatenate(parts) if parts else np.empty(0, dtype=np.float64)
+            self._levels[level] = [merged]
+        return self._levels[level][0]
+
+    def _compress(self) -> None:
+        while True:
+            over = [
+                h
+                for h in range(len(self._levels))
+                if self._sizes[h] > self._capacity(h)
+            ]
+            if not over:
+                return
+            level = over[0]
+            if level + 1 == len(self._levels):
+                # 레벨이 늘면 아래 레벨의 용량도 줄어들므로 처음부터 다시 확인
+                self._levels.append([])
+                self._sizes.append(0)
+            items = np.sort(self._level(level))
+            # 홀수 개면 하나는 현재 레벨에 남긴다
+            keep = items[-1:] if items.size % 2 else items[:0]
+            pairs = items[: items.size - keep.size]
+            promoted = pairs[int(self._rng.integers(2)) :: 2]
+            self._levels[level] = [keep]
+            self._sizes[level] = keep.size
+            self._levels[level + 1].append(promoted)
+            self._sizes[level + 1] += promoted.size
+
+    def add(self, data: npt.ArrayLike) -> None:
+        values = np.asarray(data, dtype=np.float64).ravel()
+        if values.size == 0:
+            return
+        self.n += values.size
+        self._levels[0].append(values.copy())
+        self._sizes[0] += values.size
+        self._compress()
+
+    def merge(self, other: QuantileSketch) -> None:
+        for level, parts in enumerate(other._levels):
+            if level == len(self._levels):
+                self._levels.append([])
+                self._sizes.append(0)
+            self._levels[level].extend(p.copy() for p in parts)
+            self._sizes[level] += other._sizes[level]
+        self.n += other.n
+        self._compress()
+
+    def weighted_items(
+        self,
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        values = [self._level(h) for h in range(len(self._levels))]
+        weights = [np.full(v.size, 2.0**h) for h, v in enumerate(values)]
+        items = np.concatenate(values)
+        order = np.argsort(items, kind="stable")
+        return items[order], np.concatenate(weights)[order]
+
+    def quantiles(self, qs: Sequence[float]) -> list[float]:
+        if self.n == 0:
+            raise ValueError("sketch is empty")
+        items, weights = self.weighted_items()
+        result: list[float] = weighted_quantiles(items, weights, qs).tolist()
+        return result
+
+
+class StreamingHistogram:
+    """Histogram over caller-fixed bin edges that can be filled batch by batch
+    and merged.
+
+    Bins are ``[e_i, e_{i+1})`` with the last one closed, as in `np.histogram`.
+    Values outside the edges go to `underflow` / `overflow` and NaNs to `nan`;
+    `summary()` normalizes over in-range counts only, like `np.histogram` with
+    an explicit range. Histograms built by `linear` / `log` locate bins
+    arithmetically, others by binary search.
+    """
+
+    def __init__(self, bin_edges: npt.ArrayLike) -> None:
+        edges = np.asarray(bin_edges, dtype=np.float64)
+        if edges.ndim != 1 or edges.size < 2:
+            raise ValueError("bin_edges must be a 1-dimensional array of size >= 2")
+        if not np.all(np.diff(edges) > 0):
+            raise ValueError("bin_edges must be strictly increasing")
+        self.bin_edges: npt.NDArray[np.float64] = edges
+        self.counts: npt.NDArray[np.int64] = np.zeros(edges.size - 1, dtype=np.int64)
+        self.underflow: int = 0
+        self.overflow: int = 0
+        self.nan: int = 0
+        self._scale: Literal["linear", "log"] | None = None
+
+    @classmethod
+    def linear(cls, low: float, high: float, bins: int) -> StreamingHistogram:
+        hist = cls(np.linspace(low, high, bins + 1))
+        hist._scale = "linear"
+        return hist
+
+    @classmethod
+    def log(cls, low: float, high: float, bins: int) -> StreamingHistogram:
+        if low <= 0:
+            raise ValueError("log-spaced bins need a positive lower edge")
+        hist = cls(np.geomspace(low, high, bins + 1))
+        hist._scale = "log"
+        return hist
+
+    @property
+    def bins(self) -> int:
+        return int(self.counts.size)
+
+    @property
+    def n(self) -> int:
+        return int(self.counts.sum()) + self.underflow + self.overflow
+
+    def _bin_index(self, values: npt.NDArray[np.float64]) -> npt.NDArray[np.int64]:
+        low, high = self.bin_edges[0], self.bin_edges[-1]
+        if self._scale == "linear":
+            pos = (values - low) * (self.bins / (high - low))
+        elif self._scale == "log":
+            pos = np.log(values / low) * (self.bins / math.log(high / low))
+        else:
+            found = np.searchsorted(self.bin_edges, values, side="right") - 1
+            return np.minimum(found, self.bins - 1).astype(np.int64)
+        idx: npt.NDArray[np.int64] = np.minimum(pos.astype(np.int64), self.bins - 1)
+        # 부동소수점 오차로 경계에서 한 칸 어긋난 값을 보정 (np.histogram 과 동일)
+        idx -= values < self.bin_edges[idx]
+        idx += (values >= self.bin_edges[idx + 1]) & (idx != self.bins - 1)
+        return idx
+
+    def add(self, data: npt.ArrayLike) -> None:
+        values = np.asarray(data, dtype=np.float64).ravel()
+        nan = np.isnan(values)
+        if nan.any():
+            self.nan += int(nan.sum())
+            values = values[~nan]
+        below = values < self.bin_edges[0]
+        above = values > self.bin_edges[-1]
+        self.underflow += int(below.sum())
+        self.overflow += int(above.sum())
+        inside = values[~(below | above)]
+        self.counts += np.bincount(self._bin_index(inside), minlength=self.bins)
+
+    def merge(self, other: StreamingHistogram) -> None:
+        if not np.array_equal(self.bin_edges, other.bin_edges):
+            raise ValueError("histograms must share the same bin_edges")
+        self.counts += other.counts
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        self.nan += other.nan
+
+    def quantiles(self, qs: Sequence[float]) -> list[float]:
+        return histogram_quantiles(self.bin_edges, self.counts, qs)
+
+    def summary(self) -> HistogramSummary:
+        return _histogram_summary(self.counts, self.bin_edges)
+
+
+class StreamingSummary:
+    """Chunk-by-chunk accumulator producing the same `DistributionSummary` as
+    `summarize_distribution`.
+
+    Count, mean, std, skew, kurtosis, min and max are exact; quartiles and the
+    histogram come from a `QuantileSketch`, so memory stays bounded. Instances
+    are picklable and can be merged across chunks or processes.
+
+    Pass a `StreamingHistogram` to report its fixed bins instead of the
+    sketch-based histogram, e.g. to compare histograms across runs.
+    """
+
+    def __init__(
+        self,
+        hist_bins: int = 10,
+        sketch_size: int = 200,
+        seed: int | None = None,
+        histogram: StreamingHistogram | None = None,
+    ) -> None:
+        self.hist_bins: int = hist_bins
+        self.histogram: StreamingHistogram | None = histogram
+        self.moments: Moments = empty_moments()
+        self.min: float | None = None
+        self.max: float | None = None
+        self.sketch: QuantileSketch = QuantileSketch(sketch_size, seed)
+
+    @property
+    def n(self) -> int:
+        return self.moments["n"]
+
+    def add(self, data: npt.ArrayLike) -> None:
+        values = np.asarray(data, dtype=np.float64).ravel()
+        if values.size == 0:
+            return
+        self.moments = merge_moments(self.moments, compute_moments(values))
+        _min, _max = float(values.min()), float(values.max())
+        self.min = _min if self.min is None else min(self.min, _min)
+        self.max = _max if self.max is None else max(self.max, _max)
+        self.sketch.add(values)
+        if self.histogram is not None:
+            self.histogram.add(values)
+
+    def merge(self, other: StreamingSummary) -> None:
+        if other.n == 0:
+            return
+        assert other.min is not None and other.max is not None
+        self.moments = merge_moments(self.moments, other.moments)
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self.sketch.merge(other.sketch)
+        if self.histogram is not None:
+            if other.histogram is None:
+                raise ValueError("cannot merge a summary without a fixed histogram")
+            self.histogram.merge(other.histogram)
+
+    def summary(self) -> DistributionSummary:
+        if self.n == 0:
+            return summarize_distribution([])
+        assert self.min is not None and self.max is not None
+
+        if self.histogram is not None:
+            return _build_summary(
+                self.moments,
+                self.min,
+                self.max,
+                self.sketch.quantiles(QUARTILES),
+                self.histogram.counts,
+                self.histogram.bin_edges,
+            )
+
+        items, weights = self.sketch.weighted_items()
+        # sketch 에서 빠졌을 수 있는 실제 min/max 로 구간을 맞춘다
+        hist, bin_edges = np.histogram(
+            items,
+            bins=self.hist_bins,
+            range=_hist_range(self.min, self.max),
+            weights=weights,
+        )
+        return _build_summary(
+            self.moments,
+            self.min,
+            self.max,
+            self.sketch.quantiles(QUARTILES),
+            hist,
+            bin_edges,
+        )
+
+
+# summarize_distribution_parallel 의 워커에 넘기는 배열 정보.
+# 경로/memmap 이면 (filename, dtype, offset, shape) 로 워커가 직접 다시 연다.
+_ArraySource = tuple[str, str, int, tuple[int, ...]] | npt.NDArray[Any]
+
+
+def _as_source(
+    source: str | Path | npt.NDArray[Any], backend: ParallelBackend
+) -> tuple[_ArraySource, int]:
+    if isinstance(source, (str, Path)):
+        source = np.load(source, mmap_mode="r")
+    if isinstance(source, np.memmap) and source.filename is not None:
+        if backend == "process":
+            # memmap 의 view 는 offset 이 원본 기준이라 다시 열 수 없다
+            if isinstance(source.base, np.memmap) or not (
+                source.flags.c_contiguous or source.flags.f_contiguous
+            ):
+                raise ValueError("process backend needs an unsliced np.memmap")
+            return (
+                str(source.filename),
+                source.dtype.str,
+                int(source.offset),
+                tuple(source.shape),
+            ), int(source.size)
+        return source.reshape(-1), int(source.size)
+    if backend == "process":
+        raise ValueError("process backend needs a .npy path or an np.memmap source")
+    array = np.asarray(source).reshape(-1)
+    return array, int(array.size)
+
+
+def _open_source(source: _ArraySource) -> npt.NDArray[Any]:
+    if isinstance(source, tuple):
+        filename, dtype, offset, shape = source
+        return np.memmap(
+            filename, dtype=dtype, mode="r", offset=offset, shape=shape
+        ).reshape(-1)
+    return source
+
+
+def _scan_partial(
+    source: _ArraySource, start: int, stop: int, seed: int
+) -> tuple[Moments, float, float, QuantileSketch]:
+    chunk = np.asarray(_open_source(source)[start:stop], dtype=np.float64)
+    moments, _min, _max = scan_moments(chunk)
+    sketch = QuantileSketch(seed=seed)
+    sketch.add(chunk)
+    return moments, _min, _max, sketch
+
+
+def _hist_partial(
+    source: _ArraySource,
+    start: int,
+    stop: int,
+    hist_bins: int,
+    hist_range: tuple[float, float],
+) -> npt.NDArray[np.int64]:
+    chunk = np.asarray(_open_source(source)[start:stop], dtype=np.float64)
+    hist: npt.NDArray[np.int64] = np.histogram(chunk, bins=hist_bins, range=hist_range)[
+        0
+    ]
+    return hist
+
+
+def summarize_distribution_parallel(
+    source: str | Path | npt.NDArray[Any],
+    workers: int | None = None,
+    hist_bins: int = 10,
+    chunk_size: int = 1 << 22,
+    backend: ParallelBackend = "thread",
+    seed: int = 0,
+) -> DistributionSummary:
+    """
+    Parallel, chunked `summarize_distribution` for large (memory-mapped) arrays.
+
+    Each chunk yields partial moments, min/max and a quantile sketch, merged
+    with `merge_moments` / `QuantileSketch.merge`; a second parallel pass
+    counts the histogram over the global range. Quartiles are approximate,
+    everything else is exact.
+
+    Args:
+        source: `.npy` path, `np.memmap` or in-memory array
+        workers: pool size (None: os.cpu_count())
+        chunk_size: samples per task
+        backend: "thread" (NumPy releases the GIL in the heavy loops) or
+            "process" (needs a `.npy` path or `np.memmap`, which each worker
+            re-opens instead of receiving pickled data)
+        seed: seed of the quantile sketches; the same seed and `chunk_size`
+            give the same quartiles on every run
+    """
+    if backend not in ("thread", "process"):
+        raise ValueError(f"Unknown backend: {backend}")
+    src, size = _as_source(source, backend)
+    if size == 0:
+        return summarize_distribution([])
+
+    bounds = [(i, min(i + chunk_size, size)) for i in range(0, size, chunk_size)]
+    executor_cls = ThreadPoolExecutor if backend == "thread" else ProcessPoolExecutor
+    with executor_cls(max_workers=workers or os.cpu_count()) as executor:
+        partials = list(
+            executor.map(
+                _scan_partial,
+                itertools.repeat(src),
+                (b[0] for b in bounds),
+                (b[1] for b in bounds),
+                range(seed, seed + len(bounds)),
+            )
+        )
+
+        moments = empty_moments()
+        _min = math.inf
+        _max = -math.inf
+        sketch = QuantileSketch(seed=seed)
+        for part_moments, part_min, part_max, part_sketch in partials:
+            moments = merge_moments(moments, part_moments)
+            _min = min(_min, part_min)
+            _max = max(_max, part_max)
+            sketch.merge(part_sketch)
+
+        hist_range = _hist_range(_min, _max) or (_min - 0.5, _max + 0.5)
+        hist = np.zeros(hist_bins, dtype=np.int64)
+        for part_hist in executor.map(
+            _hist_partial,
+            itertools.repeat(src),
+            (b[0] for b in bounds),
+            (b[1] for b in bounds),
+            itertools.repeat(hist_bins),
+            itertools.repeat(hist_range),
+        ):
+            hist += part_hist
+
+    bin_edges = np.linspace(hist_range[0], hist_range[1], hist_bins + 1)
+    return _build_summary(
+        moments, _min, _max, sketch.quantiles(QUARTILES), hist, bin_edges
+    )
 
 
 __all__ = [
-    "update_mean_std",
-    "summarize_distribution",
     "DistributionSummary",
     "HistogramSummary",
+    "Moments",
+    "QuantileSketch",
+    "StreamingHistogram",
+    "StreamingSummary",
+    "compute_moments",
+    "empty_moments",
+    "histogram_quantiles",
+    "merge_moments",
+    "moments_to_stats",
+    "scan_moments",
+    "summarize_distribution",
+    "summarize_distribution_grouped",
+    "summarize_distribution_parallel",
+    "summarize_histogram",
+    "summarize_npy",
+    "update_mean_std",
+    "weighted_quantiles",
 ]
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+import time
+import warnings
+from collections.abc import Awaitable
+from typing import Any
+
+import pytest
+
+from sjpy.asynchronous import (
+    AsyncBatcher,
+    AsyncWorkerPool,
+    KeyedLock,
+    RateLimiter,
+    offload,
+    register_executor,
+    shutdown_executors,
+    spawn_task_queue_worker_keyed,
+)
+
+
+def test_worker_pool_rejects_max_concurrency_above_workers() -> None:
+    with pytest.raises(ValueError):
+        AsyncWorkerPool(workers=2, max_concurrency=3)
+
+
+def test_worker_pool_shutdown_without_drain_resolves_every_future() -> None:
+    started = 0
+
+    async def job(i: int) -> int:
+        nonlocal started
+        started += 1
+        await asyncio.sleep(10)
+        return i
+
+    async def main() -> None:
+        pool: AsyncWorkerPool[int] = AsyncWorkerPool(
+            workers=4, max_concurrency=1, maxsize=None
+        )
+        pool.start()
+        futures = [await pool.submit(job(i)) for i in range(8)]
+        await asyncio.sleep(0.01)
+        assert started == 1
+
+        await asyncio.wait_for(pool.shutdown(drain=False), 1.0)
+        assert all(f.cancelled() for f in futures)
+        assert pool.stats()["cancelled"] == 8
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        asyncio.run(main())
+
+
+@offload("cpu")
+def _square(x: int) -> int:
+    return x * x
+
+
+def test_offload_decorated_module_function_runs_in_process_pool() -> None:
+    register_executor("cpu", "process", max_workers=1)
+    try:
+        assert asyncio.run(_square(7)) == 49
+    finally:
+        shutdown_executors()
+
+
+def test_keyed_queue_worker_keeps_backpressure_on_a_hot_key() -> None:
+    async def main() -> None:
+        queue: asyncio.Queue[tuple[str, Awaitable[Any]] | None] = asyncio.Queue(2)
+        stop_event = asyncio.Event()
+        spawn_task_queue_worker_keyed(queue, KeyedLock(), stop_event)
+
+        release = asyncio.Event()
+        done: list[int] = []
+
+        async def job(i: int) -> None:
+            await release.wait()
+            done.append(i)
+
+        # 2 개는 워커가 꺼내 대기 중, 2 개는 큐에 남고, 그 다음 put 은 막힌다
+        for i in range(4):
+            await asyncio.wait_for(queue.put(("hot", job(i))), 1.0)
+        blocked = job(4)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(queue.put(("hot", blocked)), 0.05)
+        blocked.close()
+
+        release.set()
+        await queue.put(None)
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert done == [0, 1, 2, 3]
+
+    asyncio.run(main())
+
+
+def test_batcher_cancels_callers_when_batch_function_is_cancelled() -> None:
+    async def fn(items: list[int]) -> list[int]:
+        raise asyncio.CancelledError
+
+    async def main() -> None:
+        batcher: AsyncBatcher[int, int] = AsyncBatcher(fn, max_batch=2)
+        futures = [batcher.submit_nowait(i) for i in range(2)]
+        await asyncio.wait(futures, timeout=1.0)
+        assert all(f.cancelled() for f in futures)
+        await batcher.close()
+
+    asyncio.run(main())
+
+
+def test_rate_limiter_keeps_buckets_that_have_not_refilled() -> None:
+    limiter = RateLimiter(rate=1.0, capacity=1.0, per_key=True, max_keys=2)
+    assert limiter.try_acquire("a")
+    assert limiter.try_acquire("b")
+    # a, b 모두 비어 있으므로 c 를 위해 버리지 않는다
+    assert limiter.try_acquire("c")
+    assert limiter.stats()["buckets"] == 3
+    assert not limiter.try_acquire("a")
+
+
+def test_rate_limiter_drops_refilled_buckets_past_max_keys() -> None:
+    limiter = RateLimiter(rate=1000.0, capacity=1.0, per_key=True, max_keys=2)
+    for key in ("a", "b"):
+        assert limiter.try_acquire(key)
+    time.sleep(0.01)
+    assert limiter.try_acquire("c")
+    assert limiter.stats()["buckets"] == 2
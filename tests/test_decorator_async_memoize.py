@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from sjpy.decorator import async_memoize
+
+
+def test_async_memoize_coalesces_concurrent_misses() -> None:
+    calls: list[int] = []
+
+    @async_memoize()
+    async def slow(x: int) -> int:
+        calls.append(x)
+        await asyncio.sleep(0.01)
+        return x * 2
+
+    async def main() -> None:
+        assert await asyncio.gather(*(slow(1) for _ in range(5))) == [2] * 5
+        assert await slow(1) == 2
+        info = slow.cache_info()  # type: ignore[attr-defined]
+        assert info["coalesced"] == 4 and info["hits"] == 1
+
+    asyncio.run(main())
+    assert calls == [1]
+
+
+def test_async_memoize_cancelled_caller_does_not_cancel_shared_call() -> None:
+    @async_memoize()
+    async def slow(x: int) -> int:
+        await asyncio.sleep(0.02)
+        return x
+
+    async def main() -> None:
+        first = asyncio.ensure_future(slow(3))
+        second = asyncio.ensure_future(slow(3))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == 3
+        assert first.cancelled()
+
+    asyncio.run(main())
+
+
+def test_async_memoize_negative_caching() -> None:
+    calls = 0
+
+    @async_memoize(negative_ttl=60.0, exceptions=(KeyError,))
+    async def lookup(key: str) -> str:
+        nonlocal calls
+        calls += 1
+        raise KeyError(key)
+
+    async def main() -> None:
+        for _ in range(3):
+            with pytest.raises(KeyError):
+                await lookup("a")
+        assert calls == 1
+        assert lookup.cache_info()["negative_hits"] == 2  # type: ignore[attr-defined]
+
+        assert lookup.invalidate("a")  # type: ignore[attr-defined]
+        with pytest.raises(KeyError):
+            await lookup("a")
+        assert calls == 2
+
+    asyncio.run(main())
+
+
+def test_async_memoize_does_not_cache_other_exceptions() -> None:
+    calls = 0
+
+    @async_memoize(negative_ttl=60.0, exceptions=(KeyError,))
+    async def flaky() -> int:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise ValueError
+        return calls
+
+    async def main() -> None:
+        with pytest.raises(ValueError):
+            await flaky()
+        assert await flaky() == 2
+        assert await flaky() == 2
+
+    asyncio.run(main())
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import threading
+
+from sjpy.decorator import Cache
+
+
+def test_cache_budgets_are_global_across_shards() -> None:
+    cache: Cache[int, int] = Cache(maxsize=None, max_bytes=1000, sizer=lambda v: 100)
+    for i in range(10):
+        cache.set(i, i)
+    assert len(cache) == 10
+
+    cache.set(10, 10)
+    assert len(cache) == 10
+    assert 0 not in cache and 10 in cache
+
+
+def test_cache_stores_value_larger_than_a_shard_share() -> None:
+    cache: Cache[str, bytes] = Cache(maxsize=None, max_bytes=1000, shards=8)
+    cache.set("big", b"x" * 900)
+    assert cache.get("big") == b"x" * 900
+
+
+def test_cache_evicts_least_recently_used_across_shards() -> None:
+    cache: Cache[int, int] = Cache(maxsize=10)
+    for i in range(10):
+        cache.set(i, i)
+    cache.get(0)
+    cache.set(10, 10)
+    assert 0 in cache and 1 not in cache
+
+
+def test_cache_drops_old_value_when_new_one_is_too_large() -> None:
+    cache: Cache[str, str] = Cache(maxsize=None, max_bytes=100, sizer=len)
+    cache.set("k", "old")
+    cache.set("k", "x" * 200)
+    assert "k" not in cache
+    assert cache.stats()["bytes"] == 0
+
+
+def test_cache_set_does_not_wait_for_a_running_eviction() -> None:
+    cache: Cache[int, int] = Cache(maxsize=2)
+
+    def fill() -> None:
+        for i in range(4):
+            cache.set(i, i)
+
+    with cache._evict_lock:
+        setter = threading.Thread(target=fill)
+        setter.start()
+        setter.join(1.0)
+        assert not setter.is_alive()
+        assert len(cache) == 4
+    cache.set(4, 4)
+    assert len(cache) == 2 and 3 in cache and 4 in cache
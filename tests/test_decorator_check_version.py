@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+import pytest
+
+from sjpy.decorator import clear_version_cache, requires_versions
+from sjpy.decorator.check_version import VersionRule, When
+
+module = importlib.import_module("sjpy.decorator.check_version")
+
+RULE: VersionRule = {"package_name": "numpy", "allowed": ">=1"}
+
+
+@pytest.fixture
+def checks(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    seen: list[str] = []
+    original = module.check_version
+
+    def counting(package_name: str, **kwargs: Any) -> None:
+        seen.append(package_name)
+        original(package_name, **kwargs)
+
+    monkeypatch.setattr(module, "check_version", counting)
+    return seen
+
+
+@pytest.mark.parametrize(("when", "expected"), [("first_call", 1), ("call", 3)])
+def test_requires_versions_checks_per_when(
+    checks: list[str], when: When, expected: int
+) -> None:
+    @requires_versions(RULE, when=when)
+    def f() -> int:
+        return 1
+
+    assert checks == []
+    assert [f(), f(), f()] == [1, 1, 1]
+    assert len(checks) == expected
+
+
+def test_requires_versions_at_decoration_leaves_target_unwrapped(
+    checks: list[str],
+) -> None:
+    def f() -> int:
+        return 1
+
+    assert requires_versions(RULE, when="decoration")(f) is f
+    assert checks == ["numpy"]
+
+
+def test_clear_version_cache_makes_first_call_targets_check_again(
+    checks: list[str],
+) -> None:
+    @requires_versions(RULE)
+    def f() -> None:
+        pass
+
+    @requires_versions(RULE)
+    class Model:
+        pass
+
+    f()
+    Model()
+    f()
+    Model()
+    assert len(checks) == 2
+
+    clear_version_cache()
+    f()
+    Model()
+    assert len(checks) == 4
+
+
+def test_requires_versions_rejects_blocked_version() -> None:
+    @requires_versions({"package_name": "numpy", "blocked": ">=0"})
+    def f() -> None:
+        pass
+
+    with pytest.raises(RuntimeError, match="blocked"):
+        f()
+    with pytest.raises(ValueError):
+        requires_versions(RULE, when="later")  # type: ignore[arg-type]
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import os
+import struct
+import time
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+
+from sjpy.decorator import disk_cache
+from sjpy.decorator.disk_cache import DiskCache, content_hash
+
+
+def _counted(directory: Path) -> int:
+    value: int = struct.unpack("<q", (directory / ".size").read_bytes())[0]
+    return value
+
+
+def test_disk_cache_size_counter_follows_overwrite_and_invalidate(
+    tmp_path: Path,
+) -> None:
+    cache = DiskCache(tmp_path, max_bytes=10**9)
+    cache.store("aa01", np.zeros(1000))
+    cache.store("aa01", np.zeros(10))
+    cache.store("aa02", {"x": 1})
+    cache.store("aa02", np.zeros(10))
+    assert _counted(tmp_path) == cache.stats()["bytes"]
+
+    assert cache.invalidate("aa01")
+    assert not cache.invalidate("aa01")
+    assert _counted(tmp_path) == cache.stats()["bytes"]
+
+
+def test_disk_cache_eviction_removes_stale_tmp_files(tmp_path: Path) -> None:
+    cache = DiskCache(tmp_path, max_bytes=100)
+    (tmp_path / "aa").mkdir()
+    stale, fresh = tmp_path / "aa" / ".tmp-stale.npy", tmp_path / "aa" / ".tmp-new"
+    stale.write_bytes(b"x")
+    fresh.write_bytes(b"x")
+    old = time.time() - 2 * 3600
+    os.utime(stale, (old, old))
+
+    cache.store("aa01", np.zeros(100))
+    assert not stale.exists() and fresh.exists()
+
+
+def test_disk_cache_miss_and_hit_return_read_only_arrays(tmp_path: Path) -> None:
+    @disk_cache(tmp_path)
+    def ones(n: int) -> npt.NDArray[np.float64]:
+        return np.ones(n)
+
+    miss, hit = ones(3), ones(3)
+    assert not miss.flags.writeable and not hit.flags.writeable
+    assert type(miss) is type(hit)
+
+
+def test_disk_cache_pickles_structured_arrays_with_object_fields(
+    tmp_path: Path,
+) -> None:
+    array = np.array([(1, "a")], dtype=[("x", "<i4"), ("y", object)])
+    cache = DiskCache(tmp_path)
+    cache.store("aa01", array)
+    found, value = cache.load("aa01")
+    assert found and value.tolist() == array.tolist()
+
+
+def test_content_hash_does_not_hash_object_pointers() -> None:
+    def array() -> npt.NDArray[np.void]:
+        return np.array([(1, "".join(["a", "b"]))], dtype=[("x", "<i4"), ("y", object)])
+
+    assert content_hash(array()) == content_hash(array())
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+from sjpy.decorator import lru_dict_cache
+
+
+def test_lru_dict_cache_does_not_keep_original_arguments() -> None:
+    @lru_dict_cache()
+    def total(values: list[int], weights: dict[str, int]) -> int:
+        return sum(values) + sum(weights.values())
+
+    values, weights = [1, 2, 3], {"a": 4}
+    before = sys.getrefcount(values), sys.getrefcount(weights)
+    assert total(values, weights=weights) == 10
+    assert (sys.getrefcount(values), sys.getrefcount(weights)) == before
+    assert total([1, 2, 3], weights={"a": 4}) == 10
+    assert total.cache_info().hits == 1  # type: ignore[attr-defined]
+
+
+def test_lru_dict_cache_keys_ignore_dict_order_but_not_container_type() -> None:
+    calls: list[Any] = []
+
+    @lru_dict_cache()
+    def echo(value: Any) -> Any:
+        calls.append(value)
+        return value
+
+    echo({"a": 1, "b": [1, {2}]})
+    echo({"b": [1, {2}], "a": 1})
+    echo((1, 2))
+    echo([1, 2])
+    assert len(calls) == 3
+
+
+def test_lru_dict_cache_identity_reuses_frozen_key_of_same_object() -> None:
+    calls = 0
+
+    @lru_dict_cache(identity=True)
+    def size(cfg: dict[str, Any]) -> int:
+        nonlocal calls
+        calls += 1
+        return len(cfg)
+
+    cfg: dict[str, Any] = {"layers": [{"dim": 512}] * 3}
+    assert size(cfg) == size(cfg) == size({"layers": [{"dim": 512}] * 3}) == 1
+    assert calls == 1
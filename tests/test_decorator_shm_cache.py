@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import pickle
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+
+from sjpy.decorator import SharedMemoryCache, shm_cache
+from sjpy.decorator.disk_cache import disk_cache
+
+
+def test_shm_cache_index_is_compacted_and_read_incrementally(tmp_path: Path) -> None:
+    with SharedMemoryCache(tmp_path / "index") as writer:
+        reader: SharedMemoryCache = pickle.loads(pickle.dumps(writer))
+        for i in range(1500):
+            writer.store(f"k{i}", i)
+            if i % 10:
+                assert writer.invalidate(f"k{i}")
+            assert reader.load(f"k{i}") == (i % 10 == 0, i if i % 10 == 0 else None)
+
+        lines = writer._index_path.read_bytes().count(b"\n")
+        assert lines <= 1024 + 1
+        assert reader.stats()["entries"] == writer.stats()["entries"] == 150
+
+
+def test_shm_cache_ignores_partial_record_of_a_dead_writer(tmp_path: Path) -> None:
+    with SharedMemoryCache(tmp_path / "index") as writer:
+        reader: SharedMemoryCache = pickle.loads(pickle.dumps(writer))
+        writer.store("a", 1)
+        with writer._index_path.open("ab") as f:
+            f.write(b'{"key": "dead"')
+        assert reader.load("a") == (True, 1)
+
+        writer.store("b", 2)
+        assert reader.load("b") == (True, 2)
+        assert reader.stats()["entries"] == 2
+
+
+def test_shm_cache_and_disk_cache_share_keys(tmp_path: Path) -> None:
+    with SharedMemoryCache(tmp_path / "index") as cache:
+
+        def f(x: int) -> npt.NDArray[np.int64]:
+            return np.arange(x)
+
+        shm_f = shm_cache(cache)(f)
+        disk_f = disk_cache(tmp_path / "disk")(f)
+        assert shm_f.cache_key(3) == disk_f.cache_key(3)  # type: ignore[attr-defined]
+
+
+def test_shm_cache_replaces_index_entry_whose_segment_is_gone(tmp_path: Path) -> None:
+    with SharedMemoryCache(tmp_path / "index") as cache:
+        cache.store("a", 1)
+        cache._unlink(cache._read_index()["a"]["name"])
+        reader: SharedMemoryCache = pickle.loads(pickle.dumps(cache))
+        assert reader.load("a") == (False, None)
+
+        assert cache.store("a", 2) == 2
+        assert reader.load("a") == (True, 2)
+
+
+def test_shm_cache_keeps_structured_dtype_fields(tmp_path: Path) -> None:
+    with SharedMemoryCache(tmp_path / "index") as cache:
+        array = np.zeros(3, dtype=[("x", "<i4"), ("y", "<f8", (2,))])
+        array["x"] = [1, 2, 3]
+        cache.store("a", array)
+        reader: SharedMemoryCache = pickle.loads(pickle.dumps(cache))
+        found, value = reader.load("a")
+        assert found and value.dtype == array.dtype
+        assert value["x"].tolist() == [1, 2, 3]
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Callable
+
+import pytest
+
+from sjpy.decorator import clear_singletons, singleton, singletons
+from sjpy.decorator.singleton import SingletonInfo
+
+
+def test_singleton_is_created_once_under_contention() -> None:
+    created = 0
+
+    @singleton(strict_mode=False)
+    class Model:
+        def __init__(self) -> None:
+            nonlocal created
+            created += 1
+            time.sleep(0.01)
+
+    barrier = threading.Barrier(8)
+    instances: list[Model] = []
+
+    def get() -> None:
+        barrier.wait()
+        instances.extend(Model() for _ in range(100))
+
+    threads = [threading.Thread(target=get) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert created == 1
+    assert len({id(i) for i in instances}) == 1
+
+
+def test_strict_singleton_rejects_different_arguments() -> None:
+    @singleton
+    class Model:
+        def __init__(self, name: str, beam: int = 5) -> None:
+            self.name = name
+
+    first = Model("base", beam=5)
+    assert Model("base", beam=5) is first
+    with pytest.raises(ValueError):
+        Model("large")
+
+
+def _in_child(check: Callable[[], bool]) -> bool:
+    pid = os.fork()
+    if pid == 0:
+        os._exit(0 if check() else 1)
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status) == 0
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+def test_reset_on_fork_creates_a_new_instance_in_the_child() -> None:
+    @singleton(strict_mode=False, reset_on_fork=True)
+    class Handle:
+        def __init__(self) -> None:
+            self.pid = os.getpid()
+
+    @singleton(strict_mode=False)
+    class Shared:
+        def __init__(self) -> None:
+            self.pid = os.getpid()
+
+    parent = os.getpid()
+    assert Handle().pid == Shared().pid == parent
+    assert _in_child(lambda: Handle().pid == os.getpid() and Shared().pid == parent)
+    assert Handle().pid == parent
+    clear_singletons(Handle, Shared)
+
+
+def test_clear_singletons_and_introspection() -> None:
+    created = 0
+
+    @singleton
+    class Model:
+        def __init__(self, name: str) -> None:
+            nonlocal created
+            created += 1
+
+    def info() -> SingletonInfo:
+        return next(i for i in singletons() if i["cls"] is Model)
+
+    assert not info()["instantiated"]
+    first = Model("a")
+    record = info()
+    assert record["instantiated"] and record["strict"]
+    assert record["pid"] == os.getpid() and record["init_seconds"] is not None
+
+    assert clear_singletons(Model) == 1
+    assert clear_singletons(Model) == 0
+    assert not info()["instantiated"]
+    # strict 모드도 지운 뒤에는 다른 인자로 새로 만들 수 있다
+    assert Model("b") is not first
+    assert created == 2
+    with pytest.raises(TypeError):
+        clear_singletons(int)
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import warnings
+
+import numpy as np
+import pytest
+
+from sjpy.evaluator.asr import TimeEvaluator
+
+
+def _evaluator(L: float) -> TimeEvaluator:  # pyright: ignore[reportDeprecated]
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        return TimeEvaluator(L)  # pyright: ignore[reportDeprecated]
+
+
+def test_time_evaluator_coverages_are_read_only() -> None:
+    evaluator = _evaluator(10.0)
+    evaluator.add_coverage(np.array([1.0, 2.0, 3.0]))
+    with pytest.raises(ValueError):
+        evaluator.coverages[0] = 5.0
+    assert evaluator.get_avg_proportion() == pytest.approx(6.0 / 30.0)
+
+
+def test_time_evaluator_follows_changes_to_L() -> None:
+    evaluator = _evaluator(10.0)
+    evaluator.add_coverage(np.array([1.0, 2.0, 3.0]))
+    evaluator.L = 20.0
+    assert evaluator.get_avg_proportion() == pytest.approx(6.0 / 60.0)
+    evaluator.L = 2.0
+    with pytest.raises(ValueError):
+        evaluator.get_avg_lagging()
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from sjpy.evaluator.corpus import evaluate_corpus
+from sjpy.evaluator.latency_scorer import AL_score
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_evaluate_corpus_writes_results_in_input_order(
+    tmp_path: Path, workers: int
+) -> None:
+    records = [([float(i), i + 1.0, i + 2.0], 3 + i % 4, None) for i in range(50)]
+    output = tmp_path / "results.jsonl"
+    summary = evaluate_corpus(
+        records, output, workers=workers, chunk_size=4, verbose=False
+    )
+
+    lines = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [line["AL"] for line in lines] == pytest.approx(
+        [AL_score(d, s) for d, s, _ in records]
+    )
+    assert summary["AL"]["n"] == len(records)
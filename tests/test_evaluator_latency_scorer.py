@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from sjpy.evaluator.latency_scorer import (
+    AL_score,
+    AL_score_batch,
+    AP_score,
+    AP_score_batch,
+    DAL_score,
+    DAL_score_batch,
+    LAAL_score,
+    LAAL_score_batch,
+    StreamingLatencyScorer,
+    average_latency,
+    average_latency_batch,
+    pack_delays,
+)
+
+
+def _sentences(seed: int) -> tuple[list[list[float]], list[int], list[int]]:
+    rng = np.random.default_rng(seed)
+    delays = [
+        np.cumsum(rng.uniform(0.0, 2.0, rng.integers(1, 12))).tolist()
+        for _ in range(50)
+    ]
+    sources = rng.integers(1, 15, len(delays)).tolist()
+    targets = [len(d) + int(rng.integers(-1, 3)) or 1 for d in delays]
+    return delays, sources, targets
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_batch_scorers_match_scalar_scorers(seed: int) -> None:
+    delays, sources, targets = _sentences(seed)
+    flat, offsets = pack_delays(delays)
+    rows = list(zip(delays, sources, targets))
+
+    np.testing.assert_allclose(
+        AL_score_batch(flat, offsets, sources),
+        [AL_score(d, s) for d, s, _ in rows],
+    )
+    np.testing.assert_allclose(
+        AL_score_batch(flat, offsets, sources, targets),
+        [AL_score(d, s, t) for d, s, t in rows],
+    )
+    np.testing.assert_allclose(
+        LAAL_score_batch(flat, offsets, sources, targets),
+        [LAAL_score(d, s, t) for d, s, t in rows],
+    )
+    np.testing.assert_allclose(
+        DAL_score_batch(flat, offsets, sources),
+        [DAL_score(d, s) for d, s, _ in rows],
+    )
+    np.testing.assert_allclose(
+        AP_score_batch(flat, offsets, sources, targets),
+        [AP_score(d, s, t) for d, s, t in rows],
+    )
+    np.testing.assert_allclose(
+        average_latency_batch(flat, offsets), [average_latency(d) for d in delays]
+    )
+
+
+def test_batch_scorers_reject_empty_sentences() -> None:
+    flat, offsets = pack_delays([[1.0], []])
+    with pytest.raises(ValueError):
+        AL_score_batch(flat, offsets, 4)
+
+
+@pytest.mark.parametrize("known_length", [False, True])
+def test_streaming_scorer_matches_offline_scorers(known_length: bool) -> None:
+    delays, sources, _ = _sentences(3)
+    for sentence, source in zip(delays, sources):
+        target = len(sentence) if known_length else None
+        scorer = StreamingLatencyScorer(source, target)
+        assert scorer.scores() == {"AL": None, "LAAL": None, "DAL": None, "AP": None}
+        for count in range(1, len(sentence) + 1):
+            scorer.update(sentence[count - 1])
+            prefix = sentence[:count]
+            scores = scorer.scores()
+            assert scores["AL"] == pytest.approx(AL_score(prefix, source, target))
+            assert scores["LAAL"] == pytest.approx(LAAL_score(prefix, source, target))
+            assert scores["AP"] == pytest.approx(AP_score(prefix, source, target))
+        assert scorer.DAL() == pytest.approx(DAL_score(sentence, source))
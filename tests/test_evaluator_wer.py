@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+import pytest
+
+from sjpy.evaluator.wer import (
+    _align_rows,
+    align,
+    corpus_error_rate,
+    edit_distance,
+    tokens_to_ids,
+    word_error_rate,
+)
+
+
+def _naive(ref: Sequence[int], hyp: Sequence[int]) -> tuple[int, int]:
+    # (비용, -일치 수) 를 사전순으로 최소화하는 교과서 DP
+    n, m = len(ref), len(hyp)
+    table = [[(j, 0) for j in range(m + 1)]]
+    for i in range(1, n + 1):
+        row = [(i, 0)]
+        for j in range(1, m + 1):
+            cost, neg_hits = table[i - 1][j - 1]
+            match = ref[i - 1] == hyp[j - 1]
+            diag = (cost + (not match), neg_hits - match)
+            up = (table[i - 1][j][0] + 1, table[i - 1][j][1])
+            left = (row[j - 1][0] + 1, row[j - 1][1])
+            row.append(min(diag, up, left))
+        table.append(row)
+    cost, neg_hits = table[n][m]
+    return cost, -neg_hits
+
+
+def _pairs(seed: int) -> list[tuple[list[int], list[int]]]:
+    rng = np.random.default_rng(seed)
+    return [
+        (
+            rng.integers(0, 4, rng.integers(0, 15)).tolist(),
+            rng.integers(0, 4, rng.integers(0, 15)).tolist(),
+        )
+        for _ in range(200)
+    ]
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_edit_distance_and_alignment_match_naive_dp(seed: int) -> None:
+    for ref, hyp in _pairs(seed):
+        cost, hits = _naive(ref, hyp)
+        assert edit_distance(ref, hyp) == cost
+        assert _align_rows(*tokens_to_ids(ref, hyp)) == (cost, hits)
+
+        counts = align(ref, hyp)
+        assert counts["hits"] == hits
+        assert (
+            counts["substitutions"] + counts["deletions"] + counts["insertions"] == cost
+        )
+
+
+def test_word_error_rate_counts() -> None:
+    result = word_error_rate("the cat sat on the mat", "the cat sit on mat now")
+    assert result["hits"] == 4
+    errors = result["substitutions"], result["deletions"], result["insertions"]
+    assert errors == (1, 1, 1)
+    assert result["error_rate"] == pytest.approx(3 / 6)
+
+
+def test_corpus_error_rate_sums_counts() -> None:
+    refs, hyps = ["a b c", "d e"], ["a c", "d e f"]
+    total = corpus_error_rate(refs, hyps, workers=0)
+    assert total["ref_length"] == 5
+    assert total["error_rate"] == pytest.approx(2 / 5)
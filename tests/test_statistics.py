@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import warnings
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from sjpy.statistics import (
+    DistributionSummary,
+    ParallelBackend,
+    StreamingHistogram,
+    StreamingSummary,
+    compute_moments,
+    empty_moments,
+    merge_moments,
+    summarize_distribution,
+    summarize_distribution_grouped,
+    summarize_distribution_parallel,
+)
+
+
+def test_fixed_histogram_with_only_out_of_range_values() -> None:
+    histogram = StreamingHistogram.linear(0.0, 1.0, 4)
+    summary = StreamingSummary(histogram=histogram)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        summary.add([5.0, 6.0, -1.0])
+        result = summary.summary()
+
+    assert result["n"] == 3
+    assert result["histogram"]["bin_probs"] == [0.0] * 4
+    assert histogram.summary()["bin_probs"] == [0.0] * 4
+
+
+def test_fixed_histogram_summary_matches_streaming_histogram() -> None:
+    histogram = StreamingHistogram.linear(0.0, 1.0, 4)
+    summary = StreamingSummary(histogram=histogram)
+    summary.add([0.1, 0.2, 0.6, 0.9, 2.0])
+    assert summary.summary()["histogram"] == histogram.summary()
+
+
+def test_parallel_summary_is_reproducible() -> None:
+    array = np.random.default_rng(0).normal(size=50_000)
+    first, second = (
+        summarize_distribution_parallel(array, workers=2, chunk_size=4096)
+        for _ in range(2)
+    )
+    assert first == second
+
+
+_EXACT = ("n", "mean", "std", "min", "max", "skew", "kurtosis")
+
+
+def _assert_exact_fields(
+    result: DistributionSummary, expected: DistributionSummary
+) -> None:
+    for field in _EXACT:
+        assert result[field] == pytest.approx(expected[field]), field  # type: ignore[literal-required]
+
+
+def test_merge_moments_matches_whole_array() -> None:
+    rng = np.random.default_rng(1)
+    parts = [rng.gamma(2.0, size=size) for size in (1, 7, 1000, 0, 50)]
+    merged = empty_moments()
+    for part in parts:
+        merged = merge_moments(merged, compute_moments(part))
+    whole = compute_moments(np.concatenate(parts))
+    assert merged["n"] == whole["n"]
+    for key in ("mean", "m2", "m3", "m4"):
+        assert merged[key] == pytest.approx(whole[key])
+
+
+def test_streaming_summary_merge_matches_summarize_distribution() -> None:
+    data = np.random.default_rng(2).normal(size=20_000)
+    left, right = StreamingSummary(seed=0), StreamingSummary(seed=1)
+    for chunk in np.array_split(data[:12_000], 5):
+        left.add(chunk)
+    right.add(data[12_000:])
+    left.merge(right)
+
+    result, expected = left.summary(), summarize_distribution(data)
+    _assert_exact_fields(result, expected)
+    for q in ("q1", "q2", "q3"):
+        assert result[q] == pytest.approx(expected[q], abs=0.05)
+    assert sum(result["histogram"]["bin_probs"]) == pytest.approx(1.0)
+
+
+def test_chunked_summary_matches_single_pass() -> None:
+    data = np.random.default_rng(3).exponential(size=30_000).astype(np.float32)
+    expected = summarize_distribution(data)
+    result = summarize_distribution(data, chunk_size=4096)
+    _assert_exact_fields(result, expected)
+    assert result["histogram"]["bin_probs"] == pytest.approx(
+        expected["histogram"]["bin_probs"]
+    )
+    assert result["q2"] == pytest.approx(expected["q2"], rel=0.05)
+
+
+def test_summarize_distribution_quartiles_and_empty_input() -> None:
+    result = summarize_distribution([1, 2, 3, 4, 5])
+    assert (result["q1"], result["q2"], result["q3"]) == (2.0, 3.0, 4.0)
+    assert result["iqr"] == 2.0
+    assert summarize_distribution([])["n"] == 0
+
+
+@pytest.mark.parametrize("backend", ["thread", "process"])
+def test_parallel_summary_matches_whole_array(
+    tmp_path: Path, backend: ParallelBackend
+) -> None:
+    data = np.random.default_rng(4).normal(size=40_000)
+    path = tmp_path / "data.npy"
+    np.save(path, data)
+    result = summarize_distribution_parallel(
+        path, workers=2, chunk_size=5000, backend=backend
+    )
+    expected = summarize_distribution(data)
+    _assert_exact_fields(result, expected)
+    assert result["histogram"]["bin_probs"] == pytest.approx(
+        expected["histogram"]["bin_probs"]
+    )
+    assert result["q2"] == pytest.approx(expected["q2"], abs=0.05)
+
+
+def test_grouped_summary_matches_per_group_summaries() -> None:
+    rng = np.random.default_rng(5)
+    groups = rng.integers(-2, 6, 3000)
+    values = rng.normal(groups, 1.0)
+    result = summarize_distribution_grouped(values, groups)
+
+    assert list(result) == sorted(set(groups.tolist()))
+    for key, summary in result.items():
+        expected = summarize_distribution(values[groups == key])
+        _assert_exact_fields(summary, expected)
+        for q in ("q1", "q2", "q3"):
+            assert summary[q] == pytest.approx(expected[q])
+        assert summary["histogram"]["bin_probs"] == pytest.approx(
+            expected["histogram"]["bin_probs"]
+        )
+
+
+def test_grouped_summary_integer_weights_act_as_repetitions() -> None:
+    rng = np.random.default_rng(6)
+    groups = rng.integers(0, 3, 500)
+    values = rng.normal(size=500)
+    weights = rng.integers(1, 4, 500)
+    result = summarize_distribution_grouped(values, groups, weights)
+
+    for key, summary in result.items():
+        mask = groups == key
+        expected = summarize_distribution(np.repeat(values[mask], weights[mask]))
+        assert summary["n"] == int(mask.sum())
+        for field in ("mean", "std", "min", "max", "skew", "kurtosis"):
+            assert summary[field] == pytest.approx(expected[field])